@@ -0,0 +1,3 @@
+"""
+Archivo __init__.py para el paquete de benchmarks
+"""
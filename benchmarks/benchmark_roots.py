@@ -0,0 +1,303 @@
+"""
+Benchmark de Búsqueda de Raíces
+===============================
+
+Mide find_roots frente a numpy.roots y numpy.polynomial.Polynomial.roots
+sobre familias de polinomios de grado 3 a 500:
+
+- "random":    coeficientes gaussianos (pocas raíces reales)
+- "chebyshev": T_n en [-1, 1] (todas las raíces reales, agrupadas en ±1)
+- "wilkinson": raíces k/n, k = 1..n (Wilkinson reescalado a [0, 1])
+- "clustered": cúmulos de raíces separadas 1e-3
+- "mignotte":  x^n - 2(a x - 1)^2 (dos raíces reales muy próximas a 1/a)
+
+Para cada caso se registran los tiempos, las subdivisiones y pasos de
+Newton, el número de raíces y el error frente a las raíces exactas. Los
+resultados se guardan en JSON y el modo de comparación señala las
+regresiones entre dos ficheros de resultados.
+
+Uso:
+    python benchmarks/benchmark_roots.py --output results.json
+    python benchmarks/benchmark_roots.py --families chebyshev --degrees 10 50
+    python benchmarks/benchmark_roots.py --compare base.json new.json
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from numpy.polynomial import Polynomial
+from numpy.polynomial import polynomial as P
+from src.newton_bernstein import NewtonBernstein
+from src.utils import root_bound
+
+
+# Grados del barrido por defecto
+DEFAULT_DEGREES = (3, 5, 10, 20, 50, 100, 200, 500)
+
+# Parte imaginaria por debajo de la cual una raíz de numpy es real
+IMAG_TOL = 1e-7
+
+# Umbrales del modo de comparación: razón de tiempos y de errores
+TIME_REGRESSION = 1.25
+ERROR_REGRESSION = 10.0
+
+# Parámetro a del polinomio de Mignotte
+MIGNOTTE_A = 10
+
+
+def random_family(degree, seed=0):
+    """
+    Coeficientes gaussianos; el intervalo es [-B, B] con la cota de raíces.
+    """
+    coeffs = np.random.default_rng(seed + degree).standard_normal(degree + 1)
+    bound = root_bound(coeffs)
+    return coeffs, (-bound, bound), None
+
+
+def chebyshev_family(degree):
+    """
+    Polinomio de Chebyshev T_n en [-1, 1].
+    """
+    coeffs = np.polynomial.chebyshev.cheb2poly([0] * degree + [1])
+    roots = np.cos((2 * np.arange(degree) + 1) * np.pi / (2 * degree))
+    return coeffs, (-1.0, 1.0), np.sort(roots)
+
+
+def wilkinson_family(degree):
+    """
+    Polinomio de Wilkinson reescalado, raíces k/n en [0, 1].
+    """
+    roots = np.arange(1, degree + 1) / degree
+    return P.polyfromroots(roots), (0.0, 1.0 + 0.5 / degree), roots
+
+
+def clustered_family(degree, spread=1e-3):
+    """
+    Cúmulos de tres raíces (o menos en el último) repartidos en [-1, 1].
+    """
+    size = 3
+    centers = np.linspace(-0.9, 0.9, -(-degree // size))
+    roots = np.sort(np.concatenate([c + spread * np.arange(size) for c in centers])[:degree])
+    return P.polyfromroots(roots), (-1.0, 1.0), roots
+
+
+def mignotte_family(degree, a=MIGNOTTE_A):
+    """
+    Polinomio de Mignotte x^n - 2(a x - 1)^2 en [-1, 1].
+    
+    Sus dos raíces reales cercanas a 1/a están separadas por menos de
+    a^(-(n+2)/2); las raíces exactas no se conocen en forma cerrada.
+    """
+    coeffs = np.zeros(max(degree, 3) + 1)
+    coeffs[:3] = -2 * np.array([1.0, -2.0 * a, a * a])
+    coeffs[-1] += 1.0
+    return coeffs, (-1.0, 1.0), None
+
+
+FAMILIES = {
+    "random": random_family,
+    "chebyshev": chebyshev_family,
+    "wilkinson": wilkinson_family,
+    "clustered": clustered_family,
+    "mignotte": mignotte_family,
+}
+
+
+def best_time(function, repeats):
+    """
+    Mejor tiempo de varias ejecuciones y el resultado de la última.
+    """
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def real_roots_in(roots, interval):
+    """
+    Raíces reales ordenadas de numpy dentro del intervalo.
+    """
+    roots = np.asarray(roots)
+    real = roots[np.abs(roots.imag) < IMAG_TOL].real
+    return np.sort(real[(real >= interval[0]) & (real <= interval[1])])
+
+
+def max_error(roots, reference):
+    """
+    Distancia máxima de cada raíz de referencia a la raíz encontrada más
+    cercana (None si no hay raíces con las que comparar).
+    """
+    if len(reference) == 0:
+        return 0.0 if len(roots) == 0 else None
+    if len(roots) == 0:
+        return None
+    roots = np.asarray(roots)
+    return float(max(np.min(np.abs(roots - r)) for r in reference))
+
+
+def run_case(family, degree, repeats=3, tolerance=1e-10):
+    """
+    Ejecuta un caso del benchmark.
+    
+    Returns:
+        Diccionario con tiempos, estadísticas del solver y errores
+    """
+    coeffs, interval, exact = FAMILIES[family](degree)
+    
+    with np.errstate(all='ignore'):
+        solver = NewtonBernstein(coeffs, tolerance=tolerance)
+        nb_time, roots = best_time(lambda: solver.find_roots(interval), repeats)
+        numpy_time, numpy_roots = best_time(lambda: np.roots(coeffs[::-1]), repeats)
+        poly_time, _ = best_time(lambda: Polynomial(coeffs).roots(), repeats)
+    
+    numpy_real = real_roots_in(numpy_roots, interval)
+    stats = solver.get_statistics()
+    return {
+        "family": family,
+        "degree": degree,
+        "interval": [float(interval[0]), float(interval[1])],
+        "time_nb": nb_time,
+        "time_numpy_roots": numpy_time,
+        "time_polynomial_roots": poly_time,
+        "num_subdivisions": stats['num_subdivisions'],
+        "num_newton_steps": stats['num_newton_steps'],
+        "num_roots": len(roots),
+        "num_roots_numpy": len(numpy_real),
+        "num_roots_exact": None if exact is None else len(exact),
+        "error_nb": None if exact is None else max_error(roots, exact),
+        "error_numpy": None if exact is None else max_error(numpy_real, exact),
+    }
+
+
+def run_benchmark(families=tuple(FAMILIES), degrees=DEFAULT_DEGREES,
+                  repeats=3, verbose=True):
+    """
+    Ejecuta el barrido completo.
+    
+    Returns:
+        Diccionario con metadatos y la lista de resultados
+    """
+    results = []
+    if verbose:
+        print(f"{'Familia':<10} {'Grado':>5} {'NB (ms)':>9} {'roots (ms)':>11} "
+              f"{'Poly (ms)':>10} {'Subdiv.':>8} {'Newton':>7} {'Raíces':>7} "
+              f"{'Error NB':>10} {'Error np':>10}")
+        print("-" * 98)
+    
+    for family in families:
+        for degree in degrees:
+            case = run_case(family, degree, repeats)
+            results.append(case)
+            if verbose:
+                print(f"{family:<10} {degree:>5} {case['time_nb'] * 1e3:>9.2f} "
+                      f"{case['time_numpy_roots'] * 1e3:>11.2f} "
+                      f"{case['time_polynomial_roots'] * 1e3:>10.2f} "
+                      f"{case['num_subdivisions']:>8} {case['num_newton_steps']:>7} "
+                      f"{case['num_roots']:>7} {_format_error(case['error_nb']):>10} "
+                      f"{_format_error(case['error_numpy']):>10}")
+    
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, time_ratio=TIME_REGRESSION,
+                    error_ratio=ERROR_REGRESSION):
+    """
+    Compara dos ejecuciones y devuelve las regresiones.
+    
+    Un caso (familia, grado) presente en ambas es una regresión si el
+    tiempo de find_roots crece más de time_ratio, si encuentra menos
+    raíces o si su error crece más de error_ratio.
+    
+    Args:
+        baseline: Resultados de referencia (salida de run_benchmark)
+        current: Resultados nuevos
+        time_ratio: Razón de tiempos tolerada
+        error_ratio: Razón de errores tolerada
+        
+    Returns:
+        Lista de cadenas que describen cada regresión
+    """
+    reference = {(r["family"], r["degree"]): r for r in baseline["results"]}
+    regressions = []
+    
+    for case in current["results"]:
+        key = (case["family"], case["degree"])
+        old = reference.get(key)
+        if old is None:
+            continue
+        label = f"{key[0]} n={key[1]}"
+        
+        if case["time_nb"] > time_ratio * old["time_nb"]:
+            regressions.append(f"{label}: tiempo {old['time_nb'] * 1e3:.2f}ms -> "
+                               f"{case['time_nb'] * 1e3:.2f}ms")
+        if case["num_roots"] < old["num_roots"]:
+            regressions.append(f"{label}: raíces {old['num_roots']} -> {case['num_roots']}")
+        if old["error_nb"] is not None and (
+                case["error_nb"] is None or
+                case["error_nb"] > error_ratio * max(old["error_nb"], np.finfo(float).eps)):
+            regressions.append(f"{label}: error {_format_error(old['error_nb'])} -> "
+                               f"{_format_error(case['error_nb'])}")
+    
+    return regressions
+
+
+def _format_error(error):
+    return "-" if error is None else f"{error:.2e}"
+
+
+def main(argv=None):
+    """
+    Punto de entrada de la línea de órdenes.
+    
+    Returns:
+        Código de salida: 1 si la comparación encuentra regresiones
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de búsqueda de raíces")
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES),
+                        default=list(FAMILIES))
+    parser.add_argument("--degrees", nargs="+", type=int, default=list(DEFAULT_DEGREES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="Fichero JSON de resultados")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"),
+                        help="Compara dos ficheros de resultados")
+    parser.add_argument("--time-ratio", type=float, default=TIME_REGRESSION)
+    args = parser.parse_args(argv)
+    
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare_results(baseline, current, time_ratio=args.time_ratio)
+        for line in regressions:
+            print(f"REGRESIÓN  {line}")
+        print(f"{len(regressions)} regresiones")
+        return 1 if regressions else 0
+    
+    report = run_benchmark(args.families, args.degrees, args.repeats)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -161,11 +161,14 @@ def example2_quintic_polynomial():
     print("NOTA SOBRE RAÍCES MÚLTIPLES")
     print("-" * 70)
     print("La raíz x = 0.5 tiene multiplicidad 2.")
-    print("El algoritmo puede encontrarla una o dos veces dependiendo de la")
-    print("subdivisión y los criterios de fusión de raíces cercanas.")
-    print("En la práctica, las raíces múltiples presentan desafíos debido a que")
-    print("la derivada también se anula en ese punto, afectando la convergencia")
-    print("del método de Newton.")
+    print("Como la derivada también se anula en ese punto, Newton converge")
+    print("lentamente y la bisección tendría que descender hasta la tolerancia.")
+    print("El algoritmo detecta el cúmulo (p'' de signo constante y p nula")
+    print("en la raíz de p') y lo acepta sin seguir subdividiendo:")
+    print()
+    for root, multiplicity in solver.find_roots_with_multiplicity(interval):
+        print(f"  x = {format_root(root, 12)}   multiplicidad detectada: {multiplicity}")
+    print(f"  Cúmulos detectados: {solver.get_statistics()['num_clusters']}")
     print()
     
     return roots, stats, coeffs
@@ -0,0 +1,106 @@
+"""
+Ejemplo 3: Comparación de Estrategias de Reducción de Intervalos
+================================================================
+
+Compara las tres estrategias disponibles en NewtonBernstein:
+
+- "bisect":   bisección de De Casteljau y refinamiento por Newton
+- "clip":     recorte de Bézier (envolvente convexa de los puntos de control)
+- "quadclip": recorte cuadrático (ajuste cuadrático con cota de error)
+
+sobre los polinomios de los ejemplos 1 y 2 y sobre casos de grado alto
+con raíces conocidas.
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from src.newton_bernstein import NewtonBernstein, STRATEGIES
+from examples.example2_quintic import expand_polynomial
+
+
+def stress_cases():
+    """
+    Devuelve los casos de prueba como lista de (nombre, coeficientes,
+    intervalo, raíces exactas).
+    """
+    cases = [
+        ("Cúbico (ej. 1)", np.array([-6.0, 11.0, -6.0, 1.0]), (0, 4),
+         [1.0, 2.0, 3.0]),
+        ("Quíntico (ej. 2)", expand_polynomial(), (-2, 5),
+         [-1.0, 0.5, 2.0, 3.5]),
+    ]
+    
+    for degree in (10, 20, 30):
+        roots = np.cos((2 * np.arange(degree) + 1) * np.pi / (2 * degree))
+        coeffs = np.polynomial.chebyshev.cheb2poly([0] * degree + [1])
+        cases.append((f"Chebyshev T_{degree}", coeffs, (-1, 1),
+                      sorted(roots)))
+    
+    return cases
+
+
+def run_strategy(coeffs, interval, strategy, repeats=5):
+    """
+    Ejecuta el solver con una estrategia y mide el mejor tiempo.
+    
+    Returns:
+        Tupla (raíces, estadísticas, tiempo en ms)
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        solver = NewtonBernstein(coeffs, tolerance=1e-10, strategy=strategy)
+        start = time.perf_counter()
+        roots = solver.find_roots(interval)
+        best = min(best, time.perf_counter() - start)
+    return roots, solver.get_statistics(), best * 1e3
+
+
+def example3_strategies():
+    """
+    Compara bisección, recorte de Bézier y recorte cuadrático.
+    """
+    print("=" * 70)
+    print("EJEMPLO 3: Comparación de Estrategias")
+    print("=" * 70)
+    print()
+    
+    results = {}
+    header = (f"{'Estrategia':<10} {'Raíces':>7} {'Subdiv.':>8} {'Recortes':>9} "
+              f"{'Newton':>7} {'Tiempo':>10} {'Error máx.':>11}")
+    
+    for name, coeffs, interval, exact in stress_cases():
+        print("-" * 70)
+        print(f"{name}   intervalo [{interval[0]}, {interval[1]}]   "
+              f"raíces distintas: {len(exact)}")
+        print("-" * 70)
+        print(header)
+        
+        for strategy in STRATEGIES:
+            roots, stats, elapsed = run_strategy(coeffs, interval, strategy)
+            error = max((min(abs(r - e) for e in exact) for r in roots),
+                        default=float('nan'))
+            print(f"{strategy:<10} {len(roots):>7} {stats['num_subdivisions']:>8} "
+                  f"{stats['num_clips']:>9} {stats['num_newton_steps']:>7} "
+                  f"{elapsed:>8.2f}ms {error:>11.2e}")
+            results[(name, strategy)] = (roots, stats, elapsed)
+        print()
+    
+    print("-" * 70)
+    print("NOTA")
+    print("-" * 70)
+    print("El recorte converge cuadráticamente (Bézier) o cúbicamente")
+    print("(cuadrático) en raíces simples, pero solo linealmente en raíces")
+    print("múltiples, donde puede devolver varias aproximaciones del cúmulo")
+    print("o, si la multiplicidad es par, perder la raíz: el polinomio no")
+    print("cambia de signo y el redondeo deja la envolvente a un lado del eje.")
+    print()
+    
+    return results
+
+
+if __name__ == "__main__":
+    example3_strategies()
@@ -3,13 +3,35 @@ from scipy.special import comb
 from typing import Tuple, Dict, Union
 
 
+def check_distinct_nodes(x: np.ndarray) -> None:
+    order = np.argsort(x, kind='stable')
+    repeated = np.flatnonzero(np.diff(x[order]) == 0)
+    if len(repeated) > 0:
+        i, j = sorted((order[repeated[0]], order[repeated[0] + 1]))
+        raise ValueError(f"Nodos duplicados detectados: x[{i}] = x[{j}]")
+
+
+def newton_coeffs(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    # Fila superior f[x_0, ..., x_k] con memoria O(n), columna a columna;
+    # f de tamaño (n+1, m) procesa m vectores de datos a la vez
+    x = np.asarray(x, dtype=float)
+    check_distinct_nodes(x)
+    d = np.array(f, dtype=float)
+    col = (slice(None),) + (np.newaxis,) * (d.ndim - 1)
+    for s in range(1, len(x)):
+        d[s:] = (d[s:] - d[s-1:-1]) / (x[s:] - x[:-s])[col]
+    return d
+
+
 def divided_diffs(x: np.ndarray, f: np.ndarray) -> np.ndarray:
+    # Tabla completa O(n^2), solo cuando se pide explícitamente
+    x = np.asarray(x, dtype=float)
+    check_distinct_nodes(x)
     n = len(x)
     dd = np.zeros((n, n))
     dd[:, 0] = f
     for s in range(1, n):
-        for k in range(n - s):
-            dd[k, s] = (dd[k+1, s-1] - dd[k, s-1]) / (x[k+s] - x[k])
+        dd[:n-s, s] = (dd[1:n-s+1, s-1] - dd[:n-s, s-1]) / (x[s:] - x[:n-s])
     return dd
 
 
@@ -23,28 +45,56 @@ def bernstein_poly_eval(x: Union[float, np.ndarray], c: np.ndarray) -> np.ndarra
     return result
 
 
-def newton_bernstein(x: np.ndarray, f: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict]:
+def degree_raising(x: np.ndarray, top: np.ndarray) -> np.ndarray:
+    # Recurrencia de elevación de grado sobre búferes de ida y vuelta;
+    # top de tamaño (n+1,) o (n+1, m). Los w solo dependen de los nodos
+    # y se calculan una vez para todas las columnas
     n = len(x) - 1
-    dd = divided_diffs(x, f)
-    
-    c = np.zeros(n + 1)
-    c[0] = dd[0, 0]
-    w = np.zeros(n + 1)
+    col = (slice(None),) + (np.newaxis,) * (top.ndim - 1)
+    c, c_next = np.zeros(top.shape), np.zeros(top.shape)
+    w, w_next = np.zeros(n + 1), np.zeros(n + 1)
+    c[0] = top[0]
     w[0] = 1.0
+    steps = np.arange(1, n + 1, dtype=float)
+    ratio, comp, tmp = np.empty(n), np.empty(n), np.empty(n)
+    c_tmp = np.empty(top.shape)
     
     for k in range(1, n + 1):
-        w_new = np.zeros(n + 1)
-        c_new = np.zeros(n + 1)
+        r, q, t, ct = ratio[:k], comp[:k], tmp[:k], c_tmp[:k]
+        np.divide(steps[:k], k, out=r)
+        np.subtract(k, steps[:k], out=q)
+        q /= k
         
-        for j in range(1, k + 1):
-            w_new[j] = (j/k)*w[j-1]*(1-x[k-1]) - ((k-j)/k)*w[j]*x[k-1]
+        np.multiply(r, w[:k], out=w_next[1:k+1])
+        w_next[1:k+1] *= 1 - x[k-1]
+        np.multiply(q, w[1:k+1], out=t)
+        t *= x[k-1]
+        w_next[1:k+1] -= t
+        w_next[0] = -w[0] * x[k-1]
         
-        c_new[0] = c[0]
-        for j in range(1, k + 1):
-            c_new[j] = ((j/k)*c[j-1] + ((k-j)/k)*c[j]) + w_new[j]*dd[0, k]
+        np.multiply(r[col], c[:k], out=c_next[1:k+1])
+        np.multiply(q[col], c[1:k+1], out=ct)
+        c_next[1:k+1] += ct
+        np.multiply(w_next[1:k+1][col], top[k], out=ct)
+        c_next[1:k+1] += ct
+        c_next[0] = c[0] + w_next[0] * top[k]
         
-        w = w_new
-        c = c_new
+        c, c_next = c_next, c
+        w, w_next = w_next, w
+    
+    return c
+
+
+def newton_bernstein(x: np.ndarray, f: np.ndarray,
+                     full_table: bool = True) -> Tuple[np.ndarray, np.ndarray, Dict]:
+    # full_table=False evita la tabla O(n^2): dd es entonces la fila
+    # superior y info no incluye las métricas de la tabla
+    dd = divided_diffs(x, f) if full_table else None
+    top = dd[0] if full_table else newton_coeffs(x, f)
+    c = degree_raising(x, top)
+    
+    if not full_table:
+        return c, top, {'control_norm': np.linalg.norm(c)}
     
     return c, dd, {
         'condition_number': np.linalg.cond(dd),
@@ -53,6 +103,15 @@ def newton_bernstein(x: np.ndarray, f: np.ndarray) -> Tuple[np.ndarray, np.ndarr
     }
 
 
+def newton_bernstein_batch(x: np.ndarray, F: np.ndarray) -> np.ndarray:
+    # Interpolación de m vectores de datos (columnas de F, tamaño (n+1, m))
+    # sobre los mismos nodos; devuelve los puntos de control (n+1, m)
+    F = np.asarray(F, dtype=float)
+    if F.ndim != 2 or F.shape[0] != len(x):
+        raise ValueError("F debe tener tamaño (n+1, m)")
+    return degree_raising(np.asarray(x, dtype=float), newton_coeffs(x, F))
+
+
 def interpolation_error(x: np.ndarray, f: np.ndarray, c: np.ndarray) -> Dict:
     y_interp = bernstein_poly_eval(x, c)
     error = np.abs(y_interp - f)
@@ -78,15 +137,29 @@ def example_2_1_data(n: int = 15) -> Tuple[np.ndarray, list]:
     ]
 
 
-def run_batch(x: np.ndarray, test_cases: list, verbose: bool = True) -> Dict:
+def run_batch(x: np.ndarray, test_cases: list, verbose: bool = True,
+              full_table: bool = True) -> Dict:
+    # Los puntos de control y los coeficientes de Newton de todos los casos
+    # se calculan de una vez. Como en newton_bernstein, dd es la tabla
+    # completa e info incluye sus métricas; full_table=False evita la tabla
+    # O(n^2) y su condición O(n^3): dd es entonces la fila superior e info
+    # solo incluye control_norm
+    x = np.asarray(x, dtype=float)
+    top = newton_coeffs(x, np.column_stack([f for _, f in test_cases]))
+    C = degree_raising(x, top)
     results = {}
-    for label, f in test_cases:
-        c, dd, info = newton_bernstein(x, f)
+    for (label, f), c, d in zip(test_cases, C.T, top.T):
+        dd = divided_diffs(x, f) if full_table else d
+        info = {'control_norm': np.linalg.norm(c)}
+        if full_table:
+            info['condition_number'] = np.linalg.cond(dd)
+            info['dd_frobenius'] = np.linalg.norm(dd, 'fro')
         error = interpolation_error(x, f, c)
         results[label] = {'c': c, 'dd': dd, 'info': info, 'error': error}
         
         if verbose:
-            print(f"{label:40} | κ={info['condition_number']:8.2e} | "
+            kappa = f" | κ={info['condition_number']:8.2e}" if full_table else ""
+            print(f"{label:40}{kappa} | "
                   f"E_max={error['max']:8.2e} | ||c||={info['control_norm']:8.2e}")
     
     return results
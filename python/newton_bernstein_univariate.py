@@ -1,15 +1,56 @@
 import numpy as np
+from collections import OrderedDict
 from scipy.special import comb
 from typing import Tuple, Dict, Union, List, Callable
 import matplotlib.pyplot as plt
 
 
+# Número de matrices de evaluación que guarda cada NodePlan
+EVALUATION_CACHE_SIZE = 8
+
+
+def bernstein_basis_matrix(t: np.ndarray, n: int) -> np.ndarray:
+    """
+    Matriz de la base de Bernstein de grado n en los puntos t.
+    
+    Se construye con la recurrencia B_j^k = (1-t) B_j^{k-1} + t B_{j-1}^{k-1},
+    que no forma coeficientes binomiales ni potencias y es estable para
+    grados altos.
+    
+    Parameters
+    ----------
+    t : np.ndarray
+        Puntos en [0, 1], array de tamaño (L,)
+    n : int
+        Grado de la base
+        
+    Returns
+    -------
+    np.ndarray
+        Matriz (L, n+1) con B[i, j] = B_j^n(t_i)
+    """
+    t = np.atleast_1d(np.asarray(t, dtype=float))[:, np.newaxis]
+    s = 1 - t
+    basis = np.zeros((t.shape[0], n + 1))
+    basis[:, 0] = 1.0
+    
+    for k in range(1, n + 1):
+        basis[:, 1:k + 1] = t * basis[:, :k] + s * basis[:, 1:k + 1]
+        basis[:, :1] *= s
+    
+    return basis
+
+
 class NewtonBernsteinUnivariate:
     """
     Clase que implementa el Algoritmo Newton-Bernstein univariado.
     
     El algoritmo calcula los puntos de control {c_j}_{j=0}^n del interpolante
     de Lagrange p(x) expresado en la forma de Bernstein-Bézier.
+    
+    Admite varios vectores de datos sobre los mismos nodos: con f_values de
+    tamaño (n+1, m) los polinomios base w se calculan una sola vez y los m
+    vectores de puntos de control se obtienen con operaciones matriciales.
     """
     
     def __init__(self, x_nodes: np.ndarray, f_values: np.ndarray):
@@ -21,7 +62,8 @@ class NewtonBernsteinUnivariate:
         x_nodes : np.ndarray
             Nodos de interpolación {x_j}_{j=0}^n, array de tamaño (n+1,)
         f_values : np.ndarray
-            Datos de interpolación {f_j}_{j=0}^n, array de tamaño (n+1,)
+            Datos de interpolación {f_j}_{j=0}^n, array de tamaño (n+1,),
+            o (n+1, m) para m vectores de datos sobre los mismos nodos
         """
         self.x_nodes = np.asarray(x_nodes, dtype=float)
         self.f_values = np.asarray(f_values, dtype=float)
@@ -29,41 +71,101 @@ class NewtonBernsteinUnivariate:
         
         if len(self.f_values) != len(self.x_nodes):
             raise ValueError("x_nodes y f_values deben tener la misma longitud")
+        if self.f_values.ndim > 2:
+            raise ValueError("f_values debe tener tamaño (n+1,) o (n+1, m)")
         
         self.control_points = None
+        self.newton_coefficients = None
         self.divided_differences = None
+        self.basis_points = None                # w^{(n)}: base de Newton de grado n
+        self._trailing_differences = None       # f[x_{n-s}, ..., x_n], s = 0..n
+        
+    def _check_distinct_nodes(self) -> None:
+        """
+        Comprueba una sola vez que no hay nodos duplicados.
+        
+        Raises
+        ------
+        ValueError
+            Si dos nodos coinciden
+        """
+        order = np.argsort(self.x_nodes, kind='stable')
+        repeated = np.flatnonzero(np.diff(self.x_nodes[order]) == 0)
+        if len(repeated) > 0:
+            i, j = sorted((order[repeated[0]], order[repeated[0] + 1]))
+            raise ValueError(f"Nodos duplicados detectados: x[{i}] = x[{j}]")
+    
+    def _column(self, v: np.ndarray) -> np.ndarray:
+        """
+        Vista de v como columna que se difunde sobre los m vectores de datos.
+        """
+        return v.reshape((-1,) + (1,) * (self.f_values.ndim - 1))
+    
+    def compute_newton_coefficients(self) -> np.ndarray:
+        """
+        Calcula los coeficientes de la forma de Newton, f[x_0, ..., x_k].
+        
+        Es la fila superior de la tabla de diferencias divididas, que es lo
+        único que necesita el algoritmo. Se obtiene columna a columna sobre
+        un único vector: tras el paso s, d[k] = f[x_{k-s}, ..., x_k] para
+        k >= s, de modo que la memoria es O(n) en lugar de O(n^2).
+        
+        Returns
+        -------
+        np.ndarray
+            Array de tamaño (n+1,) o (n+1, m) con d[k] = f[x_0, ..., x_k]
+        """
+        self._check_distinct_nodes()
+        x = self.x_nodes
+        d = self.f_values.copy()
+        
+        # d[n] tras el paso s es f[x_{n-s}, ..., x_n]; esa diagonal es la
+        # que necesita add_node para añadir una diferencia en O(n)
+        trailing = np.empty_like(d)
+        trailing[0] = d[-1]
+        
+        for s in range(1, self.n + 1):
+            d[s:] = (d[s:] - d[s - 1:-1]) / self._column(x[s:] - x[:-s])
+            trailing[s] = d[-1]
         
+        self.newton_coefficients = d
+        self._trailing_differences = trailing
+        return d
+    
     def compute_divided_differences(self) -> np.ndarray:
         """
-        Calcula las diferencias divididas de Newton.
+        Calcula la tabla completa de diferencias divididas de Newton.
         
         Las diferencias divididas se usan en la forma de Newton del interpolante:
         p(x) = f[x_0] + f[x_0,x_1](x-x_0) + ... + f[x_0,...,x_n](x-x_0)...(x-x_{n-1})
         
+        La tabla ocupa O(n^2) memoria y solo se construye a petición; el
+        algoritmo usa compute_newton_coefficients.
+        
         Returns
         -------
         np.ndarray
-            Matriz de diferencias divididas de tamaño (n+1, n+1).
+            Matriz de diferencias divididas de tamaño (n+1, n+1), o
+            (n+1, n+1, m) con varios vectores de datos.
             dd[k, s] = f[x_k, ..., x_{k+s}]
         """
+        self._check_distinct_nodes()
         n = self.n
-        dd = np.zeros((n + 1, n + 1))
+        x = self.x_nodes
+        dd = np.zeros((n + 1, n + 1) + self.f_values.shape[1:])
         
         # Inicialización: orden 0
-        dd[:, 0] = self.f_values.copy()
+        dd[:, 0] = self.f_values
         
-        # Cálculo recursivo de diferencias divididas
+        # Cada columna se calcula de una vez a partir de la anterior
         for s in range(1, n + 1):
-            for k in range(n + 1 - s):
-                if self.x_nodes[k + s] == self.x_nodes[k]:
-                    raise ValueError(
-                        f"Nodos duplicados detectados: x[{k}] = x[{k+s}]"
-                    )
-                dd[k, s] = (dd[k + 1, s - 1] - dd[k, s - 1]) / (
-                    self.x_nodes[k + s] - self.x_nodes[k]
-                )
+            dd[:n + 1 - s, s] = (dd[1:n + 2 - s, s - 1] - dd[:n + 1 - s, s - 1]) / (
+                self._column(x[s:] - x[:n + 1 - s])
+            )
         
         self.divided_differences = dd
+        self.newton_coefficients = dd[0].copy()
+        self._trailing_differences = dd[n - np.arange(n + 1), np.arange(n + 1)]
         return dd
     
     def algorithm_newton_bernstein(self) -> np.ndarray:
@@ -76,58 +178,176 @@ class NewtonBernsteinUnivariate:
         Returns
         -------
         np.ndarray
-            Puntos de control {c_j}_{j=0}^n, array de tamaño (n+1,)
+            Puntos de control {c_j}_{j=0}^n, array de tamaño (n+1,), o
+            (n+1, m) con una columna por vector de datos
         """
         n = self.n
         
-        # Paso 1: Calcular diferencias divididas
-        if self.divided_differences is None:
-            self.compute_divided_differences()
-        
-        dd = self.divided_differences
-        
-        # Paso 2: Inicialización para grado k=0
-        c = np.zeros(n + 1)  # Puntos de control del interpolante
-        w = np.zeros(n + 1)  # Puntos de control del polinomio base
-        
-        c[0] = dd[0, 0]  # f[x_0]
+        # Paso 1: Calcular diferencias divididas (solo la fila superior)
+        if self.newton_coefficients is None:
+            self.compute_newton_coefficients()
+        
+        dd = self.newton_coefficients
+        
+        # Paso 2: Inicialización para grado k=0. Se usan dos búferes por
+        # array (ida y vuelta): el paso k lee de (c, w) y escribe en
+        # (c_next, w_next), sin reservar memoria dentro del bucle. Los
+        # polinomios base w solo dependen de los nodos y se comparten entre
+        # todos los vectores de datos
+        shape = (n + 1,) + self.f_values.shape[1:]
+        c, c_next = np.zeros(shape), np.zeros(shape)  # Puntos de control del interpolante
+        w, w_next = np.zeros(n + 1), np.zeros(n + 1)  # Puntos de control del polinomio base
+        steps = np.arange(1, n + 1, dtype=float)
+        ratio, comp, tmp = np.empty(n), np.empty(n), np.empty(n + 1)
+        c_tmp = np.empty(shape)
+        
+        c[0] = dd[0]  # f[x_0]
         w[0] = 1.0
         
         # Paso 3: Bucle inductivo principal (k = 1 hasta n)
+        scratch = (steps, ratio, comp, tmp, c_tmp)
         for k in range(1, n + 1):
-            # Crear arrays temporales para almacenar nuevos valores
-            c_new = np.zeros(n + 1)
-            w_new = np.zeros(n + 1)
-            
-            # Actualización de w_j y c_j para j = k hasta 1 (hacia atrás)
-            for j in range(k, 0, -1):
-                # Actualizar w_j^{(k)} usando la fórmula de recurrencia
-                w_new[j] = (j / k) * w[j - 1] * (1 - self.x_nodes[k - 1]) - \
-                           ((k - j) / k) * w[j] * self.x_nodes[k - 1]
-                
-                # Actualizar c_j^{(k)} usando la fórmula de recurrencia
-                c_new[j] = ((j / k) * c[j - 1] + 
-                           ((k - j) / k) * c[j]) + \
-                          w_new[j] * dd[0, k]
+            self._raise_degree(k, c, w, c_next, w_next, dd[k], scratch)
             
-            # Actualización de términos j=0
-            w_new[0] = -w[0] * self.x_nodes[k - 1]
-            c_new[0] = c[0] + dd[0, k] * w_new[0]
-            
-            # Copiar valores para la siguiente iteración
-            c = c_new.copy()
-            w = w_new.copy()
+            # Intercambiar búferes para la siguiente iteración
+            c, c_next = c_next, c
+            w, w_next = w_next, w
         
+        self.basis_points = w
         self.control_points = c
         return c
     
+    def _raise_degree(self, k: int, c: np.ndarray, w: np.ndarray,
+                      c_next: np.ndarray, w_next: np.ndarray,
+                      dd_k: Union[float, np.ndarray], scratch: Tuple) -> None:
+        """
+        Paso k de la recurrencia de elevación de grado.
+        
+        Escribe en (c_next, w_next)[:k+1] los puntos de control de grado k a
+        partir de (c, w) de grado k-1, que deben tener ceros en la fila k.
+        
+        Parameters
+        ----------
+        k : int
+            Grado de destino
+        c, w : np.ndarray
+            Puntos de control del interpolante y del polinomio base, grado k-1
+        c_next, w_next : np.ndarray
+            Búferes de salida
+        dd_k : float o np.ndarray
+            Diferencia dividida f[x_0, ..., x_k]
+        scratch : tuple
+            Búferes auxiliares (steps, ratio, comp, tmp, c_tmp)
+        """
+        steps, ratio, comp, tmp, c_tmp = scratch
+        node = self.x_nodes[k - 1]
+        r, q = ratio[:k], comp[:k]
+        np.divide(steps[:k], k, out=r)          # j / k
+        np.subtract(k, steps[:k], out=q)        # (k - j) / k
+        q /= k
+        
+        # w_j^{(k)} = (j/k) w_{j-1} (1 - x_{k-1}) - ((k-j)/k) w_j x_{k-1}
+        np.multiply(r, w[:k], out=w_next[1:k + 1])
+        w_next[1:k + 1] *= 1 - node
+        np.multiply(q, w[1:k + 1], out=tmp[:k])
+        tmp[:k] *= node
+        w_next[1:k + 1] -= tmp[:k]
+        w_next[0] = -w[0] * node
+        
+        # c_j^{(k)} = (j/k) c_{j-1} + ((k-j)/k) c_j + w_j^{(k)} f[x_0, ..., x_k]
+        np.multiply(self._column(r), c[:k], out=c_next[1:k + 1])
+        np.multiply(self._column(q), c[1:k + 1], out=c_tmp[:k])
+        c_next[1:k + 1] += c_tmp[:k]
+        c_next[0] = c[0]
+        np.multiply(self._column(w_next[:k + 1]), dd_k, out=c_tmp[:k + 1])
+        c_next[:k + 1] += c_tmp[:k + 1]
+    
+    def add_node(self, x_new: float, f_new: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Añade un nodo al interpolante en O(n).
+        
+        La forma de Newton es incremental: el nodo nuevo solo aporta la
+        diferencia f[x_0, ..., x_{n+1}], que se obtiene en O(n) a partir de
+        la diagonal f[x_{n-s}, ..., x_n], y un paso más de elevación de
+        grado con el polinomio base w^{(n)} guardado.
+        
+        Parameters
+        ----------
+        x_new : float
+            Nodo nuevo, distinto de los existentes
+        f_new : float o np.ndarray
+            Dato en el nodo (array (m,) con varios vectores de datos)
+            
+        Returns
+        -------
+        np.ndarray
+            Puntos de control del interpolante de grado n+1
+            
+        Raises
+        ------
+        ValueError
+            Si el nodo ya existe o f_new no tiene un valor por vector de datos
+        """
+        f_new = np.asarray(f_new, dtype=float)
+        if f_new.shape != self.f_values.shape[1:]:
+            raise ValueError(f"f_new debe tener tamaño {self.f_values.shape[1:]}, "
+                             f"recibido {f_new.shape}")
+        
+        x_new = float(x_new)
+        matches = np.flatnonzero(self.x_nodes == x_new)
+        if len(matches) > 0:
+            raise ValueError(f"Nodos duplicados detectados: x[{matches[0]}] = x[{self.n + 1}]")
+        
+        if self.control_points is None or self._trailing_differences is None:
+            self.compute_newton_coefficients()
+            self.algorithm_newton_bernstein()
+        
+        n = self.n
+        x = self.x_nodes
+        
+        # Nueva diagonal f[x_{n+1-s}, ..., x_{n+1}]
+        old_trailing = self._trailing_differences
+        trailing = np.empty((n + 2,) + old_trailing.shape[1:])
+        trailing[0] = f_new
+        for s in range(1, n + 2):
+            trailing[s] = (trailing[s - 1] - old_trailing[s - 1]) / (x_new - x[n + 1 - s])
+        
+        self.x_nodes = np.append(x, x_new)
+        self.f_values = np.concatenate([self.f_values, f_new[np.newaxis]])
+        self.newton_coefficients = np.concatenate(
+            [self.newton_coefficients, trailing[-1][np.newaxis]]
+        )
+        self._trailing_differences = trailing
+        self.divided_differences = None
+        self.n = n + 1
+        
+        # Un paso de elevación de grado, de n a n+1
+        k = n + 1
+        shape = (k + 1,) + self.f_values.shape[1:]
+        c = np.zeros(shape)
+        c[:k] = self.control_points
+        w = np.zeros(k + 1)
+        w[:k] = self.basis_points
+        c_next, w_next = np.zeros(shape), np.zeros(k + 1)
+        scratch = (np.arange(1, k + 1, dtype=float), np.empty(k), np.empty(k),
+                   np.empty(k + 1), np.empty(shape))
+        self._raise_degree(k, c, w, c_next, w_next, trailing[-1], scratch)
+        
+        self.control_points = c_next
+        self.basis_points = w_next
+        return c_next
+    
     def evaluate_bernstein(self, x_eval: Union[float, np.ndarray]) -> np.ndarray:
         """
         Evalúa el interpolante en puntos usando la forma de Bernstein-Bézier.
         
         p(x) = sum_{j=0}^{n} c_j * B_j^n(x)
         
-        donde B_j^n(x) son los polinomios de Bernstein.
+        donde B_j^n(x) son los polinomios de Bernstein en [0, 1]. La
+        recurrencia de algorithm_newton_bernstein usa los nodos x_k como
+        variable de la base, sin normalizarlos, de modo que se evalúa en la
+        misma variable (add_node conserva así los puntos de control aunque
+        el nodo nuevo amplíe el rango).
         
         Parameters
         ----------
@@ -137,31 +357,16 @@ class NewtonBernsteinUnivariate:
         Returns
         -------
         np.ndarray
-            Valores del interpolante en x_eval
+            Valores del interpolante en x_eval, de tamaño (L,) o (L, m)
         """
         if self.control_points is None:
             raise RuntimeError("Debe ejecutar algorithm_newton_bernstein primero")
         
-        x_eval = np.atleast_1d(x_eval)
-        n = self.n
-        c = self.control_points
-        
-        # Normalizar x_eval al intervalo [0, 1]
-        # Primero necesitamos mapear del intervalo [x_min, x_max] a [0, 1]
-        x_min = self.x_nodes.min()
-        x_max = self.x_nodes.max()
-        t = (x_eval - x_min) / (x_max - x_min)
+        x_eval = np.atleast_1d(np.asarray(x_eval, dtype=float))
         
-        # Calcular polinomios de Bernstein
-        result = np.zeros_like(x_eval, dtype=float)
-        
-        for j in range(n + 1):
-            # B_j^n(t) = C(n,j) * t^j * (1-t)^(n-j)
-            binom_coeff = np.math.comb(n, j)
-            bernstein_basis = binom_coeff * (t ** j) * ((1 - t) ** (n - j))
-            result += c[j] * bernstein_basis
-        
-        return result
+        # p(x) = sum_j c_j B_j^n(x): un producto matriz-vector (o matriz-matriz
+        # con varios vectores de datos)
+        return bernstein_basis_matrix(x_eval, self.n) @ self.control_points
     
     def evaluate_newton(self, x_eval: Union[float, np.ndarray]) -> np.ndarray:
         """
@@ -177,22 +382,22 @@ class NewtonBernsteinUnivariate:
         Returns
         -------
         np.ndarray
-            Valores del interpolante en x_eval
+            Valores del interpolante en x_eval, de tamaño (L,) o (L, m)
         """
-        if self.divided_differences is None:
-            raise RuntimeError("Debe ejecutar compute_divided_differences primero")
+        if self.newton_coefficients is None:
+            raise RuntimeError("Debe ejecutar compute_newton_coefficients primero")
         
         x_eval = np.atleast_1d(x_eval)
         n = self.n
-        dd = self.divided_differences
+        dd = self.newton_coefficients
         
-        result = np.zeros_like(x_eval, dtype=float)
+        result = np.zeros(x_eval.shape + dd.shape[1:])
         
         # Acumular términos de la forma de Newton
         product = np.ones_like(x_eval, dtype=float)
         
         for k in range(n + 1):
-            result += dd[0, k] * product
+            result += np.multiply.outer(product, dd[k])
             if k < n:
                 product *= (x_eval - self.x_nodes[k])
         
@@ -239,6 +444,184 @@ class NewtonBernsteinUnivariate:
         }
 
 
+class NodePlan:
+    """
+    Plan precompilado para interpolar repetidamente sobre nodos fijos.
+    
+    Todo el trabajo que depende solo de los nodos se hace una vez: la
+    validación y la matriz M que lleva los coeficientes de Newton a puntos
+    de control de Bernstein (la columna k es el polinomio base w^{(k)}
+    elevado a grado n). Después interpolate(f) solo calcula las
+    diferencias divididas y un producto M @ d, ambos O(n^2), y update()
+    corrige los puntos de control en O(n) cuando cambia un único dato.
+    
+    Los puntos de control son los de NewtonBernsteinUnivariate(x_nodes, f):
+    la base de Bernstein está en la variable x, sin normalizar los nodos.
+    
+    Example
+    -------
+    >>> plan = NodePlan(x_nodes)
+    >>> c = plan.interpolate(f_values)
+    >>> c = plan.update(c, 3, 0.5)          # f_values[3] += 0.5
+    >>> y = plan.evaluate(c, x_eval)
+    """
+    
+    def __init__(self, x_nodes: np.ndarray):
+        """
+        Construye el plan.
+        
+        Parameters
+        ----------
+        x_nodes : np.ndarray
+            Nodos de interpolación {x_j}_{j=0}^n, array de tamaño (n+1,)
+            
+        Raises
+        ------
+        ValueError
+            Si hay nodos duplicados
+        """
+        self.x_nodes = np.asarray(x_nodes, dtype=float)
+        self.n = len(self.x_nodes) - 1
+        
+        # Los puntos de control de unos coeficientes de Newton unitarios son
+        # las columnas de M; el algoritmo por lotes las calcula todas juntas
+        solver = NewtonBernsteinUnivariate(self.x_nodes, np.eye(self.n + 1))
+        solver._check_distinct_nodes()
+        solver.newton_coefficients = np.eye(self.n + 1)
+        self.newton_to_bernstein = solver.algorithm_newton_bernstein()
+        
+        self._lagrange = None
+        self._evaluation = OrderedDict()
+    
+    def newton_coefficients(self, f_values: np.ndarray) -> np.ndarray:
+        """
+        Diferencias divididas f[x_0, ..., x_k], sin volver a validar los
+        nodos.
+        
+        Parameters
+        ----------
+        f_values : np.ndarray
+            Datos, array de tamaño (n+1,) o (n+1, m)
+            
+        Returns
+        -------
+        np.ndarray
+            Coeficientes de Newton con la misma forma que f_values
+        """
+        x = self.x_nodes
+        d = np.array(f_values, dtype=float)
+        if len(d) != self.n + 1:
+            raise ValueError("f_values debe tener n+1 filas")
+        
+        col = (slice(None),) + (np.newaxis,) * (d.ndim - 1)
+        for s in range(1, self.n + 1):
+            d[s:] = (d[s:] - d[s - 1:-1]) / (x[s:] - x[:-s])[col]
+        return d
+    
+    def interpolate(self, f_values: np.ndarray) -> np.ndarray:
+        """
+        Puntos de control del interpolante de unos datos.
+        
+        Parameters
+        ----------
+        f_values : np.ndarray
+            Datos, array de tamaño (n+1,) o (n+1, m)
+            
+        Returns
+        -------
+        np.ndarray
+            Puntos de control, array de tamaño (n+1,) o (n+1, m)
+        """
+        return self.newton_to_bernstein @ self.newton_coefficients(f_values)
+    
+    @property
+    def lagrange_control_points(self) -> np.ndarray:
+        """
+        Puntos de control de la base de Lagrange, calculados a petición.
+        
+        La columna i son los puntos de control del polinomio l_i con
+        l_i(x_j) = δ_ij. Su cálculo es O(n^3) y solo se hace la primera vez.
+        """
+        if self._lagrange is None:
+            self._lagrange = self.interpolate(np.eye(self.n + 1))
+        return self._lagrange
+    
+    def update(self, control_points: np.ndarray, index: int,
+               delta: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Actualiza los puntos de control cuando cambia un único dato.
+        
+        Si f_values[index] aumenta en delta, el interpolante aumenta en
+        delta * l_index, de modo que la corrección es O(n) (O(n m) con m
+        vectores de datos).
+        
+        Parameters
+        ----------
+        control_points : np.ndarray
+            Puntos de control actuales, (n+1,) o (n+1, m)
+        index : int
+            Índice del dato que cambia
+        delta : float o np.ndarray
+            Incremento del dato (escalar o array (m,))
+            
+        Returns
+        -------
+        np.ndarray
+            Nuevos puntos de control
+        """
+        basis = self.lagrange_control_points[:, index]
+        return control_points + np.multiply.outer(basis, delta)
+    
+    def evaluation_matrix(self, x_eval: np.ndarray) -> np.ndarray:
+        """
+        Matriz de la base de Bernstein en unos puntos, con caché.
+        
+        Se guardan las EVALUATION_CACHE_SIZE mallas usadas más recientemente.
+        
+        Parameters
+        ----------
+        x_eval : np.ndarray
+            Puntos de evaluación
+            
+        Returns
+        -------
+        np.ndarray
+            Matriz (L, n+1) de solo lectura
+        """
+        x_eval = np.atleast_1d(np.asarray(x_eval, dtype=float))
+        key = x_eval.tobytes()
+        matrix = self._evaluation.get(key)
+        
+        if matrix is None:
+            matrix = bernstein_basis_matrix(x_eval, self.n)
+            matrix.flags.writeable = False
+            self._evaluation[key] = matrix
+            if len(self._evaluation) > EVALUATION_CACHE_SIZE:
+                self._evaluation.popitem(last=False)
+        else:
+            self._evaluation.move_to_end(key)
+        
+        return matrix
+    
+    def evaluate(self, control_points: np.ndarray, x_eval: np.ndarray) -> np.ndarray:
+        """
+        Evalúa interpolantes del plan en unos puntos.
+        
+        Parameters
+        ----------
+        control_points : np.ndarray
+            Puntos de control, (n+1,) o (n+1, m)
+        x_eval : np.ndarray
+            Puntos de evaluación
+            
+        Returns
+        -------
+        np.ndarray
+            Valores, de tamaño (L,) o (L, m)
+        """
+        return self.evaluation_matrix(x_eval) @ control_points
+
+
 # ============================================================================
 # GENERADORES DE NODOS Y DATOS - EJEMPLOS UNIVARIADOS
 # ============================================================================
@@ -437,9 +820,9 @@ def reproduce_example_2_1():
         print(f"  c = {control_points}")
         
         print(f"\nDiferencias divididas (primeros 5):")
-        dd = nb.divided_differences
+        dd = nb.newton_coefficients
         for k in range(min(5, n + 1)):
-            print(f"  f[x_0, ..., x_{k}] = {dd[0, k]:.8e}")
+            print(f"  f[x_0, ..., x_{k}] = {dd[k]:.8e}")
         
         # Visualizar
         visualize_interpolation(x_nodes, f_values, control_points, 
@@ -501,9 +884,9 @@ def reproduce_example_2_3():
         print(f"  c[-5:] = {control_points[-5:]}")
         
         print(f"\nDiferencias divididas (primeros 5):")
-        dd = nb.divided_differences
+        dd = nb.newton_coefficients
         for k in range(min(5, n + 1)):
-            print(f"  f[x_0, ..., x_{k}] = {dd[0, k]:.8e}")
+            print(f"  f[x_0, ..., x_{k}] = {dd[k]:.8e}")
         
         # Visualizar
         visualize_interpolation(x_nodes, f_values, control_points,
@@ -36,6 +36,24 @@ def main():
         print(f"Error al ejecutar ejemplo 2: {e}")
         print()
     
+    # Importar y ejecutar ejemplo 3
+    try:
+        from examples.example3_strategies import example3_strategies
+        results3 = example3_strategies()
+        print("\n" + "=" * 80 + "\n")
+    except Exception as e:
+        print(f"Error al ejecutar ejemplo 3: {e}")
+        print()
+    
+    # Importar y ejecutar ejemplo 4
+    try:
+        from examples.example4_real_line import example4_real_line
+        results4 = example4_real_line()
+        print("\n" + "=" * 80 + "\n")
+    except Exception as e:
+        print(f"Error al ejecutar ejemplo 4: {e}")
+        print()
+    
     print("=" * 80)
     print(" " * 25 + "Ejemplos completados")
     print("=" * 80)
@@ -6,7 +6,11 @@ Este paquete implementa el algoritmo de Newton-Bernstein para encontrar
 raíces de polinomios en una dimensión usando la representación de Bernstein.
 """
 
-from .newton_bernstein import NewtonBernstein, find_roots
+from .newton_bernstein import (
+    NewtonBernstein, find_roots, find_roots_batch, find_all_real_roots
+)
+from .tracking import RootTracker
+from .cache import ResultCache
 from .bernstein import BernsteinPolynomial
 from .utils import sign_changes, interval_width
 
@@ -14,6 +18,10 @@ __version__ = "1.0.0"
 __all__ = [
     "NewtonBernstein",
     "find_roots",
+    "find_roots_batch",
+    "find_all_real_roots",
+    "RootTracker",
+    "ResultCache",
     "BernsteinPolynomial",
     "sign_changes",
     "interval_width"
@@ -0,0 +1,164 @@
+"""
+Aritmética de precisión extendida
+=================================
+
+Escalares alternativos a float64 para la fase de aislamiento de raíces en
+polinomios mal condicionados (p. ej. de tipo Wilkinson):
+
+- "float64":    float de máquina (la ruta vectorizada habitual)
+- "longdouble": np.longdouble (precisión extendida del hardware)
+- "fraction":   fractions.Fraction, aritmética racional exacta
+- "mpmath":     mpmath.mpf con MPMATH_PRECISION bits (requiere mpmath)
+
+Las funciones de este módulo operan sobre listas de escalares del backend
+con bucles de Python; solo se usan en los subintervalos en los que la
+prueba de signos en float64 no es concluyente.
+"""
+
+from fractions import Fraction
+from math import comb
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+
+# Backends disponibles
+BACKENDS = ("float64", "longdouble", "fraction", "mpmath")
+
+# Precisión en bits del backend mpmath
+MPMATH_PRECISION = 256
+
+
+def backend_scalar(name: str) -> Callable:
+    """
+    Devuelve el constructor de escalares de un backend.
+    
+    Los valores float se convierten de forma exacta (Fraction y mpf
+    representan cualquier float64 sin redondeo).
+    
+    Args:
+        name: Nombre del backend (uno de BACKENDS)
+    
+    Returns:
+        Función que convierte un número al tipo del backend
+    
+    Raises:
+        ValueError: Si el backend no existe
+        ImportError: Si el backend requiere mpmath y no está instalado
+    """
+    if name == "float64":
+        return float
+    if name == "longdouble":
+        return np.longdouble
+    if name == "fraction":
+        return Fraction
+    if name == "mpmath":
+        try:
+            import mpmath
+        except ImportError:
+            raise ImportError("El backend 'mpmath' requiere el paquete mpmath "
+                              "(pip install mpmath)")
+        context = mpmath.mp.clone()
+        context.prec = MPMATH_PRECISION
+        return context.mpf
+    raise ValueError(f"Backend desconocido: {name!r}; opciones: {', '.join(BACKENDS)}")
+
+
+def power_to_bernstein_generic(power_coeffs: Sequence, lo, hi) -> List:
+    """
+    Coeficientes de Bernstein de p en [lo, hi] con aritmética genérica.
+    
+    Se calcula q(t) = p(lo + (hi - lo) t) con un desplazamiento de Taylor
+    (divisiones sintéticas sucesivas) y después b_k = sum_j C(k,j)/C(n,j) q_j.
+    Con Fraction el resultado es exacto.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n] ya en el tipo del backend
+        lo, hi: Extremos del intervalo en el tipo del backend
+    
+    Returns:
+        Lista de coeficientes de Bernstein [b_0, ..., b_n]
+    """
+    shifted = list(power_coeffs)
+    n = len(shifted) - 1
+    
+    # Desplazamiento de Taylor: coeficientes de p(x + lo)
+    for i in range(n):
+        for j in range(n - 1, i - 1, -1):
+            shifted[j] = shifted[j] + lo * shifted[j + 1]
+    
+    # Cambio de escala x = h t
+    h = hi - lo
+    one = type(h)(1)
+    scale = one
+    for j in range(n + 1):
+        shifted[j] = shifted[j] * scale
+        scale = scale * h
+    
+    # Cambio de base: b_k = sum_{j<=k} C(k,j) / C(n,j) q_j
+    bernstein = []
+    for k in range(n + 1):
+        total = one * 0
+        for j in range(k + 1):
+            total = total + one * comb(k, j) / comb(n, j) * shifted[j]
+        bernstein.append(total)
+    return bernstein
+
+
+def de_casteljau_split_generic(coeffs: Sequence) -> Tuple[List, List]:
+    """
+    Subdivide en t = 1/2 unos coeficientes de Bernstein genéricos.
+    
+    Args:
+        coeffs: Coeficientes [c_0, ..., c_n] en el tipo del backend
+    
+    Returns:
+        Tupla (izquierda, derecha) de listas de coeficientes
+    """
+    work = list(coeffs)
+    n = len(work) - 1
+    left, right = [work[0]], [work[n]]
+    for j in range(1, n + 1):
+        work = [(work[i] + work[i + 1]) / 2 for i in range(n - j + 1)]
+        left.append(work[0])
+        right.append(work[-1])
+    right.reverse()
+    return left, right
+
+
+def sign_changes_generic(coeffs: Sequence) -> int:
+    """
+    Cuenta los cambios de signo de una secuencia, ignorando los ceros.
+    
+    Args:
+        coeffs: Secuencia de escalares del backend
+    
+    Returns:
+        Número de cambios de signo
+    """
+    changes = 0
+    previous = 0
+    for c in coeffs:
+        sign = int(c > 0) - int(c < 0)
+        if sign != 0:
+            if previous != 0 and sign != previous:
+                changes += 1
+            previous = sign
+    return changes
+
+
+def horner_generic(power_coeffs: Sequence, x):
+    """
+    Evalúa p(x) con el esquema de Horner en el tipo del backend.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n] en el tipo del backend
+        x: Punto en el tipo del backend
+    
+    Returns:
+        Valor p(x)
+    """
+    result = power_coeffs[-1] * 1
+    for c in reversed(power_coeffs[:-1]):
+        result = result * x + c
+    return result
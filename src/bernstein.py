@@ -7,8 +7,416 @@ en la forma de Bernstein.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from math import comb
+from functools import lru_cache
+from .utils import sign_changes as count_sign_changes
+
+
+# Número máximo de grados distintos con matrices de cambio de base en caché
+MATRIX_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def binomial_table(n: int) -> np.ndarray:
+    """
+    Tabla de coeficientes binomiales C(i, j) para 0 <= j <= i <= n.
+    
+    El resultado se guarda en caché por grado y es de solo lectura.
+    
+    Args:
+        n: Grado máximo
+        
+    Returns:
+        Array (n+1, n+1) con C(i, j) en la posición [i, j] (0 si j > i)
+    """
+    table = np.zeros((n + 1, n + 1))
+    for i in range(n + 1):
+        table[i, :i + 1] = [comb(i, j) for j in range(i + 1)]
+    table.flags.writeable = False
+    return table
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def power_to_bernstein_matrix(n: int) -> np.ndarray:
+    """
+    Matriz de cambio de la base de potencias a la de Bernstein en [0, 1].
+    
+    Si q(t) = sum a_j * t^j, sus coeficientes de Bernstein son M @ a con
+    M[i, j] = C(i, j) / C(n, j). El resultado se guarda en caché por grado.
+    
+    Args:
+        n: Grado del polinomio
+        
+    Returns:
+        Array (n+1, n+1) de solo lectura
+    """
+    table = binomial_table(n)
+    matrix = table / table[n]
+    matrix.flags.writeable = False
+    return matrix
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def bernstein_to_power_matrix(n: int) -> np.ndarray:
+    """
+    Matriz de cambio de la base de Bernstein en [0, 1] a la de potencias.
+    
+    Es la inversa de power_to_bernstein_matrix(n), con entradas
+    (-1)^(j-i) * C(n, j) * C(j, i). El resultado se guarda en caché por grado.
+    
+    Args:
+        n: Grado del polinomio
+        
+    Returns:
+        Array (n+1, n+1) de solo lectura
+    """
+    table = binomial_table(n)
+    exponents = np.subtract.outer(np.arange(n + 1), np.arange(n + 1))
+    signs = np.where(exponents % 2 == 0, 1.0, -1.0)
+    matrix = signs * table[n][:, np.newaxis] * table
+    matrix.flags.writeable = False
+    return matrix
+
+
+def affine_substitution_matrix(n: int, shift: float, scale: float) -> np.ndarray:
+    """
+    Matriz del cambio de variable x = shift + scale * t en la base de potencias.
+    
+    Si p(x) = sum a_j * x^j, los coeficientes de q(t) = p(shift + scale*t)
+    son A @ a con A[i, j] = C(j, i) * shift^(j-i) * scale^i.
+    
+    Args:
+        n: Grado del polinomio
+        shift: Desplazamiento
+        scale: Escala
+        
+    Returns:
+        Array (n+1, n+1) triangular superior
+    """
+    exponents = np.subtract.outer(np.arange(n + 1), np.arange(n + 1)).T
+    upper = exponents >= 0
+    shift_powers = np.where(upper, float(shift) ** np.where(upper, exponents, 0), 0.0)
+    scale_powers = float(scale) ** np.arange(n + 1)
+    return binomial_table(n).T * shift_powers * scale_powers[:, np.newaxis]
+
+
+def de_casteljau_split(coefficients: np.ndarray, 
+                       t: float = 0.5,
+                       out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subdivide coeficientes de Bernstein en el parámetro t.
+    
+    Opera sobre el último eje, de modo que un array (m, n+1) subdivide
+    m polinomios a la vez con n barridos vectorizados.
+    
+    Args:
+        coefficients: Coeficientes de Bernstein, forma (..., n+1)
+        t: Punto de subdivisión en [0, 1], escalar o array con la forma
+           de los ejes iniciales (un punto por polinomio)
+        out: Buffer opcional de forma (2, ..., n+1) donde se escriben las
+             dos mitades (out[0] izquierda, out[1] derecha)
+        
+    Returns:
+        Tupla (left_coeffs, right_coeffs) con la misma forma que la entrada;
+        si se pasa out, son vistas de out[0] y out[1]
+    """
+    work = np.asarray(coefficients, dtype=float)
+    if np.ndim(t) > 0:
+        t = np.asarray(t, dtype=float)[..., np.newaxis]
+    n = work.shape[-1] - 1
+    if out is None:
+        out = np.empty((2,) + work.shape)
+    elif out.shape != (2,) + work.shape:
+        raise ValueError(f"out debe tener forma {(2,) + work.shape}, "
+                         f"recibido {out.shape}")
+    left_coeffs, right_coeffs = out[0], out[1]
+    left_coeffs[..., 0] = work[..., 0]
+    right_coeffs[..., n] = work[..., n]
+    
+    # El primer elemento de cada nivel pertenece al polinomio izquierdo
+    # y el último al derecho
+    for j in range(1, n + 1):
+        work = (1 - t) * work[..., :-1] + t * work[..., 1:]
+        left_coeffs[..., j] = work[..., 0]
+        right_coeffs[..., n - j] = work[..., -1]
+    
+    return left_coeffs, right_coeffs
+
+
+def restrict_rows(coefficients: np.ndarray, t_min: np.ndarray,
+                  t_max: np.ndarray) -> np.ndarray:
+    """
+    Restringe cada fila a su subintervalo paramétrico [t_min, t_max].
+    
+    Se subdivide en t_max y después la parte izquierda en t_min / t_max,
+    con un parámetro distinto por fila.
+    
+    Args:
+        coefficients: Coeficientes de Bernstein, forma (k, n+1)
+        t_min: Extremos izquierdos en [0, 1], forma (k,)
+        t_max: Extremos derechos en [0, 1], forma (k,)
+        
+    Returns:
+        Coeficientes de Bernstein de cada fila sobre su subintervalo
+    """
+    t_min = np.asarray(t_min, dtype=float)
+    t_max = np.asarray(t_max, dtype=float)
+    left_coeffs, _ = de_casteljau_split(coefficients, t_max)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_ratio = np.where(t_max > 0, t_min / t_max, 0.0)
+    _, restricted = de_casteljau_split(left_coeffs, t_ratio)
+    return restricted
+
+
+def bezier_clip(coefficients: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intervalo de recorte de Bézier de cada polinomio.
+    
+    Las raíces en [0, 1] están dentro de la intersección de la envolvente
+    convexa del polígono de control {(i/n, c_i)} con el eje t. Esa
+    intersección es [t_min, t_max], con los extremos en cortes de segmentos
+    entre puntos de control de signo opuesto.
+    
+    Args:
+        coefficients: Coeficientes de Bernstein, forma (k, n+1)
+        
+    Returns:
+        Tupla (t_min, t_max) de forma (k,); NaN si la envolvente no corta el eje
+    """
+    coeffs = np.asarray(coefficients, dtype=float)
+    n = coeffs.shape[-1] - 1
+    nodes = np.linspace(0.0, 1.0, n + 1)
+    
+    c_i = coeffs[:, :, np.newaxis]
+    c_j = coeffs[:, np.newaxis, :]
+    opposite = c_i * c_j < 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossings = (nodes[:, np.newaxis] +
+                     (nodes[np.newaxis, :] - nodes[:, np.newaxis]) * c_i / (c_i - c_j))
+    crossings = np.where(opposite, crossings, np.nan).reshape(len(coeffs), -1)
+    zeros = np.where(coeffs == 0, nodes, np.nan)
+    candidates = np.concatenate((crossings, zeros), axis=1)
+    
+    return _nan_bounds(candidates)
+
+
+def quadratic_clip(coefficients: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intervalo de recorte cuadrático de cada polinomio.
+    
+    Se aproxima p por la cuadrática q de mínimos cuadrados sobre los
+    coeficientes elevados a grado n y se acota el error por
+    delta = max |c - elevar(q)|. Las raíces de p en [0, 1] están en
+    {t : |q(t)| <= delta}, cuyo menor intervalo envolvente se calcula con
+    las raíces de q - delta y q + delta.
+    
+    Args:
+        coefficients: Coeficientes de Bernstein, forma (k, n+1)
+        
+    Returns:
+        Tupla (t_min, t_max) de forma (k,); NaN si no puede haber raíces
+    """
+    coeffs = np.asarray(coefficients, dtype=float)
+    n = coeffs.shape[-1] - 1
+    if n < 2:
+        return bezier_clip(coeffs)
+    
+    elevation, fit = _quadratic_fit_matrices(n)
+    q = coeffs @ fit.T
+    delta = np.abs(coeffs - q @ elevation.T).max(axis=1)
+    delta = delta + 8 * n * np.finfo(float).eps * np.abs(coeffs).max(axis=1)
+    
+    # q(t) = q0 + 2*(q1 - q0)*t + (q0 - 2*q1 + q2)*t^2
+    a0 = q[:, 0]
+    a1 = 2 * (q[:, 1] - q[:, 0])
+    a2 = q[:, 0] - 2 * q[:, 1] + q[:, 2]
+    
+    candidates = [np.where(np.abs(a0) <= delta, 0.0, np.nan),
+                  np.where(np.abs(a0 + a1 + a2) <= delta, 1.0, np.nan)]
+    for level in (delta, -delta):
+        candidates.extend(_quadratic_roots_in_unit(a2, a1, a0 - level))
+    
+    return _nan_bounds(np.column_stack(candidates))
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def _quadratic_fit_matrices(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matriz de elevación de grado 2 a n y su pseudoinversa.
+    
+    Args:
+        n: Grado de destino (n >= 2)
+        
+    Returns:
+        Tupla (E, E^+) de formas (n+1, 3) y (3, n+1)
+    """
+    table = binomial_table(n)
+    elevation = np.zeros((n + 1, 3))
+    for i in range(n + 1):
+        for k in range(3):
+            if 0 <= i - k <= n - 2:
+                elevation[i, k] = comb(2, k) * comb(n - 2, i - k) / table[n, i]
+    fit = np.linalg.pinv(elevation)
+    elevation.flags.writeable = False
+    fit.flags.writeable = False
+    return elevation, fit
+
+
+def _quadratic_roots_in_unit(a2: np.ndarray, a1: np.ndarray, 
+                             a0: np.ndarray) -> List[np.ndarray]:
+    """
+    Raíces reales en [0, 1] de a2*t^2 + a1*t + a0 (NaN si no existen).
+    
+    Args:
+        a2, a1, a0: Coeficientes, arrays de forma (k,)
+        
+    Returns:
+        Lista con dos arrays (k,) de raíces
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = a1 * a1 - 4 * a2 * a0
+        sqrt_disc = np.sqrt(np.where(disc >= 0, disc, np.nan))
+        # Fórmula estable: q = -(a1 + sign(a1)*sqrt(disc)) / 2
+        half = -0.5 * (a1 + np.where(a1 >= 0, 1.0, -1.0) * sqrt_disc)
+        linear = np.abs(a2) <= 1e-14 * (np.abs(a1) + np.abs(a0))
+        r1 = np.where(linear, -a0 / a1, half / a2)
+        r2 = np.where(linear, np.nan, a0 / half)
+    
+    return [np.where((r >= 0) & (r <= 1), r, np.nan) for r in (r1, r2)]
+
+
+def _nan_bounds(candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mínimo y máximo por fila ignorando NaN (NaN si la fila está vacía).
+    """
+    empty = np.all(np.isnan(candidates), axis=1)
+    filled_low = np.where(np.isnan(candidates), np.inf, candidates)
+    filled_high = np.where(np.isnan(candidates), -np.inf, candidates)
+    t_min = np.where(empty, np.nan, filled_low.min(axis=1))
+    t_max = np.where(empty, np.nan, filled_high.max(axis=1))
+    return t_min, t_max
+
+
+def restrict(coefficients: np.ndarray, interval: Tuple[float, float],
+             sub_interval: Tuple[float, float]) -> np.ndarray:
+    """
+    Restringe una forma de Bernstein a un subintervalo con De Casteljau.
+    
+    Se hacen dos subdivisiones: la primera en b se queda con [c, b] y la
+    segunda en a se queda con [a, b]. Si [a, b] está contenido en [c, d]
+    solo intervienen combinaciones convexas de los coeficientes. Opera
+    sobre el último eje.
+    
+    Args:
+        coefficients: Coeficientes de Bernstein en [c, d], forma (..., n+1)
+        interval: Intervalo (c, d) de los coeficientes dados
+        sub_interval: Intervalo (a, b) de destino
+        
+    Returns:
+        Coeficientes de Bernstein en [a, b]
+    """
+    c, d = interval
+    a, b = sub_interval
+    coeffs = np.asarray(coefficients, dtype=float)
+    
+    if b != d:
+        coeffs, _ = de_casteljau_split(coeffs, (b - c) / (d - c))
+    if a != c:
+        _, coeffs = de_casteljau_split(coeffs, (a - c) / (b - c))
+    
+    return coeffs
+
+
+def power_to_bernstein(power_coeffs: np.ndarray, 
+                       interval: Tuple[float, float] = (0, 1)) -> np.ndarray:
+    """
+    Convierte coeficientes de potencias a coeficientes de Bernstein en [a, b].
+    
+    La conversión se hace primero en un intervalo de referencia anclado en
+    el origen, [0, R] o [-R, 0] con R = max(|a|, |b|), donde el cambio de
+    variable es un simple reescalado x = R*t y la matriz de conversión es
+    no negativa. Después se restringe a [a, b] con De Casteljau. Así no se
+    forman potencias de a ni de b - a, que desbordan o cancelan para
+    grados altos o intervalos lejos del origen.
+    
+    Opera sobre el último eje: un array (m, n+1) convierte m polinomios con
+    un único producto matriz-matriz.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n], forma (..., n+1)
+        interval: Intervalo [a, b]
+        
+    Returns:
+        Coeficientes de Bernstein con la misma forma que la entrada
+    """
+    reference, reference_interval = _reference_form(power_coeffs, interval)
+    return restrict(reference, reference_interval, interval)
+
+
+def conversion_error_bound(power_coeffs: np.ndarray,
+                           interval: Tuple[float, float]) -> np.ndarray:
+    """
+    Cota del error de redondeo de power_to_bernstein en [a, b].
+    
+    La matriz de conversión de referencia es no negativa y la restricción
+    a [a, b] solo usa combinaciones convexas, de modo que el error queda
+    acotado por la misma conversión aplicada a |a_j| * R^j. La cota solo
+    es válida si el origen no está en el interior de [a, b]; en otro caso
+    se debe partir el intervalo en 0.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n], forma (..., n+1)
+        interval: Intervalo [a, b] con a >= 0 o b <= 0
+        
+    Returns:
+        Cota del error absoluto de cada coeficiente, forma (...)
+        
+    Raises:
+        ValueError: Si el intervalo contiene el origen en su interior
+    """
+    a, b = interval
+    if a < 0 < b:
+        raise ValueError("El intervalo no debe contener el origen en su interior")
+    
+    power_coeffs = np.asarray(power_coeffs, dtype=float)
+    n = power_coeffs.shape[-1] - 1
+    reference, reference_interval = _reference_form(power_coeffs, interval, absolute=True)
+    magnitude = restrict(reference, reference_interval, interval).max(axis=-1)
+    return 2 * (n + 1) * np.finfo(float).eps * magnitude
+
+
+def _reference_form(power_coeffs: np.ndarray, interval: Tuple[float, float],
+                    absolute: bool = False) -> Tuple[np.ndarray, Tuple[float, float]]:
+    """
+    Forma de Bernstein en el intervalo de referencia anclado en el origen.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n], forma (..., n+1)
+        interval: Intervalo [a, b] de destino
+        absolute: Si es True, convierte |a_j| * R^j (para cotas de error)
+        
+    Returns:
+        Tupla (coeficientes, intervalo de referencia)
+    """
+    power_coeffs = np.asarray(power_coeffs, dtype=float)
+    n = power_coeffs.shape[-1] - 1
+    a, b = float(interval[0]), float(interval[1])
+    matrix = power_to_bernstein_matrix(n)
+    
+    # Referencia [0, R] con q(t) = p(R*t), o [-R, 0] por reflexión con
+    # q(s) = p(-R*s), donde s = 1 corresponde a -R
+    positive_side = b >= -a
+    radius = b if positive_side else -a
+    signed_radius = radius if positive_side else -radius
+    scaled = power_coeffs * signed_radius ** np.arange(n + 1)
+    if absolute:
+        scaled = np.abs(scaled)
+    
+    reference = scaled @ matrix.T
+    if positive_side:
+        return reference, (0.0, radius)
+    return reference[..., ::-1], (-radius, 0.0)
 
 
 class BernsteinPolynomial:
@@ -19,18 +427,31 @@ class BernsteinPolynomial:
     p(x) = sum_{i=0}^n c_i * B_i^n((x-a)/(b-a))
     
     donde B_i^n(t) son los polinomios base de Bernstein.
+    
+    La clase usa __slots__ y puede envolver una vista de un array existente
+    (copy=False), de modo que crear objetos durante el aislamiento de raíces
+    no reserva memoria para los coeficientes.
     """
     
-    def __init__(self, coefficients: np.ndarray, interval: Tuple[float, float] = (0, 1)):
+    __slots__ = ('coefficients', 'degree', 'interval')
+    
+    def __init__(self, coefficients: np.ndarray, interval: Tuple[float, float] = (0, 1),
+                 copy: bool = True):
         """
         Inicializa un polinomio de Bernstein.
         
         Args:
             coefficients: Coeficientes de Bernstein [c_0, c_1, ..., c_n]
             interval: Tupla (a, b) que define el intervalo del polinomio
+            copy: Si es False y los coeficientes ya son un array float, se
+                  guarda una vista sin copiarlos (los cambios en el array
+                  original se reflejan en el polinomio)
         """
-        self.coefficients = np.array(coefficients, dtype=float)
-        self.degree = len(coefficients) - 1
+        if copy:
+            self.coefficients = np.array(coefficients, dtype=float)
+        else:
+            self.coefficients = np.asarray(coefficients, dtype=float)
+        self.degree = len(self.coefficients) - 1
         self.interval = interval
     
     @classmethod
@@ -46,62 +467,47 @@ class BernsteinPolynomial:
         Returns:
             BernsteinPolynomial en el intervalo dado
         """
-        n = len(power_coeffs) - 1
-        a, b = interval
-        
-        # Primero transformamos el polinomio al intervalo [0, 1]
-        # mediante el cambio de variable t = (x - a) / (b - a)
-        transformed_coeffs = cls._transform_to_unit_interval(power_coeffs, a, b)
-        
-        # Luego convertimos a forma de Bernstein
-        bernstein_coeffs = np.zeros(n + 1)
-        for i in range(n + 1):
-            for j in range(n + 1):
-                if j <= i:
-                    bernstein_coeffs[i] += transformed_coeffs[j] * comb(j, i) / comb(n, i)
-        
-        return cls(bernstein_coeffs, interval)
+        return cls(power_to_bernstein(power_coeffs, interval), interval, copy=False)
     
-    @staticmethod
-    def _transform_to_unit_interval(coeffs: np.ndarray, a: float, b: float) -> np.ndarray:
+    def evaluate(self, x, derivative: bool = False):
         """
-        Transforma coeficientes de potencias de [a, b] a [0, 1].
+        Evalúa el polinomio usando el algoritmo de De Casteljau.
         
-        Si p(x) = sum a_i * x^i, queremos q(t) = p(a + t*(b-a))
-        """
-        n = len(coeffs) - 1
-        h = b - a
-        new_coeffs = np.zeros(n + 1)
-        
-        # Usamos la fórmula binomial para expandir (a + t*h)^i
-        for i in range(n + 1):
-            for j in range(i, n + 1):
-                new_coeffs[i] += coeffs[j] * comb(j, i) * (a ** (j - i)) * (h ** i)
-        
-        return new_coeffs
-    
-    def evaluate(self, x: float) -> float:
-        """
-        Evalúa el polinomio en un punto x usando el algoritmo de De Casteljau.
+        Acepta un escalar o un array de puntos; en el segundo caso se hacen
+        n barridos vectorizados sobre todos los puntos a la vez.
         
         Args:
-            x: Punto donde evaluar
+            x: Punto o array de puntos donde evaluar
+            derivative: Si es True, devuelve también p'(x), que se obtiene
+                        del penúltimo nivel de De Casteljau sin coste extra
             
         Returns:
-            Valor del polinomio en x
+            p(x) con la forma de x, o la tupla (p(x), p'(x)) si derivative
         """
         a, b = self.interval
-        t = (x - a) / (b - a)
-        
-        # Algoritmo de De Casteljau
-        coeffs = self.coefficients.copy()
+        h = b - a
+        t = (np.asarray(x, dtype=float) - a) / h
         n = self.degree
         
-        for j in range(1, n + 1):
-            for i in range(n - j + 1):
-                coeffs[i] = (1 - t) * coeffs[i] + t * coeffs[i + 1]
-        
-        return coeffs[0]
+        # Algoritmo de De Casteljau: un barrido por nivel sobre todos los
+        # puntos; work tiene forma (puntos..., n+1) y los coeficientes no
+        # se modifican
+        t_col = t[..., np.newaxis]
+        work = self.coefficients
+        for _ in range(n - 1):
+            work = (1 - t_col) * work[..., :-1] + t_col * work[..., 1:]
+        
+        if n == 0:
+            value = np.broadcast_to(work[0], t.shape).copy()
+            slope = np.zeros_like(t)
+        else:
+            value = (1 - t) * work[..., 0] + t * work[..., 1]
+            slope = (n / h) * (work[..., 1] - work[..., 0])
+        
+        if t.ndim == 0:
+            value, slope = float(value), float(slope)
+        
+        return (value, slope) if derivative else value
     
     def derivative(self) -> 'BernsteinPolynomial':
         """
@@ -118,43 +524,44 @@ class BernsteinPolynomial:
         h = b - a
         
         # Coeficientes de la derivada en forma de Bernstein
-        deriv_coeffs = np.zeros(n)
-        for i in range(n):
-            deriv_coeffs[i] = (n / h) * (self.coefficients[i + 1] - self.coefficients[i])
+        deriv_coeffs = np.diff(self.coefficients)
+        deriv_coeffs *= n / h
         
-        return BernsteinPolynomial(deriv_coeffs, self.interval)
+        return BernsteinPolynomial(deriv_coeffs, self.interval, copy=False)
     
-    def subdivide(self, t: float = 0.5) -> Tuple['BernsteinPolynomial', 'BernsteinPolynomial']:
+    def restrict(self, sub_interval: Tuple[float, float]) -> 'BernsteinPolynomial':
+        """
+        Restringe el polinomio a un subintervalo sin pasar por potencias.
+        
+        Args:
+            sub_interval: Intervalo (a, b) de destino
+            
+        Returns:
+            Nuevo BernsteinPolynomial sobre sub_interval
+        """
+        coeffs = restrict(self.coefficients, self.interval, sub_interval)
+        return BernsteinPolynomial(coeffs, tuple(sub_interval), copy=False)
+    
+    def subdivide(self, t: float = 0.5,
+                  out: Optional[np.ndarray] = None) -> Tuple['BernsteinPolynomial', 'BernsteinPolynomial']:
         """
         Subdivide el polinomio en el punto t usando el algoritmo de De Casteljau.
         
         Args:
             t: Punto de subdivisión en [0, 1] (por defecto en el punto medio)
+            out: Buffer opcional (2, n+1) reutilizable; los polinomios
+                 devueltos son vistas de out[0] y out[1]
             
         Returns:
             Tupla (left_poly, right_poly) con los polinomios subdivididos
         """
-        n = self.degree
         a, b = self.interval
         split_point = a + t * (b - a)
         
-        # Matriz para almacenar los valores intermedios del algoritmo de De Casteljau
-        matrix = np.zeros((n + 1, n + 1))
-        matrix[:, 0] = self.coefficients
-        
-        # Algoritmo de De Casteljau
-        for j in range(1, n + 1):
-            for i in range(n - j + 1):
-                matrix[i, j] = (1 - t) * matrix[i, j - 1] + t * matrix[i + 1, j - 1]
+        left_coeffs, right_coeffs = de_casteljau_split(self.coefficients, t, out=out)
         
-        # Los coeficientes del polinomio izquierdo están en la primera fila
-        left_coeffs = matrix[0, :]
-        
-        # Los coeficientes del polinomio derecho están en la diagonal
-        right_coeffs = np.array([matrix[i, n - i] for i in range(n + 1)])
-        
-        left_poly = BernsteinPolynomial(left_coeffs, (a, split_point))
-        right_poly = BernsteinPolynomial(right_coeffs, (split_point, b))
+        left_poly = BernsteinPolynomial(left_coeffs, (a, split_point), copy=False)
+        right_poly = BernsteinPolynomial(right_coeffs, (split_point, b), copy=False)
         
         return left_poly, right_poly
     
@@ -174,22 +581,14 @@ class BernsteinPolynomial:
         """
         Cuenta el número de cambios de signo en la secuencia de coeficientes.
         
+        Por la propiedad de disminución de la variación, es una cota
+        superior (con la misma paridad) del número de raíces en el
+        interior del intervalo.
+        
         Returns:
             Número de cambios de signo
         """
-        signs = np.sign(self.coefficients)
-        # Eliminar ceros
-        signs = signs[signs != 0]
-        
-        if len(signs) <= 1:
-            return 0
-        
-        changes = 0
-        for i in range(len(signs) - 1):
-            if signs[i] * signs[i + 1] < 0:
-                changes += 1
-        
-        return changes
+        return count_sign_changes(self.coefficients)
     
     def to_power_basis(self) -> np.ndarray:
         """
@@ -199,23 +598,12 @@ class BernsteinPolynomial:
             Array con coeficientes [a_0, a_1, ..., a_n]
         """
         n = self.degree
-        power_coeffs = np.zeros(n + 1)
-        
-        for j in range(n + 1):
-            for i in range(j + 1):
-                sign = (-1) ** (j - i)
-                power_coeffs[j] += sign * comb(n, j) * comb(j, i) * self.coefficients[i]
-        
         a, b = self.interval
         h = b - a
         
-        # Transformar de [0, 1] a [a, b]
-        scaled_coeffs = np.zeros(n + 1)
-        for i in range(n + 1):
-            for j in range(i, n + 1):
-                scaled_coeffs[j] += power_coeffs[i] * comb(j, i) * ((-a) ** (j - i)) / (h ** i)
-        
-        return scaled_coeffs
+        # Pasar a potencias en [0, 1] y deshacer el cambio t = (x - a) / h
+        power_coeffs = bernstein_to_power_matrix(n) @ self.coefficients
+        return affine_substitution_matrix(n, -a / h, 1 / h) @ power_coeffs
     
     def __repr__(self) -> str:
         return f"BernsteinPolynomial(degree={self.degree}, interval={self.interval})"
@@ -0,0 +1,189 @@
+"""
+Caché de resultados
+===================
+
+Caché LRU acotada, con caducidad opcional, para los resultados de
+find_roots. La clave es un hash de los bytes de los coeficientes junto
+con el intervalo y las opciones del solver, de modo que resolver de
+nuevo un polinomio idéntico se reduce a una búsqueda en un diccionario.
+El contenido puede guardarse en disco en formato JSON.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+import numpy as np
+
+
+# Tamaño máximo por defecto (número de entradas)
+DEFAULT_MAXSIZE = 1024
+
+
+def cache_key(power_coeffs: np.ndarray, interval, **options) -> str:
+    """
+    Clave de caché de un problema de búsqueda de raíces.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n]
+        interval: Intervalo de búsqueda (a, b)
+        **options: Opciones del solver que afectan al resultado
+        
+    Returns:
+        Cadena hexadecimal
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(power_coeffs, dtype=float).tobytes())
+    digest.update(np.asarray(interval, dtype=float).tobytes())
+    digest.update(repr(sorted(options.items())).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados con caducidad y persistencia opcionales.
+    
+    Example:
+        >>> cache = ResultCache(maxsize=256, ttl=3600)
+        >>> roots = find_roots([-6, 11, -6, 1], (0, 4), cache=cache)
+        >>> roots = find_roots([-6, 11, -6, 1], (0, 4), cache=cache)
+        >>> cache.get_statistics()['hits']  # 1
+    """
+    
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE,
+                 ttl: Optional[float] = None,
+                 path: Optional[str] = None):
+        """
+        Inicializa la caché.
+        
+        Args:
+            maxsize: Número máximo de entradas; al superarlo se descarta
+                     la usada hace más tiempo
+            ttl: Segundos de validez de cada entrada (None: sin caducidad)
+            path: Fichero JSON de persistencia; si existe se carga
+            
+        Raises:
+            ValueError: Si maxsize es menor que 1 o ttl no es positivo
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize debe ser >= 1, recibido {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl debe ser positivo, recibido {ttl}")
+        
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if path is not None and os.path.exists(path):
+            self.load(path)
+    
+    def get(self, key: Hashable):
+        """
+        Devuelve el valor de una clave o None si no está o ha caducado.
+        
+        Args:
+            key: Clave (ver cache_key)
+            
+        Returns:
+            Valor almacenado o None
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry[0]):
+            del self._entries[key]
+            entry = None
+        
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key: Hashable, value) -> None:
+        """
+        Almacena un valor, descartando la entrada menos reciente si hace falta.
+        
+        Args:
+            key: Clave (ver cache_key)
+            value: Valor serializable en JSON
+        """
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """
+        Vacía la caché y reinicia las estadísticas.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_statistics(self) -> Dict:
+        """
+        Devuelve estadísticas de uso.
+        
+        Returns:
+            Diccionario con hits, misses, evictions, size y hit_ratio
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'hit_ratio': self.hits / lookups if lookups else None,
+        }
+    
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Guarda las entradas vigentes en un fichero JSON.
+        
+        Args:
+            path: Fichero de destino (por defecto el de la construcción)
+            
+        Raises:
+            ValueError: Si no se indica fichero
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No se ha indicado fichero de persistencia")
+        
+        entries = [[key, stamp, value] for key, (stamp, value) in self._entries.items()
+                   if not self._expired(stamp)]
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'entries': entries}, f)
+        os.replace(tmp, path)
+    
+    def load(self, path: Optional[str] = None) -> None:
+        """
+        Añade las entradas vigentes de un fichero JSON.
+        
+        Args:
+            path: Fichero de origen (por defecto el de la construcción)
+        """
+        path = path or self.path
+        with open(path) as f:
+            data = json.load(f)
+        for key, stamp, value in data['entries']:
+            if not self._expired(stamp):
+                self._entries[key] = (stamp, value)
+                self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def _expired(self, stamp: float) -> bool:
+        return self.ttl is not None and time.time() - stamp > self.ttl
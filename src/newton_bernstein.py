@@ -6,15 +6,53 @@ Implementación del algoritmo de Newton-Bernstein para encontrar todas las
 raíces de un polinomio en un intervalo dado.
 """
 
+import math
 import numpy as np
-from typing import List, Tuple, Optional
-from .bernstein import BernsteinPolynomial
+from contextlib import nullcontext
+from typing import Callable, Dict, List, Tuple, Optional
+from .bernstein import (
+    de_casteljau_split, power_to_bernstein,
+    conversion_error_bound, bezier_clip, quadratic_clip, restrict_rows
+)
+from .parallel import (
+    resolve_workers, parallel_find_roots, parallel_find_roots_batch, OVERLAP
+)
+from .profiling import Profiler
+from .cache import ResultCache, cache_key
+from .backends import (
+    backend_scalar, power_to_bernstein_generic, de_casteljau_split_generic,
+    sign_changes_generic, horner_generic
+)
 from .utils import (
-    newton_raphson, is_in_interval, merge_close_roots,
-    polynomial_from_coeffs, polynomial_derivative_coeffs
+    newton_raphson_fused, newton_raphson_batch, is_in_interval,
+    merge_close_roots, polynomial_from_coeffs, polynomial_derivative_coeffs,
+    polynomial_with_derivative, horner_with_derivative, sign_changes, root_bound
 )
 
 
+# Iteraciones de Newton sobre el polinomio original al deshacer x -> 1/x
+RECIPROCAL_POLISH_ITER = 3
+
+# Estrategias de reducción de intervalos disponibles
+STRATEGIES = ("bisect", "clip", "quadclip")
+
+# Un recorte que conserva más de esta fracción del intervalo se sustituye
+# por una bisección (indica varias raíces próximas)
+CLIP_MAX_RATIO = 0.5
+
+# Punto de subdivisión del modo certificado, ligeramente descentrado para
+# que las raíces en puntos diádicos no caigan en un extremo (donde el signo
+# no es fiable y la unicidad no puede demostrarse)
+CERTIFY_SPLIT = 0.499
+
+# Iteraciones máximas del operador de Newton por intervalos
+INTERVAL_NEWTON_ITER = 60
+
+# Factor de seguridad sobre la cota de redondeo de Horner al decidir si
+# p y sus derivadas se anulan numéricamente en el centro de un cúmulo
+CLUSTER_SAFETY = 16
+
+
 class NewtonBernstein:
     """
     Clase que implementa el algoritmo de Newton-Bernstein para encontrar
@@ -23,7 +61,12 @@ class NewtonBernstein:
     
     def __init__(self, power_coefficients: np.ndarray, 
                  tolerance: float = 1e-10,
-                 max_subdivisions: int = 100):
+                 max_subdivisions: int = 100,
+                 strategy: str = "bisect",
+                 profile: bool = False,
+                 profile_callback: Optional[Callable[[str, Dict], None]] = None,
+                 backend: str = "float64",
+                 cache: Optional[ResultCache] = None):
         """
         Inicializa el solver de Newton-Bernstein.
         
@@ -32,28 +75,72 @@ class NewtonBernstein:
                                donde p(x) = a_0 + a_1*x + ... + a_n*x^n
             tolerance: Tolerancia para considerar una raíz encontrada
             max_subdivisions: Número máximo de subdivisiones permitidas
+            strategy: "bisect" (bisección y Newton), "clip" (recorte de
+                      Bézier) o "quadclip" (recorte cuadrático)
+            profile: Activa la instrumentación (nodos por profundidad,
+                     tiempos por fase, histograma de Newton); desactivada
+                     no añade coste
+            profile_callback: Función callback(evento, datos) que recibe
+                              cada nivel y el resumen final; implica profile
+            backend: Aritmética para los subintervalos en los que la prueba
+                     de signos en float64 no es concluyente: "float64" (sin
+                     cambio), "longdouble", "fraction" (exacta) o "mpmath".
+                     El refinamiento final se hace en float64
+            cache: ResultCache opcional; find_roots devuelve el resultado
+                   almacenado si ya se resolvió el mismo polinomio con el
+                   mismo intervalo y opciones (los contadores quedan a 0)
+                     
+        Raises:
+            ValueError: Si la estrategia o el backend no existen
+            ImportError: Si el backend "mpmath" no está disponible
         """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estrategia desconocida: {strategy!r}; "
+                             f"opciones: {', '.join(STRATEGIES)}")
+        
+        self.backend = backend
+        self._scalar = backend_scalar(backend)
+        
         self.power_coeffs = np.array(power_coefficients, dtype=float)
         self.degree = len(power_coefficients) - 1
         self.tolerance = tolerance
         self.max_subdivisions = max_subdivisions
+        self.strategy = strategy
         
         # Preparar función y derivada para Newton
         self.f = polynomial_from_coeffs(self.power_coeffs)
         deriv_coeffs = polynomial_derivative_coeffs(self.power_coeffs)
         self.df = polynomial_from_coeffs(deriv_coeffs)
+        self.fdf = polynomial_with_derivative(self.power_coeffs)
         
         # Estadísticas
         self.num_subdivisions = 0
         self.num_newton_steps = 0
         self.num_exclusions = 0
+        self.num_clips = 0
+        self.num_certified = 0
+        self.num_clusters = 0
+        self.num_extended = 0
+        self.uncertified_enclosures = []
+        self.clusters = []
+        self._derivative_chain = [self.power_coeffs]
+        
+        # Instrumentación opcional
+        self.profiler = (Profiler(profile_callback)
+                         if profile or profile_callback is not None else None)
+        self.cache = cache
     
-    def find_roots(self, interval: Tuple[float, float]) -> List[float]:
+    def find_roots(self, interval: Tuple[float, float],
+                   workers: Optional[int] = 1) -> List[float]:
         """
         Encuentra todas las raíces del polinomio en el intervalo dado.
         
         Args:
             interval: Tupla (a, b) que define el intervalo de búsqueda
+            workers: Número de procesos; con más de uno el intervalo se
+                     reparte entre procesos; las estadísticas, los
+                     cúmulos y el perfil de cada proceso se combinan.
+                     None usa todos los núcleos
             
         Returns:
             Lista ordenada de raíces encontradas
@@ -61,82 +148,764 @@ class NewtonBernstein:
         self.num_subdivisions = 0
         self.num_newton_steps = 0
         self.num_exclusions = 0
+        self.num_clips = 0
+        self.num_certified = 0
+        self.num_clusters = 0
+        self.num_extended = 0
+        self.clusters = []
+        
+        workers = resolve_workers(workers)
+        if self.cache is None:
+            return self._find_roots_uncached(interval, workers)
         
-        roots = self._find_roots_recursive(interval, depth=0)
+        key = cache_key(self.power_coeffs, interval, tolerance=self.tolerance,
+                        max_subdivisions=self.max_subdivisions,
+                        strategy=self.strategy, backend=self.backend)
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.clusters = [tuple(cluster) for cluster in cached['clusters']]
+            return list(cached['roots'])
+        
+        roots = self._find_roots_uncached(interval, workers)
+        self.cache.put(key, {'roots': [float(r) for r in roots],
+                             'clusters': [list(cluster) for cluster in self.clusters]})
+        return roots
+    
+    def _find_roots_uncached(self, interval: Tuple[float, float],
+                             workers: int) -> List[float]:
+        """
+        Búsqueda de raíces sin consultar la caché (ver find_roots).
+        """
+        prof = self.profiler
+        if prof is not None:
+            prof.reset()
+        
+        if workers > 1:
+            # Los perfiles y los cúmulos de cada proceso se combinan aquí;
+            # el callback solo recibe el resumen final, no los niveles
+            roots, totals, clusters, profiles = parallel_find_roots(
+                self.power_coeffs, interval, workers,
+                tolerance=self.tolerance,
+                max_subdivisions=self.max_subdivisions,
+                strategy=self.strategy,
+                backend=self.backend,
+                profile=prof is not None
+            )
+            for key, value in totals.items():
+                setattr(self, key, value)
+            self.clusters = clusters
+            if prof is not None:
+                for data in profiles:
+                    prof.merge(data)
+                prof.finish()
+            return roots
+        
+        # La conversión a la base de Bernstein se hace una sola vez; los
+        # subintervalos se obtienen subdividiendo los coeficientes del padre
+        with _phase(prof, "conversion"):
+            _, lo, hi, coeffs, noise = _initial_frontier(
+                self.power_coeffs[np.newaxis, :], interval
+            )
+        roots = self._find_roots_iterative(lo, hi, coeffs, noise)
         
         # Fusionar raíces cercanas y ordenar
-        roots = merge_close_roots(roots, self.tolerance)
+        with _phase(prof, "merge"):
+            roots = merge_close_roots(roots, self.tolerance)
+        
+        if prof is not None:
+            prof.finish()
         
         return sorted(roots)
     
-    def _find_roots_recursive(self, interval: Tuple[float, float], 
-                             depth: int) -> List[float]:
+    def find_roots_with_multiplicity(self, interval: Tuple[float, float]) -> List[Tuple[float, int]]:
         """
-        Búsqueda recursiva de raíces usando Newton-Bernstein.
+        Encuentra las raíces del intervalo junto con su multiplicidad.
+        
+        Las raíces múltiples (y los cúmulos de raíces más próximas de lo
+        que la tolerancia permite separar) se detectan durante el
+        aislamiento y se devuelven una sola vez, con multiplicidad k.
         
         Args:
-            interval: Intervalo actual [a, b]
-            depth: Profundidad de recursión actual
+            interval: Tupla (a, b) que define el intervalo de búsqueda
             
         Returns:
-            Lista de raíces encontradas en este intervalo
+            Lista ordenada de tuplas (raíz, multiplicidad)
+        """
+        roots = self.find_roots(interval)
+        result = []
+        for root in roots:
+            multiplicity = 1
+            for center, k in self.clusters:
+                if abs(center - root) <= self.tolerance:
+                    multiplicity = max(multiplicity, k)
+            result.append((root, multiplicity))
+        return result
+    
+    def find_root_enclosures(self, interval: Tuple[float, float]) -> List[Tuple[float, float]]:
         """
-        a, b = interval
+        Encuentra intervalos que contienen, de forma certificada, una raíz única.
         
-        # Verificar profundidad máxima
-        if depth > self.max_subdivisions:
-            # Retornar punto medio si el intervalo es suficientemente pequeño
-            if b - a < self.tolerance:
-                mid = (a + b) / 2
-                if abs(self.f(mid)) < self.tolerance:
-                    return [mid]
-            return []
+        Para cada subintervalo X en el que p' tiene signo constante (según
+        su envolvente de Bernstein, ensanchada con una cota absoluta del
+        error de p', o según su evaluación por intervalos) se aplica el
+        operador de Newton por intervalos N(X) = m - P(m) / P'(X), con P(m)
+        y P'(X) evaluados por intervalos con redondeo hacia fuera. Si N(X) queda en
+        el interior de X, X contiene exactamente una raíz (Krawczyk); el
+        intervalo deja de subdividirse y se estrecha con X <- X ∩ N(X)
+        hasta la tolerancia. Si X ∩ N(X) es vacío, X no contiene raíces.
+        
+        Un intervalo solo se descarta si el signo de sus coeficientes es
+        fiable o si N(X) lo excluye. Los intervalos diminutos en los que no
+        se ha podido demostrar la unicidad (p. ej. raíces múltiples) y los
+        que float64 no puede decidir (coeficientes dentro de la cota de
+        redondeo incluso tras reconvertirlos) no se devuelven; quedan,
+        unidos si son contiguos, en self.uncertified_enclosures.
+        
+        Args:
+            interval: Tupla (a, b) que define el intervalo de búsqueda
+            
+        Returns:
+            Lista ordenada de intervalos (lo, hi), cada uno con una raíz
+        """
+        self.num_subdivisions = 0
+        self.num_newton_steps = 0
+        self.num_exclusions = 0
+        self.num_clips = 0
+        self.num_certified = 0
+        self.uncertified_enclosures = []
+        
+        _, lo, hi, coeffs, noise = _initial_frontier(
+            self.power_coeffs[np.newaxis, :], interval
+        )
+        enclosures = []
+        n = self.degree
+        eps = np.finfo(float).eps
+        
+        # Cota absoluta del error de la envolvente de p'. El error de la
+        # conversión es una perturbación δ de p con coeficientes <= noise en
+        # la pieza inicial, de modo que |δ'| <= 2 n noise / h_0 en todos sus
+        # subintervalos; cada subdivisión añade su propio redondeo
+        slope = 2 * n * noise / (hi - lo)
+        
+        for depth in range(self.max_subdivisions + 1):
+            if len(lo) == 0:
+                break
+            
+            excluded, _ = _classify_rows(coeffs, noise)
+            
+            # Polígono de un solo signo sin margen sobre la cota de redondeo:
+            # no prueba nada. Se reconvierte desde la base de potencias en el
+            # propio intervalo, cuya cota de error local suele ser mucho menor
+            # que la de la pieza inicial. Si todos los coeficientes siguen en
+            # el ruido, subdividir no aporta información en float64 y el
+            # intervalo queda como candidato dudoso
+            weak = np.flatnonzero(~excluded & (sign_changes(coeffs) == 0))
+            unresolved = weak[:0]
+            if len(weak) > 0:
+                pieces = list(zip(lo[weak], hi[weak]))
+                coeffs[weak] = [power_to_bernstein(self.power_coeffs, piece) for piece in pieces]
+                noise[weak] = [conversion_error_bound(self.power_coeffs, piece) for piece in pieces]
+                slope[weak] = 2 * n * noise[weak] / (hi[weak] - lo[weak])
+                excluded[weak], _ = _classify_rows(coeffs[weak], noise[weak])
+                unresolved = weak[~excluded[weak] & _noise_rows(coeffs[weak], noise[weak])]
+                self.uncertified_enclosures.extend(zip(lo[unresolved], hi[unresolved]))
+            
+            self.num_exclusions += int(np.count_nonzero(excluded))
+            excluded[unresolved] = True
+            lo, hi, coeffs = lo[~excluded], hi[~excluded], coeffs[~excluded]
+            noise, slope = noise[~excluded], slope[~excluded]
+            
+            # Envolvente de p' ensanchada con la cota de su error y con el
+            # redondeo de su propio cálculo
+            width = hi - lo
+            d_lo, d_hi = _derivative_hull(coeffs, width)
+            pad = slope + 4 * eps * np.maximum(np.abs(d_lo), np.abs(d_hi))
+            d_lo, d_hi = d_lo - pad, d_hi + pad
+            
+            # Test de unicidad: el operador solo está definido donde p' tiene
+            # signo constante según la envolvente o la evaluación por
+            # intervalos; en el resto el intervalo se subdivide
+            new_lo, new_hi, certified, empty = self._interval_newton(lo, hi, d_lo, d_hi)
+            self.num_certified += int(np.count_nonzero(certified))
+            self.num_exclusions += int(np.count_nonzero(empty))
+            enclosures.extend(zip(new_lo[certified], new_hi[certified]))
+            resolved = certified | empty
+            
+            # Sin certificar y por debajo de la tolerancia: candidatos dudosos
+            doubtful = ~resolved & (width < self.tolerance)
+            self.uncertified_enclosures.extend(zip(lo[doubtful], hi[doubtful]))
+            
+            split = ~(resolved | doubtful)
+            lo, hi, coeffs = lo[split], hi[split], coeffs[split]
+            noise, slope = noise[split], slope[split]
+            self.num_subdivisions += len(lo)
+            cut = lo + CERTIFY_SPLIT * (hi - lo)
+            
+            # El redondeo de la subdivisión (n promedios por coeficiente) se
+            # suma a la cota del error de p' de los dos hijos
+            rounding = 2 * n * (n + 1) * eps * np.abs(coeffs).max(axis=1)
+            halves = np.empty((2,) + coeffs.shape)
+            de_casteljau_split(coeffs, CERTIFY_SPLIT, out=halves)
+            lo, hi = np.concatenate((lo, cut)), np.concatenate((cut, hi))
+            coeffs = halves.reshape(-1, coeffs.shape[-1])
+            noise = np.concatenate((noise, noise))
+            slope = np.concatenate((slope, slope)) + np.concatenate((rounding, rounding)) / (hi - lo)
+        
+        # Una raíz simple en una frontera de subdivisión (p. ej. en el
+        # origen) deja candidatos a ambos lados: se reintenta la
+        # certificación sobre un entorno que los contiene
+        if self.uncertified_enclosures:
+            doubtful = np.array(self.uncertified_enclosures, dtype=float)
+            margin = 16 * (doubtful[:, 1] - doubtful[:, 0]) + self.tolerance
+            new_lo, new_hi, certified, _ = self._interval_newton(
+                doubtful[:, 0] - margin, doubtful[:, 1] + margin
+            )
+            inside = certified & (new_hi >= interval[0]) & (new_lo <= interval[1])
+            enclosures.extend(zip(new_lo[inside], new_hi[inside]))
+        
+        # Cada raíz se devuelve una vez; un candidato dudoso que toca una
+        # raíz certificada es esa misma raíz
+        unique = []
+        for e_lo, e_hi in sorted((float(l), float(h)) for l, h in enclosures):
+            if unique and e_lo <= unique[-1][1]:
+                unique[-1] = (max(unique[-1][0], e_lo), min(unique[-1][1], e_hi))
+            else:
+                unique.append((e_lo, e_hi))
+        self.num_certified = len(unique)
+        
+        # Los candidatos dudosos contiguos (p. ej. las piezas alrededor de
+        # una raíz doble) se unen en un solo intervalo
+        doubtful = []
+        for l, h in sorted((float(l), float(h)) for l, h in self.uncertified_enclosures):
+            if any(l <= e_hi and e_lo <= h for e_lo, e_hi in unique):
+                continue
+            if doubtful and l <= doubtful[-1][1]:
+                doubtful[-1] = (doubtful[-1][0], max(doubtful[-1][1], h))
+            else:
+                doubtful.append((l, h))
+        self.uncertified_enclosures = doubtful
+        
+        return unique
+    
+    def _interval_newton(self, lo: np.ndarray, hi: np.ndarray,
+                         hull_lo: Optional[np.ndarray] = None,
+                         hull_hi: Optional[np.ndarray] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Operador de Newton por intervalos sobre intervalos con p' ≠ 0.
         
-        # Convertir a forma de Bernstein
-        bernstein_poly = BernsteinPolynomial.from_power_basis(
-            self.power_coeffs, interval
+        P(m) y P'(X) se acotan con aritmética de intervalos (Horner con
+        redondeo hacia fuera) en la base de potencias. P'(X) se intersecta
+        con la envolvente de Bernstein del intervalo inicial, más ajustada
+        en intervalos anchos y válida también en sus subintervalos.
+        
+        Args:
+            lo, hi: Extremos de los intervalos
+            hull_lo, hull_hi: Cota opcional de p' en cada intervalo inicial
+            
+        Returns:
+            Tupla (lo, hi, certificado, vacío): intervalos estrechados, si se
+            ha demostrado una raíz única y si se ha demostrado que no hay raíz
+        """
+        lo, hi = lo.copy(), hi.copy()
+        if hull_lo is None:
+            hull_lo = np.full(len(lo), -np.inf)
+            hull_hi = np.full(len(lo), np.inf)
+        certified = np.zeros(len(lo), dtype=bool)
+        empty = np.zeros(len(lo), dtype=bool)
+        active = np.arange(len(lo))
+        
+        coeffs = self.power_coeffs
+        deriv = polynomial_derivative_coeffs(coeffs)
+        deriv_lo = np.nextafter(deriv, -np.inf)
+        deriv_hi = np.nextafter(deriv, np.inf)
+        
+        for _ in range(INTERVAL_NEWTON_ITER):
+            if len(active) == 0:
+                break
+            
+            a, b = lo[active], hi[active]
+            m = (a + b) / 2
+            f_lo, f_hi = _interval_horner(coeffs, coeffs, m, m)
+            d_lo, d_hi = _interval_horner(deriv_lo, deriv_hi, a, b)
+            d_lo = np.maximum(d_lo, hull_lo[active])
+            d_hi = np.minimum(d_hi, hull_hi[active])
+            self.num_newton_steps += len(active)
+            
+            # Cociente de intervalos [f_lo, f_hi] / [d_lo, d_hi]; si 0 ∈ P'(X)
+            # el operador no está definido y el intervalo se deja sin tocar
+            defined = (d_lo > 0) | (d_hi < 0)
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                quotients = np.stack((f_lo / d_lo, f_lo / d_hi, f_hi / d_lo, f_hi / d_hi))
+            n_lo = np.nextafter(m - np.nextafter(quotients.max(axis=0), np.inf), -np.inf)
+            n_hi = np.nextafter(m - np.nextafter(quotients.min(axis=0), -np.inf), np.inf)
+            n_lo, n_hi = np.where(defined, n_lo, a), np.where(defined, n_hi, b)
+            
+            certified[active] |= defined & (n_lo > a) & (n_hi < b)
+            new_lo, new_hi = np.maximum(a, n_lo), np.minimum(b, n_hi)
+            
+            no_root = defined & ~(new_lo <= new_hi) & ~certified[active]
+            empty[active[no_root]] = True
+            
+            # Se sigue estrechando mientras el intervalo se reduzca de forma
+            # apreciable y no haya alcanzado la tolerancia
+            keep = ~no_root & ((new_hi - new_lo) < 0.75 * (b - a))
+            lo[active[keep]], hi[active[keep]] = new_lo[keep], new_hi[keep]
+            narrow = (new_hi - new_lo) <= self.tolerance
+            active = active[keep & ~narrow]
+        
+        return lo, hi, certified, empty
+    
+    def _find_roots_iterative(self, lo: np.ndarray, hi: np.ndarray,
+                              coeffs: np.ndarray, noise: np.ndarray) -> List[float]:
+        """
+        Búsqueda de raíces por niveles sobre una frontera de subintervalos.
+        
+        Cada nivel de subdivisión se procesa con operaciones vectoriales
+        sobre arrays (k, n+1) de coeficientes, sin recursión de Python.
+        
+        Args:
+            lo: Extremos izquierdos de los intervalos iniciales
+            hi: Extremos derechos de los intervalos iniciales
+            coeffs: Coeficientes de Bernstein, uno por fila
+            noise: Cota del error de redondeo de los coeficientes de cada fila
+            
+        Returns:
+            Lista de raíces encontradas (sin ordenar ni fusionar)
+        """
+        roots = []
+        clusters = {key: [] for key in ('center', 'order', 'lo', 'hi')}
+        prof = self.profiler
+        
+        # Intervalos anclados: mitades de un intervalo de un solo signo
+        # junto al extremo (izquierdo si toward_lo) en el que p y p' se anulan
+        anchored = np.zeros(len(lo), dtype=bool)
+        toward_lo = np.zeros(len(lo), dtype=bool)
+        
+        for depth in range(self.max_subdivisions + 1):
+            if len(lo) == 0:
+                break
+            
+            with _phase(prof, "bounds"):
+                # Regla de Descartes sobre los coeficientes de Bernstein: sin
+                # variaciones de signo no hay raíz; con una sola hay
+                # exactamente una raíz y el intervalo pasa al refinamiento
+                excluded, single = _classify_rows(coeffs, noise)
+                
+                # Los intervalos diminutos (p. ej. un recorte que colapsa
+                # sobre la raíz, con todos los coeficientes ~0) se deciden por |p|
+                tiny = (hi - lo) < self.tolerance
+                excluded &= ~tiny
+                num_excluded = int(np.count_nonzero(excluded))
+                self.num_exclusions += num_excluded
+                if prof is not None:
+                    prof.record_level(depth, len(lo), num_excluded)
+                lo, hi, coeffs = lo[~excluded], hi[~excluded], coeffs[~excluded]
+                noise, single = noise[~excluded], single[~excluded]
+                tiny = tiny[~excluded]
+                anchored, toward_lo = anchored[~excluded], toward_lo[~excluded]
+                single &= ~anchored
+                
+                # Si el intervalo es muy pequeño, usar el punto medio
+                roots.extend(self._accept_midpoints(lo[tiny], hi[tiny], single[tiny]))
+                solved = tiny.copy()
+                
+                # Raíces múltiples y cúmulos: se aceptan en cuanto se
+                # identifican, sin descender hasta el tamaño de la
+                # tolerancia. Se buscan antes de decidir por los extremos,
+                # porque una raíz doble en un punto de subdivisión deja a
+                # ambos lados intervalos de un solo signo, o de una
+                # variación si el redondeo cambia el signo del extremo
+                pending = np.flatnonzero(~solved & (~single | _unreliable_rows(coeffs, noise)))
+                cluster, centers, orders, radii = _detect_clusters(
+                    lambda j, rows: self._derivative_coeffs(j), lo[pending], hi[pending],
+                    coeffs[pending], noise[pending], self.tolerance
+                )
+                rows = pending[cluster]
+                centers, orders, radii = centers[cluster], orders[cluster], radii[cluster]
+                for key, value in (('center', centers), ('order', orders),
+                                   ('lo', np.minimum(lo[rows], centers - radii)),
+                                   ('hi', np.maximum(hi[rows], centers + radii))):
+                    clusters[key].append(value)
+                solved[rows] = True
+                
+                # Polígono de control de un solo signo pero con coeficientes
+                # dentro de la cota de redondeo: ese signo no excluye nada y
+                # se decide con p en los extremos (en otro backend estos
+                # intervalos pasan a la aritmética extendida)
+                shrink = np.zeros(len(lo), dtype=bool)
+                if self.backend == "float64":
+                    flat = np.flatnonzero(~solved & ~single & ~anchored &
+                                          (sign_changes(coeffs) == 0))
+                    found, decided, toward_lo[flat] = self._resolve_noise_rows(lo[flat], hi[flat])
+                    roots.extend(found)
+                    shrink[flat[~decided]] = True
+                    solved[flat] = True
+                
+                # Un intervalo anclado solo busca el cúmulo de su extremo:
+                # se sigue reduciendo mientras p y p' se anulen en él
+                rows = np.flatnonzero(~solved & anchored)
+                if len(rows) > 0:
+                    shrink[rows] = _double_root_at(
+                        self.power_coeffs, self._derivative_coeffs(1),
+                        np.where(toward_lo[rows], lo[rows], hi[rows]), self.degree
+                    )
+                solved |= anchored
+            
+            # Todos los intervalos con una raíz del nivel se refinan a la vez
+            # (en los modos de recorte, el propio recorte hace de refinamiento)
+            candidates = np.flatnonzero(~solved & single)
+            if self.strategy == "bisect" and len(candidates) > 0:
+                with _phase(prof, "newton"):
+                    iterations = (np.zeros(len(candidates), dtype=int)
+                                  if prof is not None else None)
+                    found, converged = newton_raphson_batch(
+                        self.power_coeffs, lo[candidates], hi[candidates],
+                        tol=self.tolerance,
+                        max_iter=100,
+                        iterations=iterations
+                    )
+                    if prof is not None:
+                        prof.record_newton(iterations)
+                    self.num_newton_steps += len(candidates)
+                    roots.extend(found[converged])
+                    solved[candidates[converged]] = True
+                    
+                    # Sin cambio de signo numérico en los extremos (p. ej.
+                    # junto a una raíz múltiple): Newton desde el punto
+                    # medio con |p| < tol
+                    for i in candidates[~converged]:
+                        root, ok = newton_raphson_fused(
+                            self.fdf, (lo[i] + hi[i]) / 2,
+                            tol=self.tolerance,
+                            max_iter=50
+                        )
+                        if ok and is_in_interval(root, (lo[i], hi[i]), margin=self.tolerance):
+                            roots.append(root)
+                            solved[i] = True
+            
+            # Intervalos pendientes cuyo patrón de signos en float64 no es
+            # fiable: el aislamiento continúa en el backend extendido
+            if self.backend != "float64":
+                handoff = ~solved & _unreliable_rows(coeffs, noise)
+                if handoff.any():
+                    with _phase(prof, "extended"):
+                        roots.extend(self._isolate_extended(lo[handoff], hi[handoff], depth))
+                    solved |= handoff
+            
+            with _phase(prof, "subdivision"):
+                near = self._shrink(lo[shrink], hi[shrink], coeffs[shrink],
+                                    noise[shrink], toward_lo[shrink])
+                toward_lo = toward_lo[shrink]
+                lo, hi, coeffs = lo[~solved], hi[~solved], coeffs[~solved]
+                noise = noise[~solved]
+                if prof is not None:
+                    prof.subdivided += len(lo) + len(toward_lo)
+                if self.strategy == "bisect":
+                    lo, hi, coeffs, noise = self._bisect(lo, hi, coeffs, noise)
+                else:
+                    lo, hi, coeffs, noise = self._clip(lo, hi, coeffs, noise)
+                anchored = np.arange(len(lo) + len(toward_lo)) >= len(lo)
+                toward_lo = np.concatenate((np.zeros(len(lo), dtype=bool), toward_lo))
+                lo, hi, coeffs, noise = (np.concatenate(pair) for pair in
+                                         zip((lo, hi, coeffs, noise), near))
+        
+        # Profundidad máxima alcanzada: solo se aceptan intervalos diminutos
+        tiny = (hi - lo) < self.tolerance
+        roots.extend(self._accept_midpoints(lo[tiny], hi[tiny]))
+        
+        # Cada raíz múltiple se devuelve una sola vez, como cúmulo
+        clusters = {key: np.concatenate(value) if value else np.zeros(0)
+                    for key, value in clusters.items()}
+        clusters['owner'] = np.zeros(len(clusters['center']), dtype=int)
+        roots = np.asarray(roots, dtype=float)
+        _, roots, merged = _merge_clusters(
+            np.zeros(len(roots), dtype=int), roots, clusters, self.tolerance
         )
+        self.num_clusters = len(merged['center'])
+        self.clusters = [(float(c), int(k)) for c, k in zip(merged['center'], merged['order'])]
         
-        # Obtener cotas del polinomio
-        min_val, max_val = bernstein_poly.bounds()
+        return list(roots) + list(merged['center'])
+    
+    def _resolve_noise_rows(self, lo: np.ndarray,
+                            hi: np.ndarray) -> Tuple[List[float], np.ndarray, np.ndarray]:
+        """
+        Decide los intervalos de un solo signo con coeficientes en el ruido.
         
-        # Criterio de exclusión: si todos los coeficientes tienen el mismo signo
-        if min_val > 0 or max_val < 0:
-            self.num_exclusions += 1
-            return []
+        El signo de los coeficientes no es fiable, pero sí el de p evaluado
+        con Horner en los extremos, cuyo error es en general muy inferior a
+        la cota de la conversión: si cambia, el intervalo encierra una raíz
+        y se refina con Newton salvaguardado; si no, se descarta, salvo que
+        p y p' se anulen en un extremo dentro del redondeo de Horner. Ese
+        intervalo queda sin decidir, ya que la raíz del extremo puede ser
+        múltiple, y se reduce a la mitad junto a ese extremo.
         
-        # Si el intervalo es muy pequeño, retornar el punto medio
-        if b - a < self.tolerance:
-            mid = (a + b) / 2
-            if abs(self.f(mid)) < self.tolerance:
-                return [mid]
-            return []
-        
-        # Intentar método de Newton desde el punto medio
-        mid = (a + b) / 2
-        root, converged = newton_raphson(
-            self.f, self.df, mid, 
-            tol=self.tolerance, 
-            max_iter=50
+        Args:
+            lo, hi: Extremos de los intervalos
+            
+        Returns:
+            Tupla (raíces encontradas, intervalos decididos, intervalos
+            que se reducen hacia lo y no hacia hi)
+        """
+        if len(lo) == 0:
+            return [], np.ones(0, dtype=bool), np.zeros(0, dtype=bool)
+        
+        f_lo, _ = horner_with_derivative(self.power_coeffs, lo)
+        f_hi, _ = horner_with_derivative(self.power_coeffs, hi)
+        derivative = self._derivative_coeffs(1)
+        double_lo = _double_root_at(self.power_coeffs, derivative, lo, self.degree)
+        double_hi = _double_root_at(self.power_coeffs, derivative, hi, self.degree)
+        bracketed = f_lo * f_hi <= 0
+        decided = (f_lo * f_hi < 0) | ~(double_lo | double_hi)
+        if not bracketed.any():
+            return [], decided, double_lo
+        
+        count = int(np.count_nonzero(bracketed))
+        iterations = np.zeros(count, dtype=int) if self.profiler is not None else None
+        found, converged = newton_raphson_batch(
+            self.power_coeffs, lo[bracketed], hi[bracketed], tol=self.tolerance,
+            iterations=iterations
+        )
+        if self.profiler is not None:
+            self.profiler.record_newton(iterations)
+        self.num_newton_steps += count
+        return list(found[converged]), decided, double_lo
+    
+    def _isolate_extended(self, lo: np.ndarray, hi: np.ndarray, depth: int) -> List[float]:
+        """
+        Aísla raíces con la aritmética del backend y las refina en float64.
+        
+        Cada intervalo se convierte a Bernstein directamente desde la base
+        de potencias en el backend y se subdivide mientras tenga dos o más
+        variaciones de signo. Los intervalos con una variación (una raíz)
+        se refinan con Newton en float64 si los signos en float64 de los
+        extremos coinciden con los del backend y el resultado se confirma
+        con un cambio de signo en el backend; si no, se bisecta en el
+        backend hasta la tolerancia.
+        
+        Args:
+            lo, hi: Extremos de los intervalos en float64
+            depth: Profundidad de subdivisión ya alcanzada
+            
+        Returns:
+            Lista de raíces encontradas
+        """
+        scalar = self._scalar
+        power = [scalar(float(a)) for a in self.power_coeffs]
+        tolerance = scalar(self.tolerance)
+        roots, isolated = [], []
+        
+        stack = []
+        for l, h in zip(lo, hi):
+            a, b = scalar(float(l)), scalar(float(h))
+            stack.append((a, b, power_to_bernstein_generic(power, a, b), depth))
+        
+        while stack:
+            a, b, c, level = stack.pop()
+            self.num_extended += 1
+            
+            # Raíces exactamente en los extremos (se fusionan más adelante)
+            if c[0] == 0:
+                roots.append(float(a))
+            if c[-1] == 0:
+                roots.append(float(b))
+            
+            variations = sign_changes_generic(c)
+            if variations == 0:
+                self.num_exclusions += 1
+                if self.profiler is not None:
+                    self.profiler.record_excluded(1)
+            elif variations == 1:
+                isolated.append((a, b, c[0], c[-1]))
+            elif level >= self.max_subdivisions or b - a < tolerance:
+                roots.append(float((a + b) / 2))
+            else:
+                self.num_subdivisions += 1
+                mid = (a + b) / 2
+                left, right = de_casteljau_split_generic(c)
+                stack.append((mid, b, right, level + 1))
+                stack.append((a, mid, left, level + 1))
+        
+        if not isolated:
+            return roots
+        
+        # Refinamiento en float64 de los intervalos con una sola raíz
+        a64 = np.array([float(a) for a, _, _, _ in isolated])
+        b64 = np.array([float(b) for _, b, _, _ in isolated])
+        found, converged = newton_raphson_batch(
+            self.power_coeffs, a64, b64, tol=self.tolerance
         )
-        self.num_newton_steps += 1
+        self.num_newton_steps += len(isolated)
+        f_a, _ = horner_with_derivative(self.power_coeffs, a64)
+        f_b, _ = horner_with_derivative(self.power_coeffs, b64)
+        
+        for i, (a, b, c_a, c_b) in enumerate(isolated):
+            if c_a == 0 or c_b == 0:
+                # Una variación con un extremo nulo: la raíz interior
+                # pertenece a la sub-secuencia, bisección en el backend
+                root = self._bisect_extended(power, a, b)
+            elif (converged[i] and f_a[i] * float(c_a) > 0 and f_b[i] * float(c_b) > 0
+                    and self._confirm_root(power, a, b, found[i])):
+                root = float(found[i])
+            else:
+                root = self._bisect_extended(power, a, b)
+            roots.append(root)
+        
+        return roots
+    
+    def _confirm_root(self, power: List, a, b, x: float) -> bool:
+        """
+        Comprueba en el backend que p cambia de signo alrededor de x.
+        """
+        scalar = self._scalar
+        step = scalar(self.tolerance)
+        left = max(a, scalar(x) - step)
+        right = min(b, scalar(x) + step)
+        f_left = horner_generic(power, left)
+        f_right = horner_generic(power, right)
+        return f_left == 0 or f_right == 0 or (f_left > 0) != (f_right > 0)
+    
+    def _bisect_extended(self, power: List, a, b) -> float:
+        """
+        Bisección en el backend de un intervalo con una raíz simple.
+        """
+        tolerance = self._scalar(self.tolerance)
+        f_a = horner_generic(power, a)
+        while b - a > tolerance:
+            mid = (a + b) / 2
+            f_mid = horner_generic(power, mid)
+            if f_mid == 0:
+                return float(mid)
+            if (f_mid > 0) == (f_a > 0):
+                a, f_a = mid, f_mid
+            else:
+                b = mid
+        return float((a + b) / 2)
+    
+    def _bisect(self, lo: np.ndarray, hi: np.ndarray, coeffs: np.ndarray,
+                noise: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Subdivide en el punto medio todos los intervalos pendientes.
+        
+        Args:
+            lo, hi: Extremos de los intervalos
+            coeffs: Coeficientes de Bernstein, uno por fila
+            noise: Cota del error de redondeo de cada fila
+            
+        Returns:
+            Tupla (lo, hi, coeffs, noise) de la frontera siguiente
+        """
+        self.num_subdivisions += len(lo)
+        mid = (lo + hi) / 2
+        halves = np.empty((2,) + coeffs.shape)
+        de_casteljau_split(coeffs, 0.5, out=halves)
+        return (np.concatenate((lo, mid)), np.concatenate((mid, hi)),
+                halves.reshape(-1, coeffs.shape[-1]),
+                np.concatenate((noise, noise)))
+    
+    def _shrink(self, lo: np.ndarray, hi: np.ndarray, coeffs: np.ndarray,
+                noise: np.ndarray, toward_lo: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Sustituye cada intervalo por su mitad junto a uno de los extremos.
+        
+        Un intervalo sin decidir genera un solo hijo, de modo que el
+        trabajo crece linealmente con la profundidad aunque p esté en el
+        ruido de Horner en muchos extremos.
+        
+        Args:
+            lo, hi: Extremos de los intervalos
+            coeffs: Coeficientes de Bernstein, uno por fila
+            noise: Cota del error de redondeo de cada fila
+            toward_lo: Filas que conservan la mitad izquierda
+            
+        Returns:
+            Tupla (lo, hi, coeffs, noise) de la frontera siguiente
+        """
+        self.num_subdivisions += len(lo)
+        mid = (lo + hi) / 2
+        left_coeffs, right_coeffs = de_casteljau_split(coeffs, 0.5)
+        return (np.where(toward_lo, lo, mid), np.where(toward_lo, mid, hi),
+                np.where(toward_lo[:, np.newaxis], left_coeffs, right_coeffs), noise)
+    
+    def _clip(self, lo: np.ndarray, hi: np.ndarray, coeffs: np.ndarray,
+              noise: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Reduce los intervalos pendientes por recorte de la envolvente convexa.
+        
+        Si la envolvente no corta el eje el intervalo se descarta; si el
+        recorte conserva más de CLIP_MAX_RATIO del intervalo se bisecta.
+        
+        Args:
+            lo, hi: Extremos de los intervalos
+            coeffs: Coeficientes de Bernstein, uno por fila
+            noise: Cota del error de redondeo de cada fila
+            
+        Returns:
+            Tupla (lo, hi, coeffs, noise) de la frontera siguiente
+        """
+        if len(lo) == 0:
+            return lo, hi, coeffs, noise
         
-        # Si Newton convergió y la raíz está en el intervalo
-        if converged and is_in_interval(root, interval, margin=self.tolerance):
-            # Verificar que realmente es una raíz
-            if abs(self.f(root)) < self.tolerance:
-                return [root]
+        clip = bezier_clip if self.strategy == "clip" else quadratic_clip
+        t_min, t_max = clip(coeffs)
         
-        # Subdividir el intervalo
-        self.num_subdivisions += 1
-        left_interval = (a, mid)
-        right_interval = (mid, b)
+        empty = np.isnan(t_min)
+        num_empty = int(np.count_nonzero(empty))
+        self.num_exclusions += num_empty
+        if self.profiler is not None:
+            self.profiler.record_excluded(num_empty)
+        clipped = ~empty & (t_max - t_min <= CLIP_MAX_RATIO)
+        bisected = ~empty & ~clipped
+        self.num_clips += int(np.count_nonzero(clipped))
         
-        # Buscar recursivamente en ambos subintervalos
-        left_roots = self._find_roots_recursive(left_interval, depth + 1)
-        right_roots = self._find_roots_recursive(right_interval, depth + 1)
+        t_min, t_max = t_min[clipped], t_max[clipped]
+        width = hi[clipped] - lo[clipped]
+        clipped_coeffs = restrict_rows(coeffs[clipped], t_min, t_max)
+        clipped_lo = lo[clipped] + t_min * width
+        clipped_hi = lo[clipped] + t_max * width
         
-        return left_roots + right_roots
+        b_lo, b_hi, b_coeffs, b_noise = self._bisect(
+            lo[bisected], hi[bisected], coeffs[bisected], noise[bisected]
+        )
+        return (np.concatenate((clipped_lo, b_lo)),
+                np.concatenate((clipped_hi, b_hi)),
+                np.concatenate((clipped_coeffs, b_coeffs)),
+                np.concatenate((noise[clipped], b_noise)))
+    
+    def _derivative_coeffs(self, order: int) -> np.ndarray:
+        """
+        Coeficientes en la base de potencias de la derivada de orden dado.
+        
+        Args:
+            order: Orden de la derivada (0 para el propio polinomio)
+            
+        Returns:
+            Array con los coeficientes de p^(order)
+        """
+        while len(self._derivative_chain) <= order:
+            self._derivative_chain.append(
+                polynomial_derivative_coeffs(self._derivative_chain[-1])
+            )
+        return self._derivative_chain[order]
+    
+    def _accept_midpoints(self, lo: np.ndarray, hi: np.ndarray,
+                          single: Optional[np.ndarray] = None) -> List[float]:
+        """
+        Devuelve los puntos medios de los intervalos donde |p| < tolerancia.
+        
+        Args:
+            lo: Extremos izquierdos de los intervalos
+            hi: Extremos derechos de los intervalos
+            single: Intervalos con exactamente una raíz, que se aceptan
+                    sin comprobar |p|
+            
+        Returns:
+            Lista de puntos medios aceptados como raíces
+        """
+        mids = (lo + hi) / 2
+        accepted = np.abs(self.f(mids)) < self.tolerance
+        if single is not None:
+            accepted |= single
+        return list(mids[accepted])
     
     def verify_roots(self, roots: List[float]) -> List[Tuple[float, float]]:
         """
@@ -155,14 +924,22 @@ class NewtonBernstein:
         Obtiene estadísticas sobre la última ejecución.
         
         Returns:
-            Diccionario con estadísticas
+            Diccionario con estadísticas; con la instrumentación activada
+            incluye además 'profile' (ver Profiler.to_dict)
         """
-        return {
+        stats = {
             'num_subdivisions': self.num_subdivisions,
             'num_newton_steps': self.num_newton_steps,
             'num_exclusions': self.num_exclusions,
+            'num_clips': self.num_clips,
+            'num_certified': self.num_certified,
+            'num_clusters': self.num_clusters,
+            'num_extended': self.num_extended,
             'polynomial_degree': self.degree
         }
+        if self.profiler is not None:
+            stats['profile'] = self.profiler.to_dict()
+        return stats
     
     def __repr__(self) -> str:
         return f"NewtonBernstein(degree={self.degree}, tolerance={self.tolerance})"
@@ -170,7 +947,11 @@ class NewtonBernstein:
 
 def find_roots(power_coefficients: np.ndarray, 
                interval: Tuple[float, float],
-               tolerance: float = 1e-10) -> List[float]:
+               tolerance: float = 1e-10,
+               strategy: str = "bisect",
+               workers: Optional[int] = 1,
+               backend: str = "float64",
+               cache: Optional[ResultCache] = None) -> List[float]:
     """
     Función auxiliar para encontrar raíces de un polinomio.
     
@@ -178,6 +959,11 @@ def find_roots(power_coefficients: np.ndarray,
         power_coefficients: Coeficientes [a_0, a_1, ..., a_n]
         interval: Intervalo de búsqueda (a, b)
         tolerance: Tolerancia para las raíces
+        strategy: Estrategia de reducción ("bisect", "clip" o "quadclip")
+        workers: Número de procesos (None: todos los núcleos)
+        backend: Aritmética del aislamiento en los intervalos no
+                 concluyentes ("float64", "longdouble", "fraction", "mpmath")
+        cache: ResultCache opcional para reutilizar resultados
         
     Returns:
         Lista de raíces encontradas
@@ -187,5 +973,674 @@ def find_roots(power_coefficients: np.ndarray,
         >>> roots = find_roots(coeffs, (0, 4))
         >>> print(roots)  # [1.0, 2.0, 3.0]
     """
-    solver = NewtonBernstein(power_coefficients, tolerance)
-    return solver.find_roots(interval)
+    solver = NewtonBernstein(power_coefficients, tolerance, strategy=strategy,
+                             backend=backend, cache=cache)
+    return solver.find_roots(interval, workers=workers)
+
+
+def find_all_real_roots(power_coefficients: np.ndarray,
+                        tolerance: float = 1e-10,
+                        strategy: str = "bisect",
+                        backend: str = "float64") -> List[float]:
+    """
+    Encuentra todas las raíces reales de un polinomio, sin intervalo.
+    
+    Tras separar la raíz x = 0, la recta real se cubre con una cota de
+    Fujiwara/Lagrange B y se reparte en cuatro problemas sobre intervalos
+    acotados, como en los métodos de fracciones continuas:
+    
+    - raíces en (0, min(B, 1)]: p(x) directamente
+    - raíces en (1, B]: transformación de Möbius x -> 1/x, es decir, las
+      raíces en [1/B, 1) de x^n p(1/x) (coeficientes invertidos)
+    - raíces negativas: lo mismo con p(-x)
+    
+    Así las raíces grandes se aíslan con precisión relativa en lugar de
+    subdividir un intervalo enorme. Las raíces obtenidas como inversas se
+    pulen con unas iteraciones de Newton sobre p.
+    
+    Args:
+        power_coefficients: Coeficientes [a_0, a_1, ..., a_n]
+        tolerance: Tolerancia de cada subproblema (relativa a |x| para
+                   las raíces con |x| > 1)
+        strategy: Estrategia de reducción ("bisect", "clip" o "quadclip")
+        backend: Aritmética del aislamiento en los intervalos no
+                 concluyentes
+        
+    Returns:
+        Lista ordenada de raíces reales distintas
+        
+    Example:
+        >>> find_all_real_roots([-6, 11, -6, 1])  # [1.0, 2.0, 3.0]
+    """
+    coeffs = np.trim_zeros(np.asarray(power_coefficients, dtype=float), 'b')
+    if len(coeffs) < 2:
+        return []
+    
+    # Raíz en el origen: se deflaciona x^k
+    leading = int(np.flatnonzero(coeffs)[0])
+    roots = [0.0] if leading else []
+    coeffs = coeffs[leading:]
+    if len(coeffs) < 2:
+        return roots
+    
+    # Los dos subproblemas de cada semieje se solapan en torno a |x| = 1
+    # para que una raíz en la frontera quede en el interior de uno de ellos
+    bound = root_bound(coeffs) * (1 + OVERLAP)
+    options = dict(tolerance=tolerance, strategy=strategy, backend=backend)
+    
+    for sign in (1.0, -1.0):
+        # Coeficientes de p(sign * x)
+        mirrored = coeffs * sign ** np.arange(len(coeffs))
+        inner = find_roots(mirrored, (0.0, min(bound, 1.0 + OVERLAP)), **options)
+        roots.extend(sign * float(r) for r in inner if r > 0)
+        
+        if bound > 1.0:
+            outer = find_roots(mirrored[::-1], (1.0 / bound, 1.0), **options)
+            outer = np.array([sign / r for r in outer if r > 0])
+            roots.extend(_polish_reciprocal(coeffs, outer, tolerance))
+    
+    return merge_close_roots(roots, tolerance)
+
+
+def find_roots_batch(coeff_matrix: np.ndarray,
+                     interval: Tuple[float, float],
+                     tolerance: float = 1e-10,
+                     max_subdivisions: int = 100,
+                     max_newton_iter: int = 100,
+                     workers: Optional[int] = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encuentra las raíces de muchos polinomios del mismo grado a la vez.
+    
+    Las fases de exclusión, subdivisión y refinamiento de Newton se
+    ejecutan como operaciones de NumPy sobre todos los subintervalos
+    pendientes de todos los polinomios, sin un objeto por polinomio.
+    
+    Args:
+        coeff_matrix: Array (m, n+1); la fila k contiene [a_0, ..., a_n]
+        interval: Intervalo de búsqueda (a, b), común a todos
+        tolerance: Tolerancia para las raíces
+        max_subdivisions: Profundidad máxima de subdivisión
+        max_newton_iter: Iteraciones máximas del refinamiento
+        workers: Número de procesos; con más de uno las filas se reparten
+                 por bloques entre procesos (None: todos los núcleos)
+        
+    Returns:
+        Tupla (roots, offsets): las raíces del polinomio k son
+        roots[offsets[k]:offsets[k + 1]], ordenadas de menor a mayor
+        
+    Example:
+        >>> coeffs = [[-6, 11, -6, 1],  # (x-1)(x-2)(x-3)
+        ...           [2, -3, 1, 0]]    # (x-1)(x-2)
+        >>> roots, offsets = find_roots_batch(coeffs, (0, 4))
+        >>> print(roots[offsets[1]:offsets[2]])  # [1.0, 2.0]
+    """
+    power = np.atleast_2d(np.asarray(coeff_matrix, dtype=float))
+    m = power.shape[0]
+    if m == 0:
+        return np.zeros(0), np.zeros(1, dtype=int)
+    a, b = float(interval[0]), float(interval[1])
+    
+    workers = resolve_workers(workers)
+    if workers > 1 and m > 1:
+        return parallel_find_roots_batch(
+            power, (a, b), workers,
+            tolerance=tolerance,
+            max_subdivisions=max_subdivisions,
+            max_newton_iter=max_newton_iter
+        )
+    
+    # Frontera: polinomio de origen, extremos y coeficientes de cada nodo.
+    # La conversión a Bernstein es un único producto matriz-matriz
+    owner, lo, hi, coeffs, noise = _initial_frontier(power, (a, b))
+    degree = power.shape[1] - 1
+    
+    # Derivadas sucesivas de cada fila, para la detección de cúmulos
+    # (p' de un polinomio constante queda sin coeficientes, es decir, nula)
+    chain = [power]
+    for _ in range(max(degree, 1)):
+        chain.append(chain[-1][:, 1:] * np.arange(1, chain[-1].shape[1]))
+    
+    bracket_owner, bracket_lo, bracket_hi = [], [], []
+    tiny_owner, tiny_mid = [], []
+    clusters = {key: [] for key in ('owner', 'center', 'order', 'lo', 'hi')}
+    
+    # Intervalos anclados, como en NewtonBernstein._find_roots_iterative
+    anchored = np.zeros(len(owner), dtype=bool)
+    toward_lo = np.zeros(len(owner), dtype=bool)
+    
+    for _ in range(max_subdivisions + 1):
+        if len(owner) == 0:
+            break
+        
+        # Regla de Descartes: 0 variaciones excluye, 1 aísla una raíz
+        excluded, single = _classify_rows(coeffs, noise)
+        keep = ~excluded
+        owner, lo, hi, coeffs = owner[keep], lo[keep], hi[keep], coeffs[keep]
+        noise, single = noise[keep], single[keep]
+        anchored, toward_lo = anchored[keep], toward_lo[keep]
+        single &= ~anchored
+        
+        # Intervalos por debajo de la tolerancia: candidato en el punto medio
+        tiny = (hi - lo) < tolerance
+        tiny_owner.append(owner[tiny])
+        tiny_mid.append((lo[tiny] + hi[tiny]) / 2)
+        solved = tiny.copy()
+        
+        # Raíces múltiples y cúmulos, antes de decidir por los extremos
+        pending = np.flatnonzero(~solved & (~single | _unreliable_rows(coeffs, noise)))
+        cluster, centers, orders, radii = _detect_clusters(
+            lambda j, rows: chain[j][owner[pending[rows]]], lo[pending], hi[pending],
+            coeffs[pending], noise[pending], tolerance
+        )
+        rows = pending[cluster]
+        centers, orders, radii = centers[cluster], orders[cluster], radii[cluster]
+        for key, value in (('owner', owner[rows]), ('center', centers), ('order', orders),
+                           ('lo', np.minimum(lo[rows], centers - radii)),
+                           ('hi', np.maximum(hi[rows], centers + radii))):
+            clusters[key].append(value)
+        solved[rows] = True
+        
+        # Polígono de un solo signo con coeficientes dentro de la cota de
+        # redondeo: se decide con el signo de p en los extremos, salvo que
+        # p y p' se anulen en uno de ellos
+        flat = np.flatnonzero(~solved & ~single & ~anchored & (sign_changes(coeffs) == 0))
+        f_lo, _ = horner_with_derivative(power[owner[flat]], lo[flat])
+        f_hi, _ = horner_with_derivative(power[owner[flat]], hi[flat])
+        double_lo = _double_root_at(power[owner[flat]], chain[1][owner[flat]], lo[flat], degree)
+        double_hi = _double_root_at(power[owner[flat]], chain[1][owner[flat]], hi[flat], degree)
+        single[flat[f_lo * f_hi <= 0]] = True
+        shrink = np.zeros(len(owner), dtype=bool)
+        shrink[flat[(f_lo * f_hi >= 0) & (double_lo | double_hi)]] = True
+        toward_lo[flat] = double_lo
+        solved[flat] = ~single[flat]
+        
+        rows = np.flatnonzero(~solved & anchored)
+        shrink[rows] = _double_root_at(power[owner[rows]], chain[1][owner[rows]],
+                                       np.where(toward_lo[rows], lo[rows], hi[rows]), degree)
+        solved |= anchored
+        
+        bracketed = ~solved & single
+        bracket_owner.append(owner[bracketed])
+        bracket_lo.append(lo[bracketed])
+        bracket_hi.append(hi[bracketed])
+        solved |= bracketed
+        
+        # Los intervalos sin decidir conservan la mitad junto al extremo
+        s_owner, s_lo, s_hi = owner[shrink], lo[shrink], hi[shrink]
+        s_mid, s_toward = (s_lo + s_hi) / 2, toward_lo[shrink]
+        s_left, s_right = de_casteljau_split(coeffs[shrink], 0.5)
+        s_coeffs = np.where(s_toward[:, np.newaxis], s_left, s_right)
+        s_noise = noise[shrink]
+        
+        # El resto se subdivide en el punto medio, todos a la vez
+        split = ~solved
+        owner, lo, hi, coeffs = owner[split], lo[split], hi[split], coeffs[split]
+        noise = noise[split]
+        mid = (lo + hi) / 2
+        halves = np.empty((2,) + coeffs.shape)
+        de_casteljau_split(coeffs, 0.5, out=halves)
+        anchored = np.arange(2 * len(owner) + len(s_owner)) >= 2 * len(owner)
+        toward_lo = np.concatenate([np.zeros(2 * len(owner), dtype=bool), s_toward])
+        owner = np.concatenate([owner, owner, s_owner])
+        lo = np.concatenate([lo, mid, np.where(s_toward, s_lo, s_mid)])
+        hi = np.concatenate([mid, hi, np.where(s_toward, s_mid, s_hi)])
+        coeffs = np.concatenate([halves.reshape(-1, coeffs.shape[-1]), s_coeffs])
+        noise = np.concatenate([noise, noise, s_noise])
+    
+    # Refinamiento de Newton salvaguardado, sobre todos los intervalos con
+    # exactamente una raíz
+    r_owner = np.concatenate(bracket_owner)
+    r_lo, r_hi = np.concatenate(bracket_lo), np.concatenate(bracket_hi)
+    x, converged = newton_raphson_batch(
+        power[r_owner], r_lo, r_hi, tol=tolerance, max_iter=max_newton_iter
+    )
+    
+    # Sin cambio de signo numérico en los extremos o sin convergencia:
+    # como en NewtonBernstein, Newton desde el punto medio con |p| < tol
+    for i in np.flatnonzero(~converged):
+        root, ok = newton_raphson_fused(
+            polynomial_with_derivative(power[r_owner[i]]), (r_lo[i] + r_hi[i]) / 2,
+            tol=tolerance, max_iter=50
+        )
+        if ok and is_in_interval(root, (r_lo[i], r_hi[i]), margin=tolerance):
+            x[i], converged[i] = root, True
+    r_owner, x = r_owner[converged], x[converged]
+    
+    # Candidatos de intervalos diminutos: verificar |p(x)| < tolerancia
+    t_owner = np.concatenate(tiny_owner)
+    t_mid = np.concatenate(tiny_mid)
+    ft, _ = horner_with_derivative(power[t_owner], t_mid)
+    valid = np.abs(ft) < tolerance
+    
+    all_owner = np.concatenate([r_owner, t_owner[valid]])
+    all_roots = np.concatenate([x, t_mid[valid]])
+    
+    # Cada raíz múltiple se devuelve una sola vez, como cúmulo
+    clusters = {key: np.concatenate(value) for key, value in clusters.items()}
+    all_owner, all_roots, merged = _merge_clusters(all_owner, all_roots, clusters, tolerance)
+    all_owner = np.concatenate([all_owner, merged['owner']])
+    all_roots = np.concatenate([all_roots, merged['center']])
+    
+    # Ordenar por polinomio y por valor; fusionar raíces cercanas
+    order = np.lexsort((all_roots, all_owner))
+    all_owner, all_roots = all_owner[order], all_roots[order]
+    duplicate = np.zeros(len(all_roots), dtype=bool)
+    duplicate[1:] = ((all_owner[1:] == all_owner[:-1]) &
+                     (np.diff(all_roots) <= tolerance))
+    all_owner, all_roots = all_owner[~duplicate], all_roots[~duplicate]
+    
+    offsets = np.zeros(m + 1, dtype=int)
+    offsets[1:] = np.cumsum(np.bincount(all_owner, minlength=m))
+    
+    return all_roots, offsets
+
+
+def _polish_reciprocal(coeffs: np.ndarray, roots: np.ndarray,
+                       tolerance: float) -> List[float]:
+    """
+    Pule con Newton sobre p las raíces obtenidas como inversas.
+    
+    Una tolerancia absoluta en y = 1/x equivale a una incertidumbre de
+    tolerance * x^2 en x; cada iteración solo se acepta si no sale de ese
+    entorno ni aumenta |p(x)|, de modo que el ruido de evaluación en
+    polinomios mal condicionados no aleja la raíz.
+    
+    Args:
+        coeffs: Coeficientes [a_0, ..., a_n] del polinomio original
+        roots: Aproximaciones de las raíces
+        tolerance: Tolerancia con la que se aislaron las inversas
+        
+    Returns:
+        Lista de raíces pulidas
+    """
+    x = np.asarray(roots, dtype=float)
+    if x.size == 0:
+        return []
+    
+    center, radius = x, tolerance * x ** 2
+    p, dp = horner_with_derivative(coeffs, x)
+    for _ in range(RECIPROCAL_POLISH_ITER):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            candidate = x - p / dp
+        p_new, dp_new = horner_with_derivative(coeffs, candidate)
+        better = (np.isfinite(candidate) & (np.abs(candidate - center) <= radius)
+                  & (np.abs(p_new) <= np.abs(p)))
+        x = np.where(better, candidate, x)
+        p = np.where(better, p_new, p)
+        dp = np.where(better, dp_new, dp)
+    return x.tolist()
+
+
+def _initial_frontier(power_rows: np.ndarray, interval: Tuple[float, float]):
+    """
+    Construye la frontera inicial de subintervalos para varios polinomios.
+    
+    Si el intervalo contiene el origen en su interior se parte en 0, de
+    modo que cada pieza se obtiene de la forma de referencia solo con
+    combinaciones convexas y su cota de error de redondeo es válida.
+    
+    Args:
+        power_rows: Array (m, n+1) de coeficientes en base de potencias
+        interval: Intervalo de búsqueda (a, b)
+        
+    Returns:
+        Tupla (owner, lo, hi, coeffs, noise) con un nodo por polinomio y pieza
+    """
+    a, b = float(interval[0]), float(interval[1])
+    pieces = [(a, 0.0), (0.0, b)] if a < 0 < b else [(a, b)]
+    m = len(power_rows)
+    
+    owner = np.concatenate([np.arange(m) for _ in pieces])
+    lo = np.concatenate([np.full(m, c) for c, _ in pieces])
+    hi = np.concatenate([np.full(m, d) for _, d in pieces])
+    coeffs = np.concatenate([power_to_bernstein(power_rows, piece) for piece in pieces])
+    noise = np.concatenate([conversion_error_bound(power_rows, piece) for piece in pieces])
+    
+    return owner, lo, hi, coeffs, noise
+
+
+def _classify_rows(coeffs: np.ndarray, 
+                   noise: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Clasifica subintervalos según las variaciones de signo de Bernstein.
+    
+    Con los extremos no nulos, el número de raíces en el intervalo es a lo
+    sumo el número de variaciones de signo y tiene su misma paridad: 1
+    variación implica exactamente una raíz. Un intervalo solo se excluye
+    si todos sus coeficientes superan la cota de redondeo con el mismo
+    signo. Un extremo por debajo de la cota cuenta como nulo, porque su
+    signo no es fiable; en ese caso solo se garantiza una raíz cuando el
+    polígono de control es monótono y cambia de signo. Los intervalos de
+    un solo signo que no se excluyen quedan para el llamador, que los
+    decide evaluando p en los extremos.
+    
+    Args:
+        coeffs: Array (k, n+1) de coeficientes de Bernstein
+        noise: Cota del error de redondeo de cada fila, forma (k,)
+        
+    Returns:
+        Tupla (excluido, una_raiz) de arrays booleanos (k,)
+    """
+    variations = sign_changes(coeffs)
+    c_min = coeffs.min(axis=1)
+    c_max = coeffs.max(axis=1)
+    
+    threshold = np.maximum(64 * np.finfo(float).eps * np.abs(coeffs).max(axis=1), noise)
+    nonzero_ends = ((np.abs(coeffs[:, 0]) > threshold) &
+                    (np.abs(coeffs[:, -1]) > threshold))
+    zero_poly = (c_min == 0) & (c_max == 0)
+    
+    # Envolvente convexa de un signo con margen sobre la cota de redondeo;
+    # sin ese margen el signo de los coeficientes no prueba nada
+    excluded = zero_poly | (c_min > threshold) | (c_max < -threshold)
+    single = ((nonzero_ends & (variations == 1)) |
+              (~nonzero_ends & (variations > 0) & _monotone_rows(coeffs)))
+    
+    return excluded, single
+
+
+def _phase(profiler: Optional[Profiler], name: str):
+    """
+    Contexto que cronometra una fase si hay perfilador y no hace nada si no.
+    """
+    return profiler.phase(name) if profiler is not None else _NO_PROFILE
+
+
+_NO_PROFILE = nullcontext()
+
+
+def _unreliable_rows(coeffs: np.ndarray, noise: np.ndarray) -> np.ndarray:
+    """
+    Indica las filas con algún coeficiente dentro de la cota de redondeo.
+    
+    En esas filas el signo de algún coeficiente no es fiable en float64 y
+    la regla de Descartes no es concluyente.
+    
+    Args:
+        coeffs: Array (k, n+1) de coeficientes de Bernstein
+        noise: Cota del error de redondeo de cada fila
+        
+    Returns:
+        Array booleano (k,)
+    """
+    threshold = np.maximum(64 * np.finfo(float).eps * np.abs(coeffs).max(axis=1), noise)
+    return (np.abs(coeffs) <= threshold[:, np.newaxis]).any(axis=1)
+
+
+def _noise_rows(coeffs: np.ndarray, noise: np.ndarray) -> np.ndarray:
+    """
+    Indica las filas con todos los coeficientes dentro de la cota de redondeo.
+    
+    Args:
+        coeffs: Array (k, n+1) de coeficientes de Bernstein
+        noise: Cota del error de redondeo de cada fila
+        
+    Returns:
+        Array booleano (k,)
+    """
+    threshold = np.maximum(64 * np.finfo(float).eps * np.abs(coeffs).max(axis=1), noise)
+    return (np.abs(coeffs) <= threshold[:, np.newaxis]).all(axis=1)
+
+
+def _detect_clusters(derivative: Callable[[int, np.ndarray], np.ndarray], lo: np.ndarray,
+                     hi: np.ndarray, coeffs: np.ndarray, noise: np.ndarray,
+                     tolerance: float) -> Tuple[np.ndarray, ...]:
+    """
+    Detecta intervalos que contienen una raíz múltiple o un cúmulo.
+    
+    Se busca el menor orden k >= 2 tal que la envolvente de Bernstein de
+    p^(k) no contiene el 0 (por Rolle, a lo sumo k raíces en el
+    intervalo). Entonces p^(k-1) es monótona; su raíz c se calcula con
+    Newton si cambia de signo, o es el extremo en el que p^(k-1) se anula
+    salvo el redondeo de Horner (una raíz múltiple en un punto de
+    subdivisión). Si p, p', ..., p^(k-2) también se anulan en c salvo ese
+    redondeo, el intervalo es un cúmulo de multiplicidad k centrado en c.
+    
+    El radio del cúmulo es la distancia r a la que |p^(k)(c)| r^k / k!
+    alcanza el redondeo de p en c o la tolerancia con la que se acepta
+    |p| como nulo: las raíces que se aceptan a menos de r del centro
+    (desde un intervalo vecino) no se distinguen del cúmulo.
+    
+    Args:
+        derivative: Función (j, filas) que devuelve los coeficientes en la
+                    base de potencias de p^(j), forma (n+1-j,) común a
+                    todas las filas o (len(filas), n+1-j) con un
+                    polinomio por fila
+        lo, hi: Extremos de los intervalos
+        coeffs: Coeficientes de Bernstein, uno por fila
+        noise: Cota del error de redondeo de cada fila
+        tolerance: Tolerancia de Newton para el centro y de |p| nulo
+        
+    Returns:
+        Tupla (es_cúmulo, centros, multiplicidades, radios) de arrays (k,)
+    """
+    count, degree = coeffs.shape[0], coeffs.shape[1] - 1
+    cluster = np.zeros(count, dtype=bool)
+    centers = np.zeros(count)
+    orders = np.zeros(count, dtype=int)
+    radii = np.zeros(count)
+    if count == 0 or degree < 2:
+        return cluster, centers, orders, radii
+    
+    u = np.finfo(float).eps / 2
+    gamma = 2 * degree * u / (1 - 2 * degree * u)
+    
+    # Orden de la primera derivada de signo constante; cada diferencia
+    # puede duplicar el error de los coeficientes
+    threshold = np.maximum(64 * np.finfo(float).eps * np.abs(coeffs).max(axis=1), noise)
+    diffs = coeffs
+    for j in range(1, degree + 1):
+        diffs = np.diff(diffs, axis=1)
+        bound = 2 ** j * threshold
+        definite = (orders == 0) & ((diffs.min(axis=1) > bound) |
+                                    (diffs.max(axis=1) < -bound))
+        orders[definite] = j
+        if orders.all():
+            break
+    
+    for k in np.unique(orders[orders >= 2]):
+        rows = np.flatnonzero(orders == k)
+        
+        # Raíz simple de p^(k-1) en el intervalo, o en uno de sus extremos
+        g = derivative(k - 1, rows)
+        g_lo, near_lo = _horner_near_zero(g, lo[rows], degree)
+        g_hi, near_hi = _horner_near_zero(g, hi[rows], degree)
+        bracketed = g_lo * g_hi <= 0
+        center = np.where(near_lo, lo[rows], hi[rows])
+        found = bracketed | near_lo | near_hi
+        if bracketed.any():
+            root, converged = newton_raphson_batch(
+                g[bracketed] if g.ndim == 2 else g, lo[rows[bracketed]], hi[rows[bracketed]],
+                tol=tolerance
+            )
+            center[bracketed] = root
+            found[bracketed] = converged
+        rows, center = rows[found], center[found]
+        if len(rows) == 0:
+            continue
+        
+        # p, ..., p^(k-2) nulas en c salvo redondeo; un valor por encima
+        # de la cota tiene signo fiable y las raíces aún pueden
+        # separarse subdividiendo, aunque sea menor que la tolerancia
+        flat = np.ones(len(rows), dtype=bool)
+        for j in range(k - 1):
+            flat &= _horner_near_zero(derivative(j, rows), center, degree)[1]
+        rows, center = rows[flat], center[flat]
+        if len(rows) == 0:
+            continue
+        
+        # p^(k) no se anula en el intervalo (su envolvente es de un signo)
+        leading, _ = horner_with_derivative(derivative(k, rows), center)
+        magnitude, _ = horner_with_derivative(np.abs(derivative(0, rows)), np.abs(center))
+        flat_value = np.maximum(CLUSTER_SAFETY * gamma * magnitude, tolerance)
+        
+        cluster[rows] = True
+        centers[rows] = center
+        radii[rows] = (flat_value * math.factorial(k) / np.abs(leading)) ** (1 / k)
+    
+    orders[~cluster] = 0
+    return cluster, centers, orders, radii
+
+
+def _horner_near_zero(coeffs: np.ndarray, x: np.ndarray,
+                      degree: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa p(x) con Horner e indica si es nulo salvo el error de redondeo.
+    
+    La cota es CLUSTER_SAFETY · γ_2n · |p|(|x|), con γ_2n la del esquema
+    de Horner de grado n.
+    
+    Args:
+        coeffs: Coeficientes [a_0, ..., a_m], forma (m+1,) o (k, m+1)
+        x: Puntos de evaluación, forma (k,)
+        degree: Grado n que fija la cota
+        
+    Returns:
+        Tupla (p(x), |p(x)| dentro de la cota) de arrays (k,)
+    """
+    u = np.finfo(float).eps / 2
+    gamma = 2 * degree * u / (1 - 2 * degree * u)
+    value, _ = horner_with_derivative(coeffs, x)
+    magnitude, _ = horner_with_derivative(np.abs(coeffs), np.abs(x))
+    return value, np.abs(value) <= CLUSTER_SAFETY * gamma * magnitude
+
+
+def _double_root_at(power: np.ndarray, derivative: np.ndarray, x: np.ndarray,
+                    degree: int) -> np.ndarray:
+    """
+    Indica los puntos donde p y p' se anulan salvo el redondeo de Horner.
+    
+    Args:
+        power: Coeficientes de p, forma (n+1,) o (k, n+1)
+        derivative: Coeficientes de p', forma (n,) o (k, n)
+        x: Puntos de evaluación, forma (k,)
+        degree: Grado n que fija la cota
+        
+    Returns:
+        Array booleano (k,)
+    """
+    return (_horner_near_zero(power, x, degree)[1] &
+            _horner_near_zero(derivative, x, degree)[1])
+
+
+def _merge_clusters(owner: np.ndarray, roots: np.ndarray, clusters: Dict[str, np.ndarray],
+                    tolerance: float) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Fusiona en cada cúmulo las raíces y los cúmulos de su entorno.
+    
+    Una raíz múltiple puede aceptarse también desde un intervalo vecino
+    (p. ej. si está en un punto de subdivisión), como raíz simple o como
+    otro cúmulo. El entorno de un cúmulo es su intervalo ampliado con el
+    radio del cúmulo; las raíces que caen en él no se distinguen del
+    cúmulo y se descartan, y los cúmulos con el centro en el entorno de
+    otro anterior se fusionan con él, conservando la mayor multiplicidad.
+    
+    Args:
+        owner: Polinomio de origen de cada raíz, forma (r,)
+        roots: Raíces aceptadas, forma (r,)
+        clusters: Diccionario de arrays 'owner', 'center', 'order', 'lo' y
+                  'hi' (el entorno) con un elemento por cúmulo detectado
+        tolerance: Margen añadido a los entornos de los cúmulos
+        
+    Returns:
+        Tupla (owner, roots, clusters) sin las raíces absorbidas y con un
+        solo cúmulo por raíz múltiple, ordenados por polinomio y centro
+    """
+    c_owner, center = clusters['owner'], clusters['center']
+    order = np.lexsort((center, c_owner))
+    c_owner, center = c_owner[order], center[order]
+    c_order, c_lo, c_hi = (clusters[key][order] for key in ('order', 'lo', 'hi'))
+    
+    # Raíces dentro del entorno de algún cúmulo del mismo polinomio
+    absorbed = np.zeros(len(roots), dtype=bool)
+    start = np.searchsorted(c_owner, owner, side='left')
+    stop = np.searchsorted(c_owner, owner, side='right')
+    for offset in range(int((stop - start).max(initial=0))):
+        idx = np.minimum(start + offset, len(c_owner) - 1)
+        absorbed |= ((start + offset < stop) & (roots >= c_lo[idx] - tolerance) &
+                     (roots <= c_hi[idx] + tolerance))
+    
+    # Cúmulos repetidos: el centro cae en el entorno del anterior
+    repeated = np.zeros(len(center), dtype=bool)
+    repeated[1:] = ((c_owner[1:] == c_owner[:-1]) &
+                    ((center[1:] <= c_hi[:-1] + tolerance) |
+                     (center[:-1] >= c_lo[1:] - tolerance)))
+    group = np.cumsum(~repeated) - 1
+    merged_order = np.zeros(int(np.count_nonzero(~repeated)), dtype=int)
+    np.maximum.at(merged_order, group, c_order)
+    
+    merged = {'owner': c_owner[~repeated], 'center': center[~repeated],
+              'order': merged_order}
+    return owner[~absorbed], roots[~absorbed], merged
+
+
+def _derivative_hull(coeffs: np.ndarray,
+                     width: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cota [min, max] de p' en cada intervalo por la envolvente de Bernstein.
+    
+    Los coeficientes de Bernstein de p' son n / h · (c_{i+1} - c_i).
+    
+    Args:
+        coeffs: Array (k, n+1) de coeficientes de Bernstein
+        width: Longitud h de cada intervalo, forma (k,)
+        
+    Returns:
+        Tupla (d_min, d_max) de forma (k,)
+    """
+    n = coeffs.shape[1] - 1
+    if n == 0:
+        zeros = np.zeros(len(coeffs))
+        return zeros, zeros
+    deriv = np.diff(coeffs, axis=1) * (n / width)[:, np.newaxis]
+    return deriv.min(axis=1), deriv.max(axis=1)
+
+
+def _interval_horner(c_lo: np.ndarray, c_hi: np.ndarray,
+                     x_lo: np.ndarray, x_hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa por intervalos un polinomio con el esquema de Horner.
+    
+    Cada producto y cada suma se redondean hacia fuera con np.nextafter
+    (un ulp cubre el error de una operación redondeada al más próximo), de
+    modo que el resultado contiene el rango exacto de p sobre [x_lo, x_hi]
+    para todos los coeficientes en [c_lo, c_hi].
+    
+    Args:
+        c_lo, c_hi: Cotas de los coeficientes [a_0, ..., a_n]
+        x_lo, x_hi: Extremos de los intervalos de evaluación, forma (k,)
+        
+    Returns:
+        Tupla (p_min, p_max) de forma (k,)
+    """
+    p_lo = np.full(np.shape(x_lo), c_lo[-1])
+    p_hi = np.full(np.shape(x_lo), c_hi[-1])
+    
+    for j in range(len(c_lo) - 2, -1, -1):
+        products = np.stack((p_lo * x_lo, p_lo * x_hi, p_hi * x_lo, p_hi * x_hi))
+        prod_lo = np.nextafter(products.min(axis=0), -np.inf)
+        prod_hi = np.nextafter(products.max(axis=0), np.inf)
+        p_lo = np.nextafter(prod_lo + c_lo[j], -np.inf)
+        p_hi = np.nextafter(prod_hi + c_hi[j], np.inf)
+    
+    return p_lo, p_hi
+
+
+def _monotone_rows(coeffs: np.ndarray) -> np.ndarray:
+    """
+    Indica qué polinomios son estrictamente monótonos en su intervalo.
+    
+    Si las diferencias de los coeficientes de Bernstein (proporcionales a
+    los coeficientes de la derivada) tienen signo constante y no son todas
+    nulas, la derivada no se anula en el interior del intervalo y hay a lo
+    sumo una raíz.
+    
+    Args:
+        coeffs: Array (k, n+1) de coeficientes de Bernstein
+        
+    Returns:
+        Array booleano (k,)
+    """
+    diffs = np.diff(coeffs, axis=1)
+    nonzero = np.any(diffs != 0, axis=1)
+    return nonzero & (np.all(diffs >= 0, axis=1) | np.all(diffs <= 0, axis=1))
@@ -0,0 +1,226 @@
+"""
+Ejecución paralela
+==================
+
+Reparte la búsqueda de raíces entre varios procesos con
+``concurrent.futures``. Los coeficientes se publican una sola vez en un
+bloque de memoria compartida (``multiprocessing.shared_memory``) que cada
+proceso adjunta al arrancar; las tareas solo transportan índices de filas
+o extremos de subintervalos, de modo que los coeficientes no se serializan
+por tarea.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from .utils import merge_close_roots
+
+
+# Número de fragmentos del intervalo por proceso: las raíces no suelen
+# estar repartidas uniformemente y los fragmentos adicionales equilibran
+# la carga
+CHUNKS_PER_WORKER = 4
+
+# Solape relativo entre piezas contiguas: una raíz situada justo en una
+# frontera queda en el interior de las dos piezas en lugar de perderse
+# por el redondeo del signo en el extremo
+OVERLAP = 1e-6
+
+# Contadores de get_statistics() que se suman entre procesos
+STATISTICS_COUNTERS = (
+    'num_subdivisions', 'num_newton_steps', 'num_exclusions', 'num_clips',
+    'num_clusters', 'num_extended'
+)
+
+# Estado de cada proceso trabajador (inicializado por _attach_shared)
+_worker_state = {}
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Normaliza el número de procesos solicitado.
+    
+    Args:
+        workers: Número de procesos; None usa todos los núcleos disponibles
+    
+    Returns:
+        Número de procesos (>= 1)
+    
+    Raises:
+        ValueError: Si workers es menor que 1
+    """
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers debe ser >= 1, recibido {workers}")
+    return int(workers)
+
+
+def split_interval(interval: Tuple[float, float], pieces: int,
+                   overlap: float = OVERLAP) -> List[Tuple[float, float]]:
+    """
+    Divide un intervalo en piezas de igual longitud que se solapan.
+    
+    Args:
+        interval: Intervalo (a, b)
+        pieces: Número de piezas
+        overlap: Solape de cada frontera interior, relativo a la pieza
+    
+    Returns:
+        Lista de subintervalos (a_i, b_i) que cubren [a, b]
+    """
+    a, b = interval
+    edges = np.linspace(a, b, pieces + 1)
+    margin = overlap * (b - a) / pieces
+    lo = np.maximum(edges[:-1] - margin, a)
+    hi = np.minimum(edges[1:] + margin, b)
+    lo[0], hi[-1] = a, b
+    return [(float(l), float(h)) for l, h in zip(lo, hi)]
+
+
+@contextmanager
+def shared_array(array: np.ndarray):
+    """
+    Copia un array a un bloque de memoria compartida.
+    
+    El bloque se libera al salir del contexto.
+    
+    Args:
+        array: Array a compartir
+    
+    Yields:
+        Tupla (nombre, forma, dtype) con la que los procesos lo adjuntan
+    """
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        yield shm.name, array.shape, array.dtype.str
+        del view
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _attach_shared(name: str, shape: Tuple[int, ...], dtype: str,
+                   options: Dict) -> None:
+    """
+    Inicializador de cada proceso: adjunta la memoria compartida.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_state['shm'] = shm
+    _worker_state['coeffs'] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    _worker_state['options'] = options
+
+
+def _solve_interval(interval: Tuple[float, float]) -> Tuple[List[float], Dict, List]:
+    """
+    Tarea: raíces y cúmulos del polinomio compartido en un subintervalo.
+    """
+    from .newton_bernstein import NewtonBernstein
+    
+    solver = NewtonBernstein(_worker_state['coeffs'], **_worker_state['options'])
+    roots = solver.find_roots(interval)
+    clusters = [(float(center), int(k)) for center, k in solver.clusters]
+    return [float(r) for r in roots], solver.get_statistics(), clusters
+
+
+def _solve_rows(task: Tuple[int, int, Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tarea: raíces de las filas [start, stop) de la matriz compartida.
+    """
+    from .newton_bernstein import find_roots_batch
+    
+    start, stop, interval = task
+    return find_roots_batch(_worker_state['coeffs'][start:stop], interval,
+                            **_worker_state['options'])
+
+
+def parallel_find_roots(power_coeffs: np.ndarray,
+                        interval: Tuple[float, float],
+                        workers: int,
+                        **options) -> Tuple[List[float], Dict[str, int],
+                                         List[Tuple[float, int]], List[Dict]]:
+    """
+    Busca las raíces de un polinomio repartiendo el intervalo entre procesos.
+    
+    Cada proceso resuelve subintervalos solapados con NewtonBernstein; las
+    raíces de los solapes aparecen dos veces y se fusionan con
+    merge_close_roots. Los cúmulos repetidos en un solape se fusionan del
+    mismo modo, conservando la mayor multiplicidad.
+    
+    Args:
+        power_coeffs: Coeficientes [a_0, ..., a_n] en la base de potencias
+        interval: Intervalo de búsqueda (a, b)
+        workers: Número de procesos
+        **options: Argumentos de NewtonBernstein (tolerance, strategy, ...)
+    
+    Returns:
+        Tupla (raíces ordenadas, contadores de get_statistics() sumados,
+        cúmulos (centro, multiplicidad), perfiles de cada pieza); la lista
+        de perfiles solo tiene elementos si options incluye profile=True
+    """
+    tolerance = options.get('tolerance', 1e-10)
+    pieces = split_interval(interval, workers * CHUNKS_PER_WORKER)
+    totals = dict.fromkeys(STATISTICS_COUNTERS, 0)
+    roots, clusters, profiles = [], [], []
+    
+    with shared_array(np.asarray(power_coeffs, dtype=float)) as spec:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared,
+                                 initargs=(*spec, options)) as pool:
+            for piece_roots, stats, piece_clusters in pool.map(_solve_interval, pieces):
+                roots.extend(piece_roots)
+                clusters.extend(piece_clusters)
+                for key in STATISTICS_COUNTERS:
+                    totals[key] += stats[key]
+                if 'profile' in stats:
+                    profiles.append(stats['profile'])
+    
+    merged = []
+    for center, k in sorted(clusters):
+        if merged and center - merged[-1][0] <= tolerance:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], k))
+        else:
+            merged.append((center, k))
+    totals['num_clusters'] = len(merged)
+    
+    return merge_close_roots(roots, tolerance), totals, merged, profiles
+
+
+def parallel_find_roots_batch(power: np.ndarray,
+                              interval: Tuple[float, float],
+                              workers: int,
+                              **options) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reparte un lote de polinomios entre procesos por bloques de filas.
+    
+    Args:
+        power: Array (m, n+1) de coeficientes en la base de potencias
+        interval: Intervalo de búsqueda (a, b)
+        workers: Número de procesos
+        **options: Argumentos de find_roots_batch (tolerance, ...)
+    
+    Returns:
+        Tupla (roots, offsets) con el mismo formato que find_roots_batch
+    """
+    m = power.shape[0]
+    bounds = np.linspace(0, m, min(m, workers * CHUNKS_PER_WORKER) + 1).astype(int)
+    tasks = [(int(start), int(stop), interval)
+             for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    
+    all_roots, counts = [], []
+    with shared_array(power) as spec:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared,
+                                 initargs=(*spec, options)) as pool:
+            for roots, offsets in pool.map(_solve_rows, tasks):
+                all_roots.append(roots)
+                counts.append(np.diff(offsets))
+    
+    offsets = np.zeros(m + 1, dtype=int)
+    offsets[1:] = np.cumsum(np.concatenate(counts))
+    return np.concatenate(all_roots), offsets
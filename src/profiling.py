@@ -0,0 +1,156 @@
+"""
+Instrumentación
+===============
+
+Perfilado opcional de NewtonBernstein: nodos por profundidad, tiempo por
+fase, histograma de iteraciones de Newton y proporción de nodos excluidos
+frente a subdivididos. El solver solo consulta el perfilador cuando está
+activado, de modo que desactivado no añade coste.
+"""
+
+import json
+import time
+import numpy as np
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+# Fases cronometradas, en el orden en que se informan
+PHASES = ("conversion", "bounds", "newton", "extended", "subdivision", "merge")
+
+
+class Profiler:
+    """
+    Acumula las métricas de una ejecución de find_roots.
+    
+    El callback opcional recibe (evento, datos): ("level", {...}) al
+    terminar cada nivel de la frontera y ("done", to_dict()) al final.
+    """
+    
+    def __init__(self, callback: Optional[Callable[[str, Dict], None]] = None):
+        """
+        Inicializa el perfilador.
+        
+        Args:
+            callback: Función opcional callback(evento, datos)
+        """
+        self.callback = callback
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Borra las métricas acumuladas.
+        """
+        self.depth_nodes: List[int] = []
+        self.timings: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.newton_iterations: Dict[int, int] = {}
+        self.excluded = 0
+        self.subdivided = 0
+    
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Cronometra un bloque y suma su duración a la fase indicada.
+        
+        Args:
+            name: Nombre de la fase (uno de PHASES)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+    
+    def record_level(self, depth: int, nodes: int, excluded: int) -> None:
+        """
+        Registra el tamaño de un nivel de la frontera.
+        
+        Args:
+            depth: Profundidad del nivel (0 para el intervalo inicial)
+            nodes: Número de nodos del nivel
+            excluded: Nodos descartados por las cotas en este nivel
+        """
+        while len(self.depth_nodes) <= depth:
+            self.depth_nodes.append(0)
+        self.depth_nodes[depth] += nodes
+        self.excluded += excluded
+        if self.callback is not None:
+            self.callback("level", {"depth": depth, "nodes": nodes,
+                                    "excluded": excluded})
+    
+    def record_excluded(self, excluded: int) -> None:
+        """
+        Registra nodos descartados fuera de record_level.
+        
+        Los descartan el recorte (intervalo vacío) y la aritmética
+        extendida, después de clasificar el nivel.
+        
+        Args:
+            excluded: Número de nodos descartados
+        """
+        self.excluded += excluded
+    
+    def record_newton(self, iterations: np.ndarray) -> None:
+        """
+        Añade al histograma las iteraciones de Newton de cada candidato.
+        
+        Args:
+            iterations: Número de iteraciones de cada candidato
+        """
+        values, counts = np.unique(np.asarray(iterations, dtype=int), return_counts=True)
+        for value, count in zip(values, counts):
+            self.newton_iterations[int(value)] = self.newton_iterations.get(int(value), 0) + int(count)
+    
+    def merge(self, data: Dict) -> None:
+        """
+        Suma las métricas de otra ejecución (p. ej. de un proceso trabajador).
+        
+        Args:
+            data: Diccionario con el formato de to_dict
+        """
+        for depth, nodes in enumerate(data["depth_nodes"]):
+            while len(self.depth_nodes) <= depth:
+                self.depth_nodes.append(0)
+            self.depth_nodes[depth] += nodes
+        for name, seconds in data["timings"].items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+        for value, count in data["newton_iterations"].items():
+            self.newton_iterations[int(value)] = self.newton_iterations.get(int(value), 0) + int(count)
+        self.excluded += data["excluded"]
+        self.subdivided += data["subdivided"]
+    
+    def finish(self) -> None:
+        """
+        Notifica el final de la ejecución al callback.
+        """
+        if self.callback is not None:
+            self.callback("done", self.to_dict())
+    
+    def to_dict(self) -> Dict:
+        """
+        Devuelve las métricas como diccionario serializable.
+        
+        Returns:
+            Diccionario con depth_nodes, timings, newton_iterations,
+            excluded, subdivided y exclusion_ratio
+        """
+        return {
+            "depth_nodes": list(self.depth_nodes),
+            "timings": dict(self.timings),
+            "newton_iterations": dict(sorted(self.newton_iterations.items())),
+            "excluded": self.excluded,
+            "subdivided": self.subdivided,
+            "exclusion_ratio": self.excluded / self.subdivided if self.subdivided else None,
+        }
+    
+    def to_json(self, **kwargs) -> str:
+        """
+        Devuelve las métricas en formato JSON.
+        
+        Args:
+            **kwargs: Argumentos de json.dumps (p. ej. indent)
+        
+        Returns:
+            Cadena JSON
+        """
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,168 @@
+"""
+Seguimiento de raíces
+=====================
+
+Resolución incremental de familias de polinomios p(x; t) que varían poco
+entre pasos consecutivos de un barrido paramétrico. Las raíces del paso
+anterior definen una partición del intervalo en celdas con a lo sumo una
+raíz cada una; en el paso siguiente cada celda se comprueba con una sola
+prueba de signos de Bernstein y solo se vuelve a aislar donde la prueba
+no es concluyente.
+"""
+
+import numpy as np
+from typing import List, Tuple
+
+from .bernstein import restrict_rows
+from .newton_bernstein import NewtonBernstein, _initial_frontier, _classify_rows
+from .parallel import OVERLAP
+from .utils import newton_raphson_batch, merge_close_roots
+
+
+class RootTracker:
+    """
+    Sigue las raíces de un polinomio a lo largo de un barrido paramétrico.
+    
+    Example:
+        >>> tracker = RootTracker((0, 4))
+        >>> for t in np.linspace(0, 0.1, 11):
+        ...     roots = tracker.update([-6 - t, 11, -6, 1])
+    """
+    
+    def __init__(self, interval: Tuple[float, float],
+                 tolerance: float = 1e-10,
+                 max_subdivisions: int = 100,
+                 strategy: str = "bisect",
+                 backend: str = "float64"):
+        """
+        Inicializa el seguidor.
+        
+        Args:
+            interval: Intervalo de búsqueda (a, b), fijo durante el barrido
+            tolerance: Tolerancia para las raíces
+            max_subdivisions: Profundidad máxima de las reaislaciones
+            strategy: Estrategia de reducción de NewtonBernstein
+            backend: Aritmética de NewtonBernstein en las reaislaciones
+        """
+        self.interval = (float(interval[0]), float(interval[1]))
+        self.options = dict(tolerance=tolerance, max_subdivisions=max_subdivisions,
+                            strategy=strategy, backend=backend)
+        self.tolerance = tolerance
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Olvida las raíces anteriores; el siguiente paso se resuelve entero.
+        """
+        self.roots: List[float] = []
+        self.num_steps = 0
+        self.num_reused = 0
+        self.num_reisolated = 0
+    
+    def update(self, power_coefficients: np.ndarray) -> List[float]:
+        """
+        Resuelve el siguiente polinomio del barrido.
+        
+        Cada celda de la partición anterior se clasifica con la regla de
+        Descartes sobre sus coeficientes de Bernstein: sin variaciones se
+        descarta, con una variación se refina con Newton partiendo de la
+        raíz anterior y en otro caso se vuelve a aislar con NewtonBernstein.
+        
+        Args:
+            power_coefficients: Coeficientes [a_0, a_1, ..., a_n] del paso
+            
+        Returns:
+            Lista ordenada de raíces en el intervalo
+        """
+        power = np.asarray(power_coefficients, dtype=float)
+        self.num_steps += 1
+        
+        if self.num_steps == 1:
+            self.num_reisolated += 1
+            self.roots = list(map(float, NewtonBernstein(power, **self.options)
+                                  .find_roots(self.interval)))
+            return list(self.roots)
+        
+        lo, hi, guess = self._cells()
+        coeffs, noise = self._cell_coefficients(power, lo, hi)
+        excluded, single = _classify_rows(coeffs, noise)
+        
+        # Celdas con una raíz: Newton desde la raíz anterior
+        idx = np.flatnonzero(single & ~excluded)
+        found, converged = newton_raphson_batch(power, lo[idx], hi[idx],
+                                                tol=self.tolerance, x0=guess[idx])
+        roots = list(found[converged])
+        self.num_reused += int(converged.sum()) + int(excluded.sum())
+        
+        # Celdas no concluyentes, o sin cambio de signo numérico en los
+        # extremos: aislamiento completo en la celda, con un pequeño solape
+        a, b = self.interval
+        for i in np.concatenate([np.flatnonzero(~single & ~excluded), idx[~converged]]):
+            margin = OVERLAP * (hi[i] - lo[i])
+            cell = (max(a, lo[i] - margin), min(b, hi[i] + margin))
+            roots.extend(NewtonBernstein(power, **self.options).find_roots(cell))
+            self.num_reisolated += 1
+        
+        self.roots = [float(r) for r in merge_close_roots(roots, self.tolerance)]
+        return list(self.roots)
+    
+    def get_statistics(self) -> dict:
+        """
+        Devuelve estadísticas del barrido.
+        
+        Returns:
+            Diccionario con pasos, celdas reutilizadas y reaisladas
+        """
+        return {
+            'num_steps': self.num_steps,
+            'num_reused': self.num_reused,
+            'num_reisolated': self.num_reisolated,
+            'num_roots': len(self.roots),
+        }
+    
+    def _cells(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Partición del intervalo a partir de las raíces anteriores.
+        
+        Las fronteras son los puntos medios entre raíces consecutivas, los
+        extremos del intervalo y el origen si está en su interior (como en
+        la frontera inicial del solver, para que la cota de redondeo de la
+        conversión sea válida).
+        
+        Returns:
+            Tupla (lo, hi, guess): extremos de cada celda y la raíz anterior
+            que contiene (NaN si no contiene ninguna)
+        """
+        a, b = self.interval
+        roots = np.array(self.roots)
+        edges = [a, b] + list((roots[1:] + roots[:-1]) / 2)
+        if a < 0 < b:
+            edges.append(0.0)
+        edges = np.unique(edges)
+        lo, hi = edges[:-1], edges[1:]
+        
+        guess = np.full(len(lo), np.nan)
+        cell = np.searchsorted(edges, roots, side='right') - 1
+        inside = (cell >= 0) & (cell < len(lo))
+        guess[cell[inside]] = roots[inside]
+        return lo, hi, guess
+    
+    def _cell_coefficients(self, power: np.ndarray, lo: np.ndarray,
+                           hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Coeficientes de Bernstein y cota de redondeo de cada celda.
+        
+        Se convierte una vez por pieza de la frontera inicial y cada celda
+        se obtiene restringiendo la pieza que la contiene.
+        
+        Returns:
+            Tupla (coeficientes (k, n+1), cota de redondeo (k,))
+        """
+        _, piece_lo, piece_hi, piece_coeffs, piece_noise = _initial_frontier(
+            power[np.newaxis], self.interval
+        )
+        piece = np.searchsorted(piece_hi, hi, side='left')
+        width = piece_hi[piece] - piece_lo[piece]
+        t_min = np.clip((lo - piece_lo[piece]) / width, 0.0, 1.0)
+        t_max = np.clip((hi - piece_lo[piece]) / width, 0.0, 1.0)
+        return restrict_rows(piece_coeffs[piece], t_min, t_max), piece_noise[piece]
@@ -6,31 +6,33 @@ Funciones de apoyo para el algoritmo de Newton-Bernstein.
 """
 
 import numpy as np
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Optional
 
 
-def sign_changes(sequence: np.ndarray) -> int:
+def sign_changes(sequence: np.ndarray):
     """
     Cuenta el número de cambios de signo en una secuencia.
     
+    Los ceros se ignoran. Si la entrada es un array (k, n+1), se cuentan
+    los cambios de cada fila de forma vectorizada.
+    
     Args:
-        sequence: Array de valores numéricos
+        sequence: Array de valores numéricos, forma (n+1,) o (k, n+1)
         
     Returns:
-        Número de cambios de signo
+        Número de cambios de signo (array de forma (k,) para entradas 2D)
     """
-    signs = np.sign(sequence)
-    # Eliminar ceros
-    signs = signs[signs != 0]
+    signs = np.sign(np.asarray(sequence, dtype=float))
     
-    if len(signs) <= 1:
-        return 0
+    # Rellenar cada cero con el último signo no nulo anterior
+    positions = np.where(signs != 0, np.arange(signs.shape[-1]), 0)
+    positions = np.maximum.accumulate(positions, axis=-1)
+    filled = np.take_along_axis(signs, positions, axis=-1)
     
-    changes = 0
-    for i in range(len(signs) - 1):
-        if signs[i] * signs[i + 1] < 0:
-            changes += 1
+    changes = np.count_nonzero(filled[..., 1:] * filled[..., :-1] < 0, axis=-1)
     
+    if signs.ndim == 1:
+        return int(changes)
     return changes
 
 
@@ -106,6 +108,137 @@ def newton_raphson(f: Callable, df: Callable, x0: float,
     return x, abs(f(x)) < tol
 
 
+def newton_raphson_fused(fdf: Callable, x0: float, 
+                         tol: float = 1e-10, max_iter: int = 100) -> Tuple[float, bool]:
+    """
+    Método de Newton-Raphson con evaluación conjunta de f y f'.
+    
+    Cada iteración hace una única llamada a fdf, en lugar de evaluar la
+    función y su derivada por separado.
+    
+    Args:
+        fdf: Función x -> (f(x), f'(x))
+        x0: Aproximación inicial
+        tol: Tolerancia para |f(x)|
+        max_iter: Número máximo de iteraciones
+        
+    Returns:
+        Tupla (raíz, convergió)
+    """
+    x = x0
+    
+    for _ in range(max_iter):
+        fx, dfx = fdf(x)
+        
+        if abs(fx) < tol:
+            return x, True
+        
+        if abs(dfx) < 1e-14 or not np.isfinite(fx):
+            return x, False
+        
+        x_new = x - fx / dfx
+        
+        # Verificar convergencia
+        if abs(x_new - x) < tol:
+            return x_new, abs(fdf(x_new)[0]) < tol
+        
+        x = x_new
+    
+    return x, abs(fdf(x)[0]) < tol
+
+
+def newton_raphson_batch(coeffs: np.ndarray, lo: np.ndarray, hi: np.ndarray,
+                         tol: float = 1e-10, 
+                         max_iter: int = 100,
+                         iterations: Optional[np.ndarray] = None,
+                         x0: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Newton-Raphson salvaguardado aplicado a muchos intervalos a la vez.
+    
+    Cada intervalo [lo[i], hi[i]] debe encerrar una raíz (cambio de signo
+    en los extremos). Todos los candidatos se refinan simultáneamente con
+    actualizaciones enmascaradas: se usa el paso de Newton si cae dentro
+    del intervalo y reduce |f|; si no, regula falsi con la modificación de
+    Illinois, y bisección como último recurso.
+    
+    Args:
+        coeffs: Coeficientes [a_0, ..., a_n], forma (n+1,) común a todos
+                o (k, n+1) con un polinomio por intervalo
+        lo: Extremos izquierdos, forma (k,)
+        hi: Extremos derechos, forma (k,)
+        tol: Tolerancia en x (paso o ancho del intervalo)
+        max_iter: Número máximo de iteraciones
+        iterations: Array entero (k,) opcional donde se acumulan las
+                    iteraciones realizadas por cada intervalo
+        x0: Aproximaciones iniciales opcionales, forma (k,); las que no
+            están en el interior de su intervalo se sustituyen por el
+            punto medio
+        
+    Returns:
+        Tupla (raíces, convergió), ambos arrays de forma (k,)
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    per_row = coeffs.ndim == 2
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    
+    f_lo, _ = horner_with_derivative(coeffs, lo)
+    f_hi, _ = horner_with_derivative(coeffs, hi)
+    x = (lo + hi) / 2
+    if x0 is not None:
+        x0 = np.asarray(x0, dtype=float)
+        x = np.where((x0 > lo) & (x0 < hi), x0, x)
+    x = np.where(f_lo == 0, lo, np.where(f_hi == 0, hi, x))
+    converged = (f_lo == 0) | (f_hi == 0)
+    active = ~converged & (f_lo * f_hi < 0)
+    
+    f_prev = np.full(len(x), np.inf)
+    last_side = np.zeros(len(x), dtype=int)
+    
+    for _ in range(max_iter):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        
+        xi = x[idx]
+        fx, dfx = horner_with_derivative(coeffs[idx] if per_row else coeffs, xi)
+        if iterations is not None:
+            iterations[idx] += 1
+        
+        # Actualizar el intervalo que encierra la raíz; Illinois divide a la
+        # mitad el valor del extremo que se repite dos veces seguidas
+        left = np.sign(fx) == np.sign(f_lo[idx])
+        side = np.where(left, -1, 1)
+        repeated = side == last_side[idx]
+        f_lo_i = np.where(left, fx, np.where(repeated, f_lo[idx] / 2, f_lo[idx]))
+        f_hi_i = np.where(left, np.where(repeated, f_hi[idx] / 2, f_hi[idx]), fx)
+        lo_i = np.where(left, xi, lo[idx])
+        hi_i = np.where(left, hi[idx], xi)
+        
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            x_newton = xi - fx / dfx
+            x_falsi = (lo_i * f_hi_i - hi_i * f_lo_i) / (f_hi_i - f_lo_i)
+        
+        newton_ok = (np.isfinite(x_newton) & (x_newton > lo_i) & (x_newton < hi_i) &
+                     (np.abs(fx) <= 0.5 * f_prev[idx]))
+        falsi_ok = np.isfinite(x_falsi) & (x_falsi > lo_i) & (x_falsi < hi_i)
+        x_new = np.where(newton_ok, x_newton,
+                         np.where(falsi_ok, x_falsi, (lo_i + hi_i) / 2))
+        
+        done = ((fx == 0) | (hi_i - lo_i < tol) |
+                (newton_ok & (np.abs(x_new - xi) < tol)))
+        
+        x[idx] = np.where(fx == 0, xi, x_new)
+        lo[idx], hi[idx] = lo_i, hi_i
+        f_lo[idx], f_hi[idx] = f_lo_i, f_hi_i
+        f_prev[idx] = np.abs(fx)
+        last_side[idx] = side
+        converged[idx[done]] = True
+        active[idx[done]] = False
+    
+    return x, converged
+
+
 def is_in_interval(x: float, interval: Tuple[float, float], 
                    margin: float = 0) -> bool:
     """
@@ -147,17 +280,110 @@ def merge_close_roots(roots: List[float], tol: float = 1e-6) -> List[float]:
     return merged
 
 
+def horner_with_derivative(coeffs: np.ndarray, x) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evalúa p(x) y p'(x) en una sola pasada del esquema de Horner.
+    
+    Acepta arrays de puntos. Si coeffs tiene forma (k, n+1), cada fila se
+    evalúa en su propio punto x[i].
+    
+    Args:
+        coeffs: Coeficientes [a_0, a_1, ..., a_n], forma (n+1,) o (k, n+1)
+        x: Punto o array de puntos
+        
+    Returns:
+        Tupla (p(x), p'(x))
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    x = np.asarray(x, dtype=float)
+    p = np.zeros(np.broadcast_shapes(x.shape, coeffs.shape[:-1]))
+    dp = np.zeros_like(p)
+    
+    for j in range(coeffs.shape[-1] - 1, -1, -1):
+        dp = dp * x + p
+        p = p * x + coeffs[..., j]
+    
+    return p, dp
+
+
+def root_bound(coeffs: np.ndarray) -> float:
+    """
+    Cota superior del módulo de las raíces de un polinomio.
+    
+    Devuelve el mínimo de la cota de Fujiwara,
+    2 max(|a_{n-1}/a_n|, |a_{n-2}/a_n|^(1/2), ..., |a_0/(2 a_n)|^(1/n)),
+    y la de Lagrange, max(1, sum_i |a_i/a_n|).
+    
+    Args:
+        coeffs: Coeficientes [a_0, a_1, ..., a_n] con a_n != 0
+        
+    Returns:
+        Cota B tal que toda raíz cumple |x| <= B
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    n = len(coeffs) - 1
+    if n < 1:
+        return 0.0
+    
+    ratios = np.abs(coeffs[:-1] / coeffs[-1])
+    ratios[0] /= 2
+    fujiwara = 2 * np.max(ratios ** (1.0 / np.arange(n, 0, -1)))
+    ratios[0] *= 2
+    lagrange = max(1.0, ratios.sum())
+    return float(min(fujiwara, lagrange))
+
+
 def polynomial_from_coeffs(coeffs: np.ndarray) -> Callable:
     """
     Crea una función polinomial a partir de sus coeficientes.
     
+    La función devuelta evalúa escalares con Horner sobre floats de Python
+    y arrays con Horner vectorizado.
+    
     Args:
         coeffs: Coeficientes [a_0, a_1, ..., a_n] para p(x) = sum a_i * x^i
         
     Returns:
         Función que evalúa el polinomio
     """
-    return lambda x: np.polyval(coeffs[::-1], x)
+    coeffs = np.asarray(coeffs, dtype=float)
+    reversed_coeffs = [float(c) for c in coeffs[::-1]]
+    
+    def p(x):
+        if np.ndim(x) == 0:
+            value = 0.0
+            for c in reversed_coeffs:
+                value = value * x + c
+            return value
+        return horner_with_derivative(coeffs, x)[0]
+    
+    return p
+
+
+def polynomial_with_derivative(coeffs: np.ndarray) -> Callable:
+    """
+    Crea una función que evalúa el polinomio y su derivada a la vez.
+    
+    Args:
+        coeffs: Coeficientes [a_0, a_1, ..., a_n] para p(x) = sum a_i * x^i
+        
+    Returns:
+        Función x -> (p(x), p'(x)); acepta escalares y arrays
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    reversed_coeffs = [float(c) for c in coeffs[::-1]]
+    
+    def fdf(x):
+        if np.ndim(x) == 0:
+            value = 0.0
+            deriv = 0.0
+            for c in reversed_coeffs:
+                deriv = deriv * x + value
+                value = value * x + c
+            return value, deriv
+        return horner_with_derivative(coeffs, x)
+    
+    return fdf
 
 
 def polynomial_derivative_coeffs(coeffs: np.ndarray) -> np.ndarray:
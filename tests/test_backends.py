@@ -0,0 +1,44 @@
+"""
+Tests para la aritmética de precisión extendida
+"""
+
+import pytest
+import numpy as np
+from fractions import Fraction
+from src.backends import (
+    backend_scalar, power_to_bernstein_generic, de_casteljau_split_generic,
+    sign_changes_generic, horner_generic
+)
+from src.bernstein import BernsteinPolynomial
+
+
+class TestBackends:
+    
+    @pytest.mark.parametrize("backend", ["float64", "longdouble", "fraction"])
+    def test_conversion_matches_float(self, backend):
+        """La conversión genérica coincide con la de float64."""
+        coeffs = [-6, 11, -6, 1]
+        scalar = backend_scalar(backend)
+        generic = power_to_bernstein_generic([scalar(c) for c in coeffs],
+                                             scalar(0.5), scalar(3.5))
+        expected = BernsteinPolynomial.from_power_basis(coeffs, (0.5, 3.5)).coefficients
+        
+        assert np.allclose([float(b) for b in generic], expected)
+    
+    def test_fraction_is_exact(self):
+        """Con Fraction la subdivisión y la evaluación son exactas."""
+        coeffs = [Fraction(c) for c in [-6, 11, -6, 1]]
+        bernstein = power_to_bernstein_generic(coeffs, Fraction(0), Fraction(4))
+        left, right = de_casteljau_split_generic(bernstein)
+        
+        assert left[-1] == right[0] == horner_generic(coeffs, Fraction(2)) == 0
+        assert sign_changes_generic(bernstein) == 3
+    
+    def test_unknown_backend(self):
+        """Test de backend desconocido."""
+        with pytest.raises(ValueError):
+            backend_scalar("float128")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""
+Tests para el benchmark de búsqueda de raíces
+"""
+
+import json
+import pytest
+import numpy as np
+from benchmarks.benchmark_roots import (
+    FAMILIES, run_case, run_benchmark, compare_results, main
+)
+
+
+class TestBenchmark:
+    
+    @pytest.mark.parametrize("family", sorted(FAMILIES))
+    def test_families(self, family):
+        """Cada familia genera el grado pedido y un intervalo válido."""
+        coeffs, interval, exact = FAMILIES[family](10)
+        
+        assert len(coeffs) == 11
+        assert interval[0] < interval[1]
+        if exact is not None:
+            assert len(exact) == 10
+            assert np.allclose(np.polynomial.polynomial.polyval(exact, coeffs), 0, atol=1e-6)
+    
+    def test_run_case(self):
+        """Un caso registra tiempos, estadísticas y errores."""
+        case = run_case("chebyshev", 10, repeats=1)
+        
+        assert case["num_roots"] == case["num_roots_exact"] == 10
+        assert case["error_nb"] < 1e-8
+        assert case["num_subdivisions"] > 0
+        assert json.loads(json.dumps(case)) == case
+    
+    def test_compare_flags_regressions(self):
+        """La comparación señala tiempo, raíces y error peores."""
+        baseline = run_benchmark(["wilkinson"], [5], repeats=1, verbose=False)
+        current = json.loads(json.dumps(baseline))
+        
+        assert compare_results(baseline, current) == []
+        
+        case = current["results"][0]
+        case["time_nb"] *= 2
+        case["num_roots"] -= 1
+        case["error_nb"] = 1.0
+        assert len(compare_results(baseline, current)) == 3
+    
+    def test_command_line(self, tmp_path):
+        """La línea de órdenes guarda resultados y compara ficheros."""
+        output = str(tmp_path / "results.json")
+        
+        assert main(["--families", "random", "--degrees", "5", "--repeats", "1",
+                     "--output", output]) == 0
+        assert main(["--compare", output, output, "--time-ratio", "1e9"]) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,7 +4,10 @@ Tests para el módulo de polinomios de Bernstein
 
 import pytest
 import numpy as np
-from src.bernstein import BernsteinPolynomial
+from src.bernstein import (
+    BernsteinPolynomial, power_to_bernstein, power_to_bernstein_matrix,
+    bezier_clip, quadratic_clip
+)
 
 
 class TestBernsteinPolynomial:
@@ -57,6 +60,33 @@ class TestBernsteinPolynomial:
         assert min_val == 1
         assert max_val == 4
     
+    def test_evaluate_array(self):
+        """Test de evaluación vectorizada sobre un array de puntos."""
+        power_coeffs = np.array([-6.0, 11.0, -6.0, 1.0])
+        poly = BernsteinPolynomial.from_power_basis(power_coeffs, (0, 4))
+        x = np.linspace(0, 4, 41).reshape(41, 1)
+        
+        values = poly.evaluate(x)
+        
+        assert values.shape == x.shape
+        assert np.allclose(values, np.polynomial.polynomial.polyval(x, power_coeffs))
+    
+    def test_evaluate_with_derivative(self):
+        """Test de evaluación conjunta de p y p'."""
+        power_coeffs = np.array([-6.0, 11.0, -6.0, 1.0])
+        poly = BernsteinPolynomial.from_power_basis(power_coeffs, (0, 4))
+        x = np.linspace(0, 4, 17)
+        
+        values, slopes = poly.evaluate(x, derivative=True)
+        deriv_coeffs = np.polynomial.polynomial.polyder(power_coeffs)
+        
+        assert np.allclose(values, np.polynomial.polynomial.polyval(x, power_coeffs))
+        assert np.allclose(slopes, np.polynomial.polynomial.polyval(x, deriv_coeffs))
+        
+        value, slope = poly.evaluate(2.5, derivative=True)
+        assert np.isclose(value, poly.evaluate(2.5))
+        assert np.isclose(slope, poly.derivative().evaluate(2.5))
+    
     def test_derivative(self):
         """Test de derivada."""
         # p(x) = x² en [0, 1], p'(x) = 2x
@@ -88,6 +118,76 @@ class TestBernsteinPolynomial:
         test_point = 0.75
         assert np.isclose(poly.evaluate(test_point), right.evaluate(test_point))
     
+    def test_subdivide_into_buffer(self):
+        """Test de subdivisión escribiendo en un buffer del llamador."""
+        poly = BernsteinPolynomial.from_power_basis(np.array([-6, 11, -6, 1]), (0, 4))
+        expected_left, expected_right = poly.subdivide(0.25)
+        
+        buffer = np.empty((2, 4))
+        left, right = poly.subdivide(0.25, out=buffer)
+        
+        assert np.shares_memory(left.coefficients, buffer)
+        assert np.shares_memory(right.coefficients, buffer)
+        assert np.allclose(left.coefficients, expected_left.coefficients)
+        assert np.allclose(right.coefficients, expected_right.coefficients)
+        
+        with pytest.raises(ValueError):
+            poly.subdivide(0.5, out=np.empty((2, 3)))
+    
+    def test_view_without_copy(self):
+        """Test de polinomio que envuelve una vista sin copiar."""
+        coeffs = np.array([1.0, -1.0, 2.0])
+        view = BernsteinPolynomial(coeffs, copy=False)
+        copied = BernsteinPolynomial(coeffs)
+        
+        assert np.shares_memory(view.coefficients, coeffs)
+        assert not np.shares_memory(copied.coefficients, coeffs)
+        assert not hasattr(view, '__dict__')
+    
+    def test_subdivide_matches_conversion(self):
+        """Test de que subdividir equivale a convertir en el subintervalo."""
+        # p(x) = (x-1)(x-2)(x-3) en [0, 4]
+        power_coeffs = np.array([-6, 11, -6, 1])
+        poly = BernsteinPolynomial.from_power_basis(power_coeffs, (0, 4))
+        
+        left, right = poly.subdivide(t=0.25)
+        expected_left = BernsteinPolynomial.from_power_basis(power_coeffs, (0, 1))
+        expected_right = BernsteinPolynomial.from_power_basis(power_coeffs, (1, 4))
+        
+        assert np.allclose(left.coefficients, expected_left.coefficients)
+        assert np.allclose(right.coefficients, expected_right.coefficients)
+        assert right.interval == (1, 4)
+    
+    def test_to_power_basis_roundtrip(self):
+        """Test de ida y vuelta entre bases en un intervalo desplazado."""
+        power_coeffs = np.array([3, -1, 2, 0.5, -4])
+        poly = BernsteinPolynomial.from_power_basis(power_coeffs, (1, 3))
+        
+        assert np.allclose(poly.to_power_basis(), power_coeffs)
+    
+    def test_restrict(self):
+        """Test de restricción a un subintervalo por De Casteljau."""
+        power_coeffs = np.array([-6, 11, -6, 1])
+        poly = BernsteinPolynomial.from_power_basis(power_coeffs, (0, 4))
+        
+        restricted = poly.restrict((1.5, 2.5))
+        expected = BernsteinPolynomial.from_power_basis(power_coeffs, (1.5, 2.5))
+        
+        assert restricted.interval == (1.5, 2.5)
+        assert np.allclose(restricted.coefficients, expected.coefficients)
+        assert np.isclose(restricted.evaluate(2.2), poly.evaluate(2.2))
+    
+    def test_conversion_matrices_cached(self):
+        """Test de la caché de matrices y de la conversión por lotes."""
+        assert power_to_bernstein_matrix(7) is power_to_bernstein_matrix(7)
+        
+        batch = np.array([[1, 2, 3], [0, 0, 1]])
+        converted = power_to_bernstein(batch, (-1, 2))
+        
+        for row, power_coeffs in zip(converted, batch):
+            poly = BernsteinPolynomial.from_power_basis(power_coeffs, (-1, 2))
+            assert np.allclose(row, poly.coefficients)
+    
     def test_sign_changes(self):
         """Test de conteo de cambios de signo."""
         # Sin cambios de signo
@@ -106,5 +206,31 @@ class TestBernsteinPolynomial:
         assert poly3.sign_changes() == 1
 
 
+class TestClipping:
+    
+    def test_bezier_clip_contains_root(self):
+        """El recorte de Bézier acota la raíz de x² - 2 en [1, 2]."""
+        coeffs = power_to_bernstein(np.array([-2.0, 0.0, 1.0]), (1, 2))[np.newaxis, :]
+        (t_min,), (t_max,) = bezier_clip(coeffs)
+        
+        assert t_min <= np.sqrt(2) - 1 <= t_max
+        assert t_max - t_min < 0.5
+    
+    def test_quadratic_clip_exact_for_quadratics(self):
+        """El recorte cuadrático es exacto para polinomios de grado 2."""
+        coeffs = power_to_bernstein(np.array([-2.0, 0.0, 1.0]), (1, 2))[np.newaxis, :]
+        (t_min,), (t_max,) = quadratic_clip(coeffs)
+        
+        assert np.isclose(t_min, np.sqrt(2) - 1, atol=1e-12)
+        assert np.isclose(t_max, np.sqrt(2) - 1, atol=1e-12)
+    
+    def test_clip_without_crossing(self):
+        """Sin cruce de la envolvente el recorte es vacío (NaN)."""
+        coeffs = np.array([[1.0, 2.0, 0.5, 3.0]])
+        
+        assert np.isnan(bezier_clip(coeffs)[0]).all()
+        assert np.isnan(quadratic_clip(coeffs)[0]).all()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""
+Tests para la caché de resultados
+"""
+
+import time
+import pytest
+import numpy as np
+from src.cache import ResultCache, cache_key
+from src.newton_bernstein import NewtonBernstein, find_roots
+
+
+class TestResultCache:
+    
+    def test_repeated_solve_hits(self):
+        """Resolver dos veces el mismo polinomio acierta en la caché."""
+        cache = ResultCache()
+        first = find_roots([-6, 11, -6, 1], (0, 4), cache=cache)
+        second = find_roots(np.array([-6.0, 11.0, -6.0, 1.0]), (0, 4), cache=cache)
+        
+        assert first == second
+        assert cache.get_statistics()['hits'] == 1
+        assert cache.get_statistics()['misses'] == 1
+    
+    def test_key_depends_on_options(self):
+        """Intervalo, tolerancia y coeficientes forman parte de la clave."""
+        base = cache_key([-6, 11, -6, 1], (0, 4), tolerance=1e-10)
+        
+        assert base == cache_key([-6, 11, -6, 1], (0.0, 4.0), tolerance=1e-10)
+        assert base != cache_key([-6, 11, -6, 1], (0, 3), tolerance=1e-10)
+        assert base != cache_key([-6, 11, -6, 1], (0, 4), tolerance=1e-8)
+        assert base != cache_key([-6, 11, -6, 2], (0, 4), tolerance=1e-10)
+    
+    def test_hit_restores_clusters(self):
+        """Un acierto conserva la información de multiplicidad."""
+        cache = ResultCache()
+        coeffs = np.polynomial.polynomial.polyfromroots([1, 1, 1, 2])
+        expected = NewtonBernstein(coeffs, cache=cache).find_roots_with_multiplicity((0, 3))
+        solver = NewtonBernstein(coeffs, cache=cache)
+        
+        assert solver.find_roots_with_multiplicity((0, 3)) == expected
+        assert cache.get_statistics()['hits'] == 1
+        assert solver.get_statistics()['num_subdivisions'] == 0
+    
+    def test_lru_eviction(self):
+        """Se descarta la entrada usada hace más tiempo."""
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        
+        assert cache.get('b') is None
+        assert cache.get('a') == 1 and cache.get('c') == 3
+        assert cache.get_statistics()['evictions'] == 1
+    
+    def test_ttl(self):
+        """Las entradas caducadas no se devuelven."""
+        cache = ResultCache(ttl=0.01)
+        cache.put('a', 1)
+        time.sleep(0.02)
+        
+        assert cache.get('a') is None
+        assert len(cache) == 0
+    
+    def test_persistence(self, tmp_path):
+        """Las entradas se guardan y se recuperan de disco."""
+        path = str(tmp_path / "roots.json")
+        cache = ResultCache(path=path)
+        roots = find_roots([-6, 11, -6, 1], (0, 4), cache=cache)
+        cache.save()
+        
+        restored = ResultCache(path=path)
+        assert len(restored) == 1
+        assert find_roots([-6, 11, -6, 1], (0, 4), cache=restored) == roots
+        assert restored.get_statistics()['hits'] == 1
+    
+    def test_invalid_arguments(self):
+        """Tamaño y caducidad no válidos."""
+        with pytest.raises(ValueError):
+            ResultCache(maxsize=0)
+        with pytest.raises(ValueError):
+            ResultCache(ttl=-1)
+        with pytest.raises(ValueError):
+            ResultCache().save()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
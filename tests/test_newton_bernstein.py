@@ -2,9 +2,12 @@
 Tests para el algoritmo de Newton-Bernstein
 """
 
+import json
 import pytest
 import numpy as np
-from src.newton_bernstein import NewtonBernstein, find_roots
+from src.newton_bernstein import (
+    NewtonBernstein, find_roots, find_roots_batch, find_all_real_roots
+)
 
 
 class TestNewtonBernstein:
@@ -66,6 +69,74 @@ class TestNewtonBernstein:
         assert len(roots) >= 1
         assert any(np.isclose(root, 2.0, atol=1e-6) for root in roots)
     
+    @pytest.mark.parametrize("strategy", ["bisect", "clip", "quadclip"])
+    @pytest.mark.parametrize("double, others, interval", [
+        (0.5, [0.9], (0, 1)),
+        (0.25, [0.9], (0, 1)),
+        (0.75, [0.1], (0, 1)),
+        (0.5, [-0.7, 0.1], (-1, 1)),
+        (-0.5, [0.3], (-1, 1)),
+    ])
+    def test_double_root_at_split_point(self, strategy, double, others, interval):
+        """Una raíz doble en un punto de subdivisión no se pierde."""
+        coeffs = np.polynomial.polynomial.polyfromroots([double, double] + others)
+        roots = NewtonBernstein(coeffs, strategy=strategy).find_roots(interval)
+        
+        for expected in [double] + others:
+            assert any(np.isclose(root, expected, atol=1e-6) for root in roots)
+    
+    def test_multiplicity_detection(self):
+        """Test de detección de raíces múltiples con su multiplicidad."""
+        # p(x) = (x - 0.3)³ (x - 0.7)
+        coeffs = np.polynomial.polynomial.polyfromroots([0.3, 0.3, 0.3, 0.7])
+        solver = NewtonBernstein(coeffs)
+        result = solver.find_roots_with_multiplicity((0, 1))
+        
+        assert [k for _, k in result] == [3, 1]
+        assert np.allclose([r for r, _ in result], [0.3, 0.7], atol=1e-8)
+        assert solver.get_statistics()['num_clusters'] == 1
+    
+    def test_cluster_stops_subdivision(self):
+        """Una raíz doble se identifica sin subdividir hasta la tolerancia."""
+        # p(x) = (x - 1)(x - 2)²(x - 3)(x - 4)
+        coeffs = np.polynomial.polynomial.polyfromroots([1, 2, 2, 3, 4])
+        solver = NewtonBernstein(coeffs)
+        result = solver.find_roots_with_multiplicity((0, 5))
+        
+        assert [k for _, k in result] == [1, 2, 1, 1]
+        assert np.allclose([r for r, _ in result], [1, 2, 3, 4], atol=1e-8)
+        assert solver.get_statistics()['num_subdivisions'] < 10
+    
+    @pytest.mark.parametrize("strategy", ["bisect", "clip", "quadclip"])
+    @pytest.mark.parametrize("roots, interval, expected", [
+        ([0.5, 0.5, 0.2], (0, 1), [(0.2, 1), (0.5, 2)]),
+        ([-0.5, -0.5], (-1, 1), [(-0.5, 2)]),
+        ([0.75, 0.75, 0.9], (0, 1), [(0.75, 2), (0.9, 1)]),
+        ([0.0, 0.0, 0.8, -0.74], (-1, 1), [(-0.74, 1), (0.0, 2), (0.8, 1)]),
+        ([0.25, 0.25, 0.25, 0.9], (0, 1), [(0.25, 3), (0.9, 1)]),
+        ([0.5, 0.5, 0.5, 0.1], (0, 1), [(0.1, 1), (0.5, 3)]),
+    ])
+    def test_multiplicity_at_split_point(self, strategy, roots, interval, expected):
+        """Una raíz múltiple en un punto de subdivisión se devuelve una sola vez."""
+        coeffs = np.polynomial.polynomial.polyfromroots(roots)
+        result = NewtonBernstein(coeffs, strategy=strategy).find_roots_with_multiplicity(interval)
+        
+        assert [k for _, k in result] == [k for _, k in expected]
+        assert np.allclose([r for r, _ in result], [r for r, _ in expected], atol=1e-6)
+    
+    @pytest.mark.parametrize("strategy", ["bisect", "clip", "quadclip"])
+    def test_close_simple_roots_not_merged(self, strategy):
+        """Raíces simples próximas pero separables no se fusionan en un cúmulo."""
+        # |p| en el punto medio de 0.3624 y 0.3629 es menor que la tolerancia
+        expected = [-0.7, -0.24, 0.05, 0.08, 0.33, 0.3624, 0.3629, 0.56, 0.65]
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        solver = NewtonBernstein(coeffs, strategy=strategy)
+        result = solver.find_roots_with_multiplicity((-1, 1))
+        
+        assert [k for _, k in result] == [1] * len(expected)
+        assert np.allclose([r for r, _ in result], expected, atol=1e-8)
+        assert len(find_all_real_roots(coeffs)) == len(expected)
+    
     def test_verify_roots(self):
         """Test de verificación de raíces."""
         coeffs = np.array([-6, 11, -6, 1])
@@ -91,6 +162,15 @@ class TestNewtonBernstein:
         assert 'num_exclusions' in stats
         assert stats['polynomial_degree'] == 3
     
+    def test_single_sign_variation_skips_subdivision(self):
+        """Test de la regla de Descartes: una variación aísla la raíz."""
+        # p(x) = x - 2: coeficientes de Bernstein en [0, 5] son [-2, 3]
+        solver = NewtonBernstein(np.array([-2, 1]))
+        roots = solver.find_roots((0, 5))
+        
+        assert np.isclose(roots[0], 2.0, atol=1e-10)
+        assert solver.get_statistics()['num_subdivisions'] == 0
+    
     def test_different_tolerance(self):
         """Test con diferentes tolerancias."""
         coeffs = np.array([-2, 1])  # x - 2
@@ -115,6 +195,297 @@ class TestNewtonBernstein:
         assert len(roots) == 2
         assert np.isclose(roots[0], -2.0, atol=1e-8)
         assert np.isclose(roots[1], -1.0, atol=1e-8)
+    
+    def test_high_degree_polynomial(self):
+        """Test con polinomio de grado alto y raíces conocidas."""
+        expected = np.linspace(-0.9, 0.9, 12)
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        roots = find_roots(coeffs, (-1, 1))
+        
+        assert len(roots) == len(expected)
+        assert np.allclose(roots, expected, atol=1e-8)
+    
+    def test_degree_thirty_symmetric_interval(self):
+        """Test de grado 30 en un intervalo que contiene el origen."""
+        expected = np.linspace(-0.95, 0.95, 30)
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        roots = find_roots(coeffs, (-1, 1))
+        
+        assert len(roots) == 30
+        assert np.allclose(roots, expected, atol=1e-8)
+    
+    def test_interval_far_from_origin(self):
+        """Test con un intervalo alejado del origen."""
+        expected = [1000.25, 1000.5, 1000.75]
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        roots = find_roots(coeffs, (1000, 1001))
+        
+        assert len(roots) == 3
+        assert np.allclose(roots, expected, atol=1e-6)
+    
+    def test_batch_matches_known_roots(self):
+        """Test del cálculo por lotes con raíces conocidas."""
+        rng = np.random.default_rng(0)
+        expected = np.sort(rng.uniform(-0.9, 0.9, size=(50, 4)), axis=1)
+        coeff_matrix = np.array([
+            np.polynomial.polynomial.polyfromroots(r) for r in expected
+        ])
+        
+        roots, offsets = find_roots_batch(coeff_matrix, (-1, 1))
+        
+        assert len(offsets) == 51
+        for k in range(50):
+            found = roots[offsets[k]:offsets[k + 1]]
+            assert len(found) == 4
+            assert np.allclose(found, expected[k], atol=1e-8)
+    
+    def test_batch_ragged_output(self):
+        """Test de salida irregular: distinto número de raíces por fila."""
+        coeff_matrix = np.array([
+            [-6, 11, -6, 1],  # (x-1)(x-2)(x-3)
+            [1, 0, 1, 0],     # x² + 1, sin raíces reales
+            [-2, 1, 0, 0],    # x - 2
+        ])
+        
+        roots, offsets = find_roots_batch(coeff_matrix, (0, 4))
+        
+        assert list(offsets) == [0, 3, 3, 4]
+        assert np.allclose(roots, [1.0, 2.0, 3.0, 2.0], atol=1e-8)
+    
+    def test_batch_multiple_roots_match_single(self):
+        """Las raíces múltiples del lote se devuelven una vez, como en NewtonBernstein."""
+        cases = [[0.3, 0.3, 0.7, 0.7], [0.2, 0.5, 0.5, -0.4], [0.1, 0.1, 0.1, 0.6],
+                 [0.5, 0.5, 0.9, 0.13], [-0.5, -0.5, 0.25, 0.8]]
+        coeff_matrix = np.array([np.polynomial.polynomial.polyfromroots(r) for r in cases])
+        
+        roots, offsets = find_roots_batch(coeff_matrix, (-1, 1))
+        
+        for k, expected in enumerate(cases):
+            found = roots[offsets[k]:offsets[k + 1]]
+            assert np.allclose(found, np.unique(expected), atol=1e-6)
+            assert np.allclose(found, find_roots(coeff_matrix[k], (-1, 1)), atol=1e-8)
+    
+    def test_batch_discards_unconverged_iterates(self):
+        """Los iterados de Newton sin convergencia no se devuelven como raíces."""
+        expected = np.array([[0.1, 0.35, 0.8], [0.2, 0.55, 0.9]])
+        coeff_matrix = np.array([
+            np.polynomial.polynomial.polyfromroots(r) for r in expected
+        ])
+        
+        roots, offsets = find_roots_batch(coeff_matrix, (0, 1), max_newton_iter=1)
+        
+        assert list(offsets) == [0, 3, 6]
+        assert np.allclose(roots, expected.ravel(), atol=1e-8)
+    
+    @pytest.mark.parametrize("strategy", ["clip", "quadclip"])
+    def test_clipping_strategies(self, strategy):
+        """Test de las estrategias de recorte frente a la bisección."""
+        expected = np.linspace(-0.95, 0.95, 20)
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        solver = NewtonBernstein(coeffs, strategy=strategy)
+        roots = solver.find_roots((-1, 1))
+        
+        assert len(roots) == 20
+        assert np.allclose(roots, expected, atol=1e-8)
+        assert solver.get_statistics()['num_clips'] > 0
+        
+        roots = find_roots([-6, 11, -6, 1], (0, 4), strategy=strategy)
+        assert np.allclose(roots, [1.0, 2.0, 3.0], atol=1e-8)
+    
+    def test_parallel_matches_serial(self):
+        """Test de la búsqueda repartida entre procesos."""
+        expected = np.linspace(-0.95, 0.95, 20)
+        coeffs = np.polynomial.polynomial.polyfromroots(expected)
+        solver = NewtonBernstein(coeffs)
+        roots = solver.find_roots((-1, 1), workers=2)
+        
+        assert len(roots) == 20
+        assert np.allclose(roots, expected, atol=1e-8)
+        assert solver.get_statistics()['num_newton_steps'] >= 20
+        
+        with pytest.raises(ValueError):
+            solver.find_roots((-1, 1), workers=0)
+    
+    def test_parallel_merges_profile_and_clusters(self):
+        """Test del perfil y los cúmulos combinados entre procesos."""
+        coeffs = np.polynomial.polynomial.polyfromroots([-0.5, 0.3, 0.3, 0.3, 0.7])
+        events = []
+        solver = NewtonBernstein(coeffs, tolerance=1e-8,
+                                 profile_callback=lambda event, data: events.append(event))
+        solver.find_roots((-1, 1))
+        serial = solver.clusters
+        solver.find_roots((-1, 1), workers=2)
+        stats = solver.get_statistics()
+        profile = stats['profile']
+        
+        assert [k for _, k in solver.clusters] == [k for _, k in serial] == [3]
+        assert np.isclose(solver.clusters[0][0], 0.3, atol=1e-4)
+        assert stats['num_clusters'] == 1
+        assert sum(profile['depth_nodes']) > 0
+        assert sum(profile['newton_iterations'].values()) == stats['num_newton_steps']
+        assert profile['excluded'] == stats['num_exclusions']
+        assert events[-1] == 'done'
+    
+    def test_parallel_batch_matches_serial(self):
+        """Test del lote repartido entre procesos."""
+        rng = np.random.default_rng(1)
+        expected = np.sort(rng.uniform(-0.9, 0.9, size=(40, 3)), axis=1)
+        coeff_matrix = np.array([
+            np.polynomial.polynomial.polyfromroots(r) for r in expected
+        ])
+        
+        roots, offsets = find_roots_batch(coeff_matrix, (-1, 1))
+        par_roots, par_offsets = find_roots_batch(coeff_matrix, (-1, 1), workers=2)
+        
+        assert np.array_equal(offsets, par_offsets)
+        assert np.allclose(roots, par_roots)
+    
+    def test_certified_enclosures(self):
+        """Test de intervalos certificados con raíz única."""
+        solver = NewtonBernstein([-6, 11, -6, 1])
+        enclosures = solver.find_root_enclosures((0, 4))
+        
+        assert len(enclosures) == 3
+        for (lo, hi), root in zip(enclosures, [1.0, 2.0, 3.0]):
+            assert lo <= root <= hi
+            assert hi - lo <= solver.tolerance
+        assert solver.get_statistics()['num_certified'] == 3
+    
+    def test_certified_root_at_split_point(self):
+        """Test de raíz en el origen, frontera de la subdivisión inicial."""
+        solver = NewtonBernstein([0, -1, 0, 1])  # x³ - x
+        enclosures = solver.find_root_enclosures((-2, 2))
+        
+        assert len(enclosures) == 3
+        assert all(lo <= root <= hi for (lo, hi), root in zip(enclosures, [-1, 0, 1]))
+    
+    def test_enclosures_cover_every_simple_root(self):
+        """Ninguna raíz simple se pierde: está certificada o queda como dudosa."""
+        # -0.63747 y -0.63580 caen en intervalos con coeficientes por debajo
+        # de la cota de redondeo de la conversión
+        close = [-0.6986, -0.65669, -0.63747, -0.6358, -0.58562, -0.47727,
+                 -0.24809, -0.10137, 0.08265, 0.09831, 0.2381, 0.27881]
+        rng = np.random.default_rng(3)
+        cases = [close] + [np.sort(rng.uniform(-1, 1, 12)) for _ in range(10)]
+        
+        for expected in cases:
+            solver = NewtonBernstein(np.polynomial.polynomial.polyfromroots(expected))
+            enclosures = solver.find_root_enclosures((-1.2, 1.2))
+            candidates = enclosures + solver.uncertified_enclosures
+            
+            for root in expected:
+                assert any(lo - 1e-9 <= root <= hi + 1e-9 for lo, hi in candidates)
+            for lo, hi in enclosures:
+                assert np.count_nonzero((np.array(expected) >= lo - 1e-9) &
+                                        (np.array(expected) <= hi + 1e-9)) == 1
+        
+        solver = NewtonBernstein(np.polynomial.polynomial.polyfromroots(close))
+        assert len(solver.find_root_enclosures((-1.2, 1.2))) == len(close)
+    
+    def test_multiple_root_not_certified(self):
+        """Una raíz doble no puede certificarse como raíz única."""
+        # p(x) = (x - 1)(x - 2)²
+        solver = NewtonBernstein([-4, 8, -5, 1])
+        enclosures = solver.find_root_enclosures((0, 3))
+        
+        assert len(enclosures) == 1
+        assert enclosures[0][0] <= 1.0 <= enclosures[0][1]
+        assert all(lo <= 2.0 + 1e-6 and hi >= 2.0 - 1e-6
+                   for lo, hi in solver.uncertified_enclosures)
+    
+    def test_profiling(self):
+        """Test de la instrumentación opcional."""
+        events = []
+        solver = NewtonBernstein([-6, 11, -6, 1],
+                                 profile_callback=lambda event, data: events.append(event))
+        solver.find_roots((0, 4))
+        profile = solver.get_statistics()['profile']
+        
+        assert profile['depth_nodes'][0] == 1
+        assert set(profile['timings']) == {'conversion', 'bounds', 'newton', 'extended',
+                                           'subdivision', 'merge'}
+        assert sum(profile['newton_iterations'].values()) == solver.get_statistics()['num_newton_steps']
+        assert profile['excluded'] == solver.get_statistics()['num_exclusions']
+        assert events[-1] == 'done' and events.count('level') == len(profile['depth_nodes'])
+        exported = json.loads(solver.profiler.to_json())
+        assert exported['depth_nodes'] == profile['depth_nodes']
+        assert exported['exclusion_ratio'] == profile['exclusion_ratio']
+    
+    @pytest.mark.parametrize("strategy", ["clip", "quadclip"])
+    def test_profiling_counts_clip_exclusions(self, strategy):
+        """Los intervalos que descarta el recorte también constan en el perfil."""
+        solver = NewtonBernstein([3, -9, 4, 6], strategy=strategy, profile=True)
+        solver.find_roots((-1, 1))
+        stats = solver.get_statistics()
+        
+        assert stats['num_exclusions'] > 0
+        assert stats['profile']['excluded'] == stats['num_exclusions']
+        assert sum(stats['profile']['newton_iterations'].values()) == stats['num_newton_steps']
+    
+    def test_profiling_disabled(self):
+        """Sin instrumentación no hay perfil en las estadísticas."""
+        solver = NewtonBernstein([-6, 11, -6, 1])
+        solver.find_roots((0, 4))
+        
+        assert solver.profiler is None
+        assert 'profile' not in solver.get_statistics()
+    
+    @pytest.mark.parametrize("backend", ["longdouble", "fraction"])
+    def test_extended_backend_wilkinson(self, backend):
+        """El backend extendido aísla las raíces de Wilkinson con menos subdivisiones."""
+        coeffs = np.polynomial.polynomial.polyfromroots(np.arange(1, 21))
+        baseline = NewtonBernstein(coeffs)
+        baseline.find_roots((0.5, 20.5))
+        solver = NewtonBernstein(coeffs, backend=backend)
+        roots = solver.find_roots((0.5, 20.5))
+        
+        assert len(roots) == 20
+        assert np.allclose(roots, np.arange(1, 21), atol=1e-3)
+        assert solver.get_statistics()['num_extended'] > 0
+        assert solver.get_statistics()['num_subdivisions'] < baseline.get_statistics()['num_subdivisions']
+    
+    def test_extended_backend_well_conditioned(self):
+        """Sin intervalos dudosos el backend extendido no interviene."""
+        solver = NewtonBernstein([-6, 11, -6, 1], backend="fraction")
+        roots = solver.find_roots((0.5, 3.5))
+        
+        assert np.allclose(roots, [1, 2, 3], atol=1e-8)
+    
+    def test_all_real_roots(self):
+        """Raíces en toda la recta real, incluidas 0, ±1 y raíces grandes."""
+        exact = [-3e5, -1000, -1, 0, 0, 1, 2.5, 40, 1e4]
+        coeffs = np.polynomial.polynomial.polyfromroots(exact)
+        roots = find_all_real_roots(coeffs)
+        
+        assert np.allclose(roots, sorted(set(exact)), rtol=1e-9)
+    
+    def test_all_real_roots_matches_numpy(self):
+        """Coincide con las raíces reales de numpy.roots en polinomios aleatorios."""
+        rng = np.random.default_rng(1)
+        for degree in (10, 50):
+            coeffs = rng.standard_normal(degree + 1)
+            expected = np.roots(coeffs[::-1])
+            expected = np.sort(expected[np.abs(expected.imag) < 1e-9].real)
+            roots = find_all_real_roots(coeffs)
+            
+            assert len(roots) == len(expected)
+            assert np.allclose(roots, expected, rtol=1e-8)
+    
+    def test_all_real_roots_degenerate(self):
+        """Polinomios constantes y sin raíces reales."""
+        assert find_all_real_roots([3.0]) == []
+        assert find_all_real_roots([1, 0, 1]) == []
+        assert find_all_real_roots([0, 0, 2]) == [0.0]
+    
+    def test_unknown_backend(self):
+        """Test de backend desconocido."""
+        with pytest.raises(ValueError):
+            NewtonBernstein([1, 1], backend="float128")
+    
+    def test_unknown_strategy(self):
+        """Test de estrategia desconocida."""
+        with pytest.raises(ValueError):
+            NewtonBernstein([1, 1], strategy="newton")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+"""
+Tests para el seguimiento de raíces
+"""
+
+import pytest
+import numpy as np
+from numpy.polynomial import polynomial as P
+from src.newton_bernstein import find_roots
+from src.tracking import RootTracker
+
+
+class TestRootTracker:
+    
+    def test_smooth_sweep_reuses_cells(self):
+        """En un barrido suave todas las celdas se reutilizan."""
+        base = np.cos((2 * np.arange(8) + 1) * np.pi / 16) * 0.9
+        tracker = RootTracker((-1, 1))
+        
+        for t in np.linspace(0, 1, 20):
+            coeffs = P.polyfromroots(base + 0.01 * np.sin(t + np.arange(8)))
+            roots = tracker.update(coeffs)
+            assert np.allclose(roots, find_roots(coeffs, (-1, 1)), atol=1e-8)
+        
+        stats = tracker.get_statistics()
+        assert stats['num_reisolated'] == 1
+        assert stats['num_roots'] == 8
+    
+    def test_roots_appear_and_disappear(self):
+        """Raíces que se unen, desaparecen o entran en el intervalo."""
+        tracker = RootTracker((0, 4))
+        
+        for t in np.linspace(-1, 1, 21):
+            coeffs = P.polyfromroots([1, 2, 3]) + [t, 0, 0, 0]
+            roots = tracker.update(coeffs)
+            assert np.allclose(roots, find_roots(coeffs, (0, 4)), atol=1e-8)
+    
+    def test_interval_containing_origin(self):
+        """Una raíz que cruza el origen se sigue correctamente."""
+        tracker = RootTracker((-2, 2))
+        
+        for shift in np.linspace(-0.5, 0.5, 11):
+            roots = tracker.update(P.polyfromroots([shift, 1.5]))
+            assert np.allclose(roots, sorted([shift, 1.5]), atol=1e-8)
+    
+    def test_reset(self):
+        """Tras reset el siguiente paso se resuelve entero."""
+        tracker = RootTracker((0, 4))
+        tracker.update([-6, 11, -6, 1])
+        tracker.reset()
+        
+        assert tracker.roots == []
+        assert tracker.update([-6, 11, -6, 1]) == pytest.approx([1, 2, 3])
+        assert tracker.get_statistics()['num_reisolated'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,240 @@
+"""
+Tests para la interpolación univariada de Newton-Bernstein (python/)
+"""
+
+import sys
+from math import comb
+from pathlib import Path
+
+import pytest
+import numpy as np
+
+pytest.importorskip("scipy")
+pytest.importorskip("matplotlib")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+import nb_core  # noqa: E402
+from newton_bernstein_univariate import NewtonBernsteinUnivariate, NodePlan  # noqa: E402
+
+
+def reference_table(x, f):
+    """Tabla de diferencias divididas dd[k, s] = f[x_k, ..., x_{k+s}], elemento a elemento."""
+    n = len(x)
+    dd = np.zeros((n, n))
+    dd[:, 0] = f
+    for s in range(1, n):
+        for k in range(n - s):
+            dd[k, s] = (dd[k + 1, s - 1] - dd[k, s - 1]) / (x[k + s] - x[k])
+    return dd
+
+
+class TestDividedDifferences:
+    
+    @pytest.mark.parametrize("n", [1, 4, 11])
+    def test_matches_full_table(self, n):
+        """Test de la fila superior O(n) frente a la tabla completa."""
+        rng = np.random.default_rng(n)
+        x = rng.permutation(np.linspace(-1, 2, n + 1))
+        f = rng.standard_normal(n + 1)
+        ref = reference_table(x, f)
+        
+        solver = NewtonBernsteinUnivariate(x, f)
+        assert np.allclose(solver.compute_newton_coefficients(), ref[0])
+        assert np.allclose(solver._trailing_differences, ref[n - np.arange(n + 1), np.arange(n + 1)])
+        assert np.allclose(solver.compute_divided_differences(), ref)
+        assert np.allclose(nb_core.newton_coeffs(x, f), ref[0])
+        assert np.allclose(nb_core.divided_diffs(x, f), ref)
+    
+    def test_duplicate_nodes(self):
+        """Test del error con nodos duplicados."""
+        x = np.array([0.1, 0.4, 0.2, 0.9, 0.4])
+        f = np.ones(5)
+        
+        with pytest.raises(ValueError, match=r"x\[1\] = x\[4\]"):
+            NewtonBernsteinUnivariate(x, f).compute_newton_coefficients()
+        with pytest.raises(ValueError, match=r"x\[1\] = x\[4\]"):
+            NewtonBernsteinUnivariate(x, f).compute_divided_differences()
+        with pytest.raises(ValueError, match=r"x\[1\] = x\[4\]"):
+            nb_core.divided_diffs(x, f)
+        with pytest.raises(ValueError, match=r"x\[1\] = x\[4\]"):
+            nb_core.newton_coeffs(x, f)
+
+
+def reference_control_points(x, f):
+    """Puntos de control con la recurrencia escalar original, un j cada vez."""
+    n = len(x) - 1
+    dd = reference_table(x, f)[0]
+    c, w = np.zeros(n + 1), np.zeros(n + 1)
+    c[0], w[0] = dd[0], 1.0
+    for k in range(1, n + 1):
+        c_new, w_new = np.zeros(n + 1), np.zeros(n + 1)
+        for j in range(1, k + 1):
+            w_new[j] = (j / k) * w[j - 1] * (1 - x[k - 1]) - ((k - j) / k) * w[j] * x[k - 1]
+        w_new[0] = -w[0] * x[k - 1]
+        for j in range(1, k + 1):
+            c_new[j] = (j / k) * c[j - 1] + ((k - j) / k) * c[j]
+        c_new[0] = c[0]
+        c, w = c_new + w_new * dd[k], w_new
+    return c
+
+
+def power_to_bernstein(a):
+    """Coeficientes de Bernstein en [0, 1] de sum_i a_i x^i."""
+    n = len(a) - 1
+    return np.array([sum(comb(j, i) / comb(n, i) * a[i] for i in range(j + 1))
+                     for j in range(n + 1)])
+
+
+class TestDegreeRaising:
+    
+    @pytest.mark.parametrize("n", [1, 2, 5, 9, 14])
+    def test_matches_references(self, n):
+        """Test de la recurrencia vectorizada frente a la escalar y la base de potencias."""
+        rng = np.random.default_rng(n)
+        x = rng.permutation((np.arange(n + 1) + 1) / (n + 2))
+        a = rng.standard_normal(n + 1)
+        f = np.polynomial.polynomial.polyval(x, a)
+        expected = power_to_bernstein(a)
+        
+        c = NewtonBernsteinUnivariate(x, f).algorithm_newton_bernstein()
+        assert np.allclose(c, reference_control_points(x, f), rtol=1e-10, atol=1e-10)
+        assert np.allclose(c, expected, rtol=1e-7, atol=1e-7)
+        
+        c_core, _, _ = nb_core.newton_bernstein(x, f, full_table=False)
+        assert np.allclose(c_core, c, rtol=1e-10, atol=1e-10)
+        assert np.allclose(nb_core.degree_raising(x, nb_core.newton_coeffs(x, f)), c,
+                           rtol=1e-10, atol=1e-10)
+    
+    def test_core_reproduces_data(self):
+        """Test de que nb_core interpola los datos del ejemplo 2.1."""
+        x, cases = nb_core.example_2_1_data(n=15)
+        for _, f in cases:
+            c, _, _ = nb_core.newton_bernstein(x, f)
+            assert nb_core.interpolation_error(x, f, c)['max'] < 1e-6 * max(1, np.abs(f).max())
+
+
+class TestBatch:
+    
+    def test_batch_matches_per_column(self):
+        """Test de que el lote coincide con interpolar cada columna."""
+        rng = np.random.default_rng(1)
+        x_nodes = np.sort(rng.uniform(0.05, 0.95, 14))
+        F = rng.standard_normal((14, 5))
+        x_eval = np.linspace(0, 1, 23)
+        
+        batch = NewtonBernsteinUnivariate(x_nodes, F)
+        C = batch.algorithm_newton_bernstein()
+        values = batch.evaluate_bernstein(x_eval)
+        assert C.shape == (14, 5) and values.shape == (23, 5)
+        assert np.allclose(batch.evaluate_bernstein(x_nodes), F, atol=1e-8)
+        
+        for i in range(F.shape[1]):
+            single = NewtonBernsteinUnivariate(x_nodes, F[:, i])
+            c = single.algorithm_newton_bernstein()
+            assert np.allclose(C[:, i], c, rtol=1e-12, atol=1e-12)
+            assert np.allclose(values[:, i], single.evaluate_bernstein(x_eval))
+            assert np.allclose(values[:, i], single.evaluate_newton(x_eval))
+        
+        C_core = nb_core.newton_bernstein_batch(x_nodes, F)
+        for i in range(F.shape[1]):
+            c, _, _ = nb_core.newton_bernstein(x_nodes, F[:, i], full_table=False)
+            assert np.allclose(C_core[:, i], c, rtol=1e-12, atol=1e-12)
+    
+    def test_run_batch_matches_newton_bernstein(self):
+        """Test de que run_batch devuelve lo mismo que newton_bernstein en ambos modos."""
+        x, cases = nb_core.example_2_1_data(n=15)
+        results = nb_core.run_batch(x, cases, verbose=False)
+        cheap = nb_core.run_batch(x, cases, verbose=False, full_table=False)
+        
+        for label, f in cases:
+            c, dd, info = nb_core.newton_bernstein(x, f)
+            assert np.allclose(results[label]['c'], c)
+            assert np.allclose(results[label]['dd'], dd)
+            assert results[label]['info'].keys() == info.keys()
+            assert np.isclose(results[label]['info']['condition_number'], info['condition_number'])
+            
+            c, top, info = nb_core.newton_bernstein(x, f, full_table=False)
+            assert np.allclose(cheap[label]['c'], c)
+            assert np.allclose(cheap[label]['dd'], top)
+            assert cheap[label]['info'].keys() == info.keys()
+
+
+class TestAddNode:
+    
+    @pytest.mark.parametrize("shape", [(), (3,)])
+    def test_matches_full_recompute(self, shape):
+        """Test de que la inserción incremental coincide con recalcular."""
+        rng = np.random.default_rng(7)
+        x = rng.permutation(np.linspace(0.05, 0.95, 12))
+        f = rng.standard_normal((12,) + shape)
+        
+        solver = NewtonBernsteinUnivariate(x[:6], f[:6])
+        solver.algorithm_newton_bernstein()
+        for k in range(6, 12):
+            c = solver.add_node(x[k], f[k])
+            full = NewtonBernsteinUnivariate(x[:k + 1], f[:k + 1])
+            assert np.allclose(c, full.algorithm_newton_bernstein(), rtol=1e-9, atol=1e-9)
+            assert np.allclose(solver.newton_coefficients, full.newton_coefficients)
+            assert np.allclose(solver.evaluate_bernstein(x[:k + 1]), f[:k + 1], atol=1e-8)
+    
+    def test_invalid_node_or_data(self):
+        """Test de los errores de add_node."""
+        x = np.linspace(0.1, 0.9, 5)
+        batch = NewtonBernsteinUnivariate(x, np.ones((5, 3)))
+        with pytest.raises(ValueError, match="f_new"):
+            batch.add_node(0.5, 1.0)
+        with pytest.raises(ValueError, match="f_new"):
+            NewtonBernsteinUnivariate(x, np.ones(5)).add_node(0.5, [1.0, 2.0])
+        with pytest.raises(ValueError, match="duplicados"):
+            batch.add_node(x[2], np.ones(3))
+        assert batch.n == 4 and len(batch.f_values) == 5
+
+
+class TestNodePlan:
+    
+    @pytest.mark.parametrize("x_nodes", [
+        np.linspace(0.1, 0.9, 12),
+        np.linspace(-3.0, 5.0, 9),
+        np.array([0.0, 0.05, 0.3, 0.31, 0.7, 1.0]),
+    ])
+    def test_evaluate_at_nodes_reproduces_data(self, x_nodes):
+        """Test de que el interpolante del plan pasa por los datos."""
+        rng = np.random.default_rng(0)
+        plan = NodePlan(x_nodes)
+        f = rng.standard_normal(len(x_nodes))
+        F = rng.standard_normal((len(x_nodes), 4))
+        
+        assert np.allclose(plan.evaluate(plan.interpolate(f), x_nodes), f, atol=1e-10)
+        assert np.allclose(plan.evaluate(plan.interpolate(F), x_nodes), F, atol=1e-10)
+        
+        c = plan.update(plan.interpolate(f), 2, 0.5)
+        f[2] += 0.5
+        assert np.allclose(plan.evaluate(c, x_nodes), f, atol=1e-10)
+    
+    @pytest.mark.parametrize("x_nodes", [
+        np.linspace(0.2, 2.0, 7),
+        np.linspace(-3.0, 5.0, 9),
+        np.array([0.3, 0.45, 0.5, 0.62, 0.8]),
+    ])
+    def test_matches_class_control_points(self, x_nodes):
+        """Test de que el plan usa la misma variable que NewtonBernsteinUnivariate."""
+        rng = np.random.default_rng(3)
+        plan = NodePlan(x_nodes)
+        F = rng.standard_normal((len(x_nodes), 3))
+        x_eval = np.linspace(x_nodes.min(), x_nodes.max(), 17)
+        
+        solver = NewtonBernsteinUnivariate(x_nodes, F)
+        c = solver.algorithm_newton_bernstein()
+        assert np.allclose(plan.interpolate(F), c, rtol=1e-10, atol=1e-10)
+        assert np.allclose(plan.evaluate(c, x_eval), solver.evaluate_bernstein(x_eval))
+    
+    def test_matches_polynomial_off_nodes(self):
+        """Test de evaluación fuera de los nodos con datos polinómicos."""
+        x_nodes = np.linspace(0.2, 2.0, 7)
+        plan = NodePlan(x_nodes)
+        poly = np.polynomial.Polynomial([1.0, -2.0, 0.5, 3.0])
+        x_eval = np.linspace(0.2, 2.0, 31)
+        
+        values = plan.evaluate(plan.interpolate(poly(x_nodes)), x_eval)
+        assert np.allclose(values, poly(x_eval), atol=1e-10)
@@ -7,7 +7,9 @@ import numpy as np
 from src.utils import (
     sign_changes, interval_width, newton_step, newton_raphson,
     is_in_interval, merge_close_roots, polynomial_from_coeffs,
-    polynomial_derivative_coeffs, evaluate_polynomial_error
+    polynomial_derivative_coeffs, evaluate_polynomial_error,
+    horner_with_derivative, polynomial_with_derivative, newton_raphson_fused,
+    newton_raphson_batch, root_bound
 )
 
 
@@ -26,6 +28,10 @@ class TestUtils:
         
         # Con ceros (se ignoran)
         assert sign_changes(np.array([1, 0, -1])) == 1
+        
+        # Por filas
+        rows = np.array([[1, 2, 3], [1, -1, 2], [0, 1, -1], [1, 0, 0]])
+        assert list(sign_changes(rows)) == [0, 2, 1, 0]
     
     def test_interval_width(self):
         """Test de cálculo de ancho de intervalo."""
@@ -56,6 +62,34 @@ class TestUtils:
         assert converged
         assert np.isclose(root, 2.0, atol=1e-8)
     
+    def test_newton_raphson_batch(self):
+        """Test de Newton vectorizado sobre varios intervalos a la vez."""
+        # p(x) = (x-1)(x-2)(x-3) = x³ - 6x² + 11x - 6
+        coeffs = np.array([-6, 11, -6, 1])
+        lo = np.array([0.5, 1.5, 2.5, 1.2])
+        hi = np.array([1.5, 2.5, 4.0, 1.8])
+        
+        roots, converged = newton_raphson_batch(coeffs, lo, hi)
+        
+        # El último intervalo no encierra ninguna raíz
+        assert list(converged) == [True, True, True, False]
+        assert np.allclose(roots[:3], [1.0, 2.0, 3.0], atol=1e-10)
+    
+    def test_newton_raphson_batch_warm_start(self):
+        """Una aproximación inicial cercana reduce las iteraciones."""
+        coeffs = np.array([-6, 11, -6, 1])
+        lo, hi = np.array([0.2, 2.5]), np.array([1.5, 4.0])
+        cold = np.zeros(2, dtype=int)
+        warm = np.zeros(2, dtype=int)
+        
+        newton_raphson_batch(coeffs, lo, hi, iterations=cold)
+        roots, converged = newton_raphson_batch(coeffs, lo, hi, iterations=warm,
+                                                x0=np.array([1.0001, 5.0]))
+        
+        assert converged.all()
+        assert np.allclose(roots, [1.0, 3.0], atol=1e-10)
+        assert warm[0] < cold[0]
+    
     def test_is_in_interval(self):
         """Test de verificación si un punto está en un intervalo."""
         assert is_in_interval(1.5, (1, 2))
@@ -86,6 +120,32 @@ class TestUtils:
         assert p(1) == 6
         assert p(2) == 17
     
+    def test_horner_with_derivative(self):
+        """Test de evaluación conjunta de p y p' sobre arrays."""
+        # p(x) = 1 + 2x + 3x², p'(x) = 2 + 6x
+        coeffs = np.array([1, 2, 3])
+        x = np.array([0.0, 1.0, 2.0])
+        
+        p, dp = horner_with_derivative(coeffs, x)
+        
+        assert np.allclose(p, [1, 6, 17])
+        assert np.allclose(dp, [2, 8, 14])
+        
+        # Escalares y arrays dan el mismo resultado
+        fdf = polynomial_with_derivative(coeffs)
+        assert fdf(2.0) == (17.0, 14.0)
+        assert np.allclose(fdf(x)[0], p)
+    
+    def test_newton_raphson_fused(self):
+        """Test de Newton-Raphson con evaluación conjunta."""
+        # f(x) = x² - 4, raíz en x = 2
+        fdf = polynomial_with_derivative(np.array([-4, 0, 1]))
+        
+        root, converged = newton_raphson_fused(fdf, 3.0)
+        
+        assert converged
+        assert np.isclose(root, 2.0, atol=1e-8)
+    
     def test_polynomial_derivative_coeffs(self):
         """Test de cálculo de coeficientes de la derivada."""
         # p(x) = 1 + 2x + 3x²
@@ -109,6 +169,17 @@ class TestUtils:
         # En x = 3, el error debe ser 1
         error = evaluate_polynomial_error(coeffs, 3.0)
         assert np.isclose(error, 1.0, atol=1e-10)
+    
+    def test_root_bound(self):
+        """La cota acota el módulo de todas las raíces."""
+        rng = np.random.default_rng(0)
+        for degree in (1, 5, 20):
+            coeffs = rng.standard_normal(degree + 1)
+            roots = np.roots(coeffs[::-1])
+            assert np.abs(roots).max() <= root_bound(coeffs)
+        
+        # (x - 100)(x + 1): la cota de Fujiwara es ajustada
+        assert 100 <= root_bound([-100, -99, 1]) <= 200
 
 
 if __name__ == "__main__":